@@ -33,14 +33,6 @@ target_metadata = BaseModel.metadata
 # ... etc.
 
 
-# Ignore specific models when running migrations
-def include_object(object, name, type_, reflected, compare_to):
-    if type_ == "table" and name in [SiblingRom.__tablename__]:  # Virtual table
-        return False
-
-    return True
-
-
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -61,7 +53,6 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
-        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -84,7 +75,6 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             render_as_batch=True,
             compare_type=True,
-            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,28 @@
+"""empty message
+
+Revision ID: 0027_roms_file_name_no_tags_index
+Revises: 0026_romuser_status_fields
+Create Date: 2024-09-02 10:12:31.481203
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0027_roms_file_name_no_tags_index"
+down_revision = "0026_romuser_status_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_roms_platform_id_file_name_no_tags",
+            ["platform_id", "file_name_no_tags"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_index("idx_roms_platform_id_file_name_no_tags")
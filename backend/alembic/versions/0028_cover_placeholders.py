@@ -0,0 +1,40 @@
+"""empty message
+
+Revision ID: 0028_cover_placeholders
+Revises: 0027_roms_file_name_no_tags_index
+Create Date: 2024-09-04 18:22:10.146930
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0028_cover_placeholders"
+down_revision = "0027_roms_file_name_no_tags_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("cover_placeholder", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("cover_color", sa.String(length=7), nullable=True)
+        )
+
+    with op.batch_alter_table("collections", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("cover_placeholder", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("cover_color", sa.String(length=7), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("collections", schema=None) as batch_op:
+        batch_op.drop_column("cover_color")
+        batch_op.drop_column("cover_placeholder")
+
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_column("cover_color")
+        batch_op.drop_column("cover_placeholder")
@@ -0,0 +1,39 @@
+"""empty message
+
+Revision ID: 0029_roms_sort_name
+Revises: 0028_cover_placeholders
+Create Date: 2024-09-06 11:47:52.618204
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0029_roms_sort_name"
+down_revision = "0028_cover_placeholders"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "sort_name",
+                sa.String(length=350),
+                sa.Computed("lower(`name`)", persisted=True),
+                nullable=True,
+            )
+        )
+        batch_op.create_index("idx_roms_sort_name", ["sort_name", "id"])
+        batch_op.create_index(
+            "idx_roms_platform_id_sort_name", ["platform_id", "sort_name", "id"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_index("idx_roms_platform_id_sort_name")
+        batch_op.drop_index("idx_roms_sort_name")
+        batch_op.drop_column("sort_name")
@@ -0,0 +1,42 @@
+"""empty message
+
+Revision ID: 0030_roms_search_text
+Revises: 0029_roms_sort_name
+Create Date: 2024-09-09 10:15:31.482077
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0030_roms_search_text"
+down_revision = "0029_roms_sort_name"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "search_text",
+                sa.Text(),
+                sa.Computed(
+                    "concat_ws(' ', `name`, `file_name`, "
+                    "json_extract(`igdb_metadata`, '$.alternative_names'), "
+                    "json_extract(`moby_metadata`, '$.alternate_titles'))",
+                    persisted=True,
+                ),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            "idx_roms_search_text", ["search_text"], mysql_prefix="FULLTEXT"
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_index("idx_roms_search_text")
+        batch_op.drop_column("search_text")
@@ -0,0 +1,103 @@
+"""empty message
+
+Revision ID: 0031_collection_roms
+Revises: 0030_roms_search_text
+Create Date: 2024-09-11 19:02:44.571903
+
+"""
+
+import json
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0031_collection_roms"
+down_revision = "0030_roms_search_text"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_roms",
+        sa.Column("collection_id", sa.Integer(), nullable=False),
+        sa.Column("rom_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["collection_id"], ["collections.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["rom_id"], ["roms.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("collection_id", "rom_id"),
+    )
+    with op.batch_alter_table("collection_roms", schema=None) as batch_op:
+        batch_op.create_index("idx_collection_roms_rom_id", ["rom_id"])
+
+    # Move the rom ids of each collection to the new table, skipping the ids of
+    # roms deleted since they were added
+    connection = op.get_bind()
+    rom_ids = {
+        row.id for row in connection.execute(sa.text("SELECT id FROM roms")).all()
+    }
+    collections = connection.execute(
+        sa.text("SELECT id, roms FROM collections")
+    ).fetchall()
+    for collection in collections:
+        try:
+            collection_rom_ids = set(json.loads(collection.roms or "[]"))
+        except (json.JSONDecodeError, TypeError):
+            print(f"ERROR:\t  Invalid roms for collection {collection.id}, skipping")
+            continue
+
+        rows = [
+            {"collection_id": collection.id, "rom_id": rom_id}
+            for rom_id in collection_rom_ids & rom_ids
+        ]
+        if rows:
+            connection.execute(
+                sa.text(
+                    "INSERT INTO collection_roms (collection_id, rom_id) VALUES (:collection_id, :rom_id)"
+                ),
+                rows,
+            )
+
+    with op.batch_alter_table("collections", schema=None) as batch_op:
+        batch_op.drop_column("roms")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("collections", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("roms", sa.JSON(), nullable=True))
+
+    connection = op.get_bind()
+    collection_roms: dict[int, list[int]] = {}
+    for row in connection.execute(
+        sa.text("SELECT collection_id, rom_id FROM collection_roms")
+    ).all():
+        collection_roms.setdefault(row.collection_id, []).append(row.rom_id)
+
+    collections = connection.execute(sa.text("SELECT id FROM collections")).fetchall()
+    for collection in collections:
+        connection.execute(
+            sa.text("UPDATE collections SET roms = :roms WHERE id = :id"),
+            {
+                "roms": json.dumps(collection_roms.get(collection.id, [])),
+                "id": collection.id,
+            },
+        )
+
+    with op.batch_alter_table("collections", schema=None) as batch_op:
+        batch_op.alter_column("roms", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_table("collection_roms")
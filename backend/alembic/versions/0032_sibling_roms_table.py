@@ -0,0 +1,102 @@
+"""empty message
+
+Revision ID: 0032_sibling_roms_table
+Revises: 0031_collection_roms
+Create Date: 2024-09-13 16:40:12.930415
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0032_sibling_roms_table"
+down_revision = "0031_collection_roms"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    connection.execute(sa.text("DROP VIEW IF EXISTS sibling_roms"))
+
+    op.create_table(
+        "sibling_roms",
+        sa.Column("rom_id", sa.Integer(), nullable=False),
+        sa.Column("sibling_rom_id", sa.Integer(), nullable=False),
+        sa.Column("platform_id", sa.Integer(), nullable=False),
+        sa.Column("igdb_id", sa.Integer(), nullable=True),
+        sa.Column("moby_id", sa.Integer(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["rom_id"], ["roms.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["sibling_rom_id"], ["roms.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("rom_id", "sibling_rom_id"),
+    )
+    with op.batch_alter_table("sibling_roms", schema=None) as batch_op:
+        batch_op.create_index("idx_sibling_roms_sibling_rom_id", ["sibling_rom_id"])
+
+    connection.execute(
+        sa.text("""
+            INSERT INTO sibling_roms (rom_id, sibling_rom_id, platform_id, igdb_id, moby_id)
+            SELECT
+                r1.id,
+                r2.id,
+                r1.platform_id,
+                CASE WHEN r1.igdb_id <=> r2.igdb_id THEN r1.igdb_id END,
+                CASE WHEN r1.moby_id <=> r2.moby_id THEN r1.moby_id END
+            FROM
+                roms r1
+            JOIN
+                roms r2
+            ON
+                r1.platform_id = r2.platform_id
+                AND r1.id != r2.id
+                AND (
+                    (r1.igdb_id = r2.igdb_id AND r1.igdb_id IS NOT NULL)
+                    OR
+                    (r1.moby_id = r2.moby_id AND r1.moby_id IS NOT NULL)
+                );
+            """),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sibling_roms")
+
+    connection = op.get_bind()
+    connection.execute(
+        sa.text("""
+            CREATE VIEW sibling_roms AS
+            SELECT
+                r1.id AS rom_id,
+                r2.id AS sibling_rom_id,
+                r1.platform_id AS platform_id,
+                NOW() AS created_at,
+                NOW() AS updated_at,
+                CASE WHEN r1.igdb_id <=> r2.igdb_id THEN r1.igdb_id END AS igdb_id,
+                CASE WHEN r1.moby_id <=> r2.moby_id THEN r1.moby_id END AS moby_id
+            FROM
+                roms r1
+            JOIN
+                roms r2
+            ON
+                r1.platform_id = r2.platform_id
+                AND r1.id != r2.id
+                AND (
+                    (r1.igdb_id = r2.igdb_id AND r1.igdb_id IS NOT NULL AND r1.igdb_id != '')
+                    OR
+                    (r1.moby_id = r2.moby_id AND r1.moby_id IS NOT NULL AND r1.moby_id != '')
+                );
+            """),
+    )
@@ -0,0 +1,64 @@
+"""empty message
+
+Revision ID: 0033_platform_rom_counters
+Revises: 0032_sibling_roms_table
+Create Date: 2024-09-16 09:27:05.318642
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0033_platform_rom_counters"
+down_revision = "0032_sibling_roms_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("platforms", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("rom_count", sa.Integer(), server_default="0", nullable=False)
+        )
+        batch_op.add_column(
+            sa.Column(
+                "identified_rom_count",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "total_file_size_bytes",
+                sa.BigInteger(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+    connection = op.get_bind()
+    connection.execute(sa.text("""
+            UPDATE platforms p
+            JOIN (
+                SELECT
+                    platform_id,
+                    COUNT(*) AS rom_count,
+                    COUNT(CASE WHEN igdb_id IS NOT NULL OR moby_id IS NOT NULL THEN 1 END) AS identified_rom_count,
+                    COALESCE(SUM(file_size_bytes), 0) AS total_file_size_bytes
+                FROM roms
+                GROUP BY platform_id
+            ) r ON r.platform_id = p.id
+            SET
+                p.rom_count = r.rom_count,
+                p.identified_rom_count = r.identified_rom_count,
+                p.total_file_size_bytes = r.total_file_size_bytes;
+            """))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("platforms", schema=None) as batch_op:
+        batch_op.drop_column("total_file_size_bytes")
+        batch_op.drop_column("identified_rom_count")
+        batch_op.drop_column("rom_count")
@@ -0,0 +1,38 @@
+"""empty message
+
+Revision ID: 0034_roms_sort_comparator
+Revises: 0033_platform_rom_counters
+Create Date: 2024-09-18 10:41:12.803519
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0034_roms_sort_comparator"
+down_revision = "0033_platform_rom_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "sort_comparator",
+                sa.String(length=450),
+                sa.Computed(
+                    "lower(trim(regexp_replace("
+                    "coalesce(nullif(`name`, ''), `file_name_no_tags`), "
+                    "'^([Tt]he|[Aa]|[Aa]nd)[[:space:]]', '')))",
+                    persisted=True,
+                ),
+                nullable=True,
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_column("sort_comparator")
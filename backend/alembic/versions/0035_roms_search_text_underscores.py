@@ -0,0 +1,52 @@
+"""empty message
+
+Revision ID: 0035_roms_search_text_underscores
+Revises: 0034_roms_sort_comparator
+Create Date: 2024-09-20 09:12:47.316504
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0035_roms_search_text_underscores"
+down_revision = "0034_roms_sort_comparator"
+branch_labels = None
+depends_on = None
+
+
+def _replace_search_text(expression: str) -> None:
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.drop_index("idx_roms_search_text")
+        batch_op.drop_column("search_text")
+
+    with op.batch_alter_table("roms", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "search_text",
+                sa.Text(),
+                sa.Computed(expression, persisted=True),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            "idx_roms_search_text", ["search_text"], mysql_prefix="FULLTEXT"
+        )
+
+
+def upgrade() -> None:
+    # Underscores are word characters for the FULLTEXT parser, index them as spaces
+    _replace_search_text(
+        "replace(concat_ws(' ', `name`, `file_name`, "
+        "json_extract(`igdb_metadata`, '$.alternative_names'), "
+        "json_extract(`moby_metadata`, '$.alternate_titles')), '_', ' ')"
+    )
+
+
+def downgrade() -> None:
+    _replace_search_text(
+        "concat_ws(' ', `name`, `file_name`, "
+        "json_extract(`igdb_metadata`, '$.alternative_names'), "
+        "json_extract(`moby_metadata`, '$.alternate_titles'))"
+    )
@@ -22,8 +22,10 @@ GUNICORN_WORKERS: Final = int(os.environ.get("GUNICORN_WORKERS", 2))
 ROMM_BASE_PATH: Final = os.environ.get("ROMM_BASE_PATH", "/romm")
 LIBRARY_BASE_PATH: Final = f"{ROMM_BASE_PATH}/library"
 RESOURCES_BASE_PATH: Final = f"{ROMM_BASE_PATH}/resources"
+RESOURCES_STORE_PATH: Final = f"{RESOURCES_BASE_PATH}/store"
 ASSETS_BASE_PATH: Final = f"{ROMM_BASE_PATH}/assets"
 FRONTEND_RESOURCES_PATH: Final = "/assets/romm/resources"
+IMAGE_VARIANTS_CACHE_PATH: Final = f"{ROMM_BASE_PATH}/cache/image_variants"
 
 # MARIADB
 DB_HOST: Final = os.environ.get("DB_HOST", "127.0.0.1")
@@ -62,6 +64,19 @@ STEAMGRIDDB_API_KEY: Final = os.environ.get("STEAMGRIDDB_API_KEY", "")
 # MOBYGAMES
 MOBYGAMES_API_KEY: Final = os.environ.get("MOBYGAMES_API_KEY", "")
 
+# HTTP CLIENT
+HTTP_MAX_CONNECTIONS: Final = int(os.environ.get("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_CONNECTIONS_PER_HOST: Final = int(
+    os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 10)
+)
+HTTP_MAX_KEEPALIVE_CONNECTIONS: Final = int(
+    os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20)
+)
+HTTP_KEEPALIVE_EXPIRY: Final = float(
+    os.environ.get("HTTP_KEEPALIVE_EXPIRY", 60)  # 60 seconds
+)
+HTTP_ENABLE_HTTP2: Final = str_to_bool(os.environ.get("HTTP_ENABLE_HTTP2", "false"))
+
 # DB DRIVERS
 ROMM_DB_DRIVER: Final = os.environ.get("ROMM_DB_DRIVER", "mariadb")
 
@@ -76,6 +91,11 @@ DISABLE_DOWNLOAD_ENDPOINT_AUTH = str_to_bool(
     os.environ.get("DISABLE_DOWNLOAD_ENDPOINT_AUTH", "false")
 )
 
+# RESOURCES
+IMAGE_VARIANTS_CACHE_MAX_SIZE_MB: Final = int(
+    os.environ.get("IMAGE_VARIANTS_CACHE_MAX_SIZE_MB", 512)
+)
+
 # SCANS
 SCAN_TIMEOUT: Final = int(os.environ.get("SCAN_TIMEOUT", 60 * 60 * 4))  # 4 hours
 
@@ -100,6 +120,13 @@ SCHEDULED_UPDATE_SWITCH_TITLEDB_CRON: Final = os.environ.get(
     "SCHEDULED_UPDATE_SWITCH_TITLEDB_CRON",
     "0 4 * * *",  # At 4:00 AM every day
 )
+ENABLE_SCHEDULED_RECONCILE_PLATFORM_COUNTERS: Final = str_to_bool(
+    os.environ.get("ENABLE_SCHEDULED_RECONCILE_PLATFORM_COUNTERS", "true")
+)
+SCHEDULED_RECONCILE_PLATFORM_COUNTERS_CRON: Final = os.environ.get(
+    "SCHEDULED_RECONCILE_PLATFORM_COUNTERS_CRON",
+    "0 5 * * *",  # At 5:00 AM every day
+)
 
 # EMULATION
 DISABLE_EMULATOR_JS = str_to_bool(os.environ.get("DISABLE_EMULATOR_JS", "false"))
@@ -1,8 +1,7 @@
 import json
-from io import BytesIO
 from shutil import rmtree
+from typing import Any
 
-from anyio import Path
 from config import RESOURCES_BASE_PATH
 from decorators.auth import protected_route
 from endpoints.responses import MessageResponse
@@ -12,20 +11,31 @@ from exceptions.endpoint_exceptions import (
     CollectionNotFoundInDatabaseException,
     CollectionPermissionError,
 )
-from fastapi import Request, UploadFile
+from fastapi import HTTPException, Request, UploadFile, status
 from handler.auth.base_handler import Scope
 from handler.database import db_collection_handler
 from handler.filesystem import fs_resource_handler
 from handler.filesystem.base_handler import CoverSize
 from logger.logger import log
 from models.collection import Collection
-from PIL import Image
 from sqlalchemy.inspection import inspect
 from utils.router import APIRouter
 
 router = APIRouter()
 
 
+def _validate_rom_ids(rom_ids: Any) -> list[int]:
+    if not isinstance(rom_ids, list) or not all(
+        isinstance(rom_id, int) and not isinstance(rom_id, bool) for rom_id in rom_ids
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The roms field must be a list of rom ids",
+        )
+
+    return rom_ids
+
+
 @protected_route(router.post, "/collections", [Scope.COLLECTIONS_WRITE])
 async def add_collection(
     request: Request,
@@ -59,20 +69,13 @@ async def add_collection(
 
     if artwork is not None:
         file_ext = artwork.filename.split(".")[-1]
-        (
-            path_cover_l,
-            path_cover_s,
-            artwork_path,
-        ) = await fs_resource_handler.build_artwork_path(_added_collection, file_ext)
-
-        artwork_content = BytesIO(await artwork.read())
-        file_location_small = Path(f"{artwork_path}/small.{file_ext}")
-        file_location_large = Path(f"{artwork_path}/big.{file_ext}")
-        with Image.open(artwork_content) as img:
-            img.save(file_location_large)
-            fs_resource_handler.resize_cover_to_small(
-                img, save_path=file_location_small
-            )
+        _, _, artwork_path = await fs_resource_handler.build_artwork_path(
+            _added_collection, file_ext
+        )
+
+        path_cover_s, path_cover_l = await fs_resource_handler.store_cover_content(
+            artwork_path, await artwork.read(), file_ext
+        )
     else:
         path_cover_s, path_cover_l = await fs_resource_handler.get_cover(
             overwrite=True,
@@ -82,6 +85,9 @@ async def add_collection(
 
     _added_collection.path_cover_s = path_cover_s
     _added_collection.path_cover_l = path_cover_l
+    cover_placeholder = await fs_resource_handler.get_cover_placeholder(path_cover_s)
+    _added_collection.cover_placeholder = cover_placeholder["cover_placeholder"]
+    _added_collection.cover_color = cover_placeholder["cover_color"]
     # Update the collection with the cover path and update database
     return db_collection_handler.update_collection(
         _added_collection.id,
@@ -155,18 +161,20 @@ async def update_collection(
     if not collection:
         raise CollectionNotFoundInDatabaseException(id)
 
-    try:
-        roms = json.loads(data["roms"])
-    except json.JSONDecodeError as e:
-        raise ValueError("Invalid list for roms field in update collection") from e
-    except KeyError:
-        roms = collection.roms
+    roms: list[int] | None = None
+    if "roms" in data:
+        try:
+            roms = _validate_rom_ids(json.loads(data["roms"]))  # type: ignore[arg-type]
+        except (json.JSONDecodeError, TypeError) as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="The roms field must be a list of rom ids",
+            ) from exc
 
     cleaned_data = {
         "name": data.get("name", collection.name),
         "description": data.get("description", collection.description),
         "is_public": is_public if is_public is not None else collection.is_public,
-        "roms": list(set(roms)),
         "user_id": request.user.id,
     }
 
@@ -176,23 +184,19 @@ async def update_collection(
     else:
         if artwork is not None:
             file_ext = artwork.filename.split(".")[-1]
-            (
-                path_cover_l,
-                path_cover_s,
-                artwork_path,
-            ) = await fs_resource_handler.build_artwork_path(collection, file_ext)
+            _, _, artwork_path = await fs_resource_handler.build_artwork_path(
+                collection, file_ext
+            )
+
+            path_cover_s, path_cover_l = await fs_resource_handler.store_cover_content(
+                artwork_path, await artwork.read(), file_ext
+            )
 
             cleaned_data["path_cover_l"] = path_cover_l
             cleaned_data["path_cover_s"] = path_cover_s
-
-            artwork_content = BytesIO(await artwork.read())
-            file_location_small = Path(f"{artwork_path}/small.{file_ext}")
-            file_location_large = Path(f"{artwork_path}/big.{file_ext}")
-            with Image.open(artwork_content) as img:
-                img.save(file_location_large)
-                fs_resource_handler.resize_cover_to_small(
-                    img, save_path=file_location_small
-                )
+            cleaned_data.update(
+                await fs_resource_handler.get_cover_placeholder(path_cover_s)
+            )
 
             cleaned_data.update({"url_cover": ""})
         else:
@@ -210,8 +214,67 @@ async def update_collection(
                 cleaned_data.update(
                     {"path_cover_s": path_cover_s, "path_cover_l": path_cover_l}
                 )
+                cleaned_data.update(
+                    await fs_resource_handler.get_cover_placeholder(path_cover_s)
+                )
+
+    return db_collection_handler.update_collection(id, cleaned_data, rom_ids=roms)
+
+
+@protected_route(router.post, "/collections/{id}/roms", [Scope.COLLECTIONS_WRITE])
+async def add_collection_roms(request: Request, id: int) -> CollectionSchema:
+    """Add roms to a collection endpoint
+
+    Args:
+        request (Request): Fastapi Request object
+        {
+            "roms": List of rom's ids to add
+        }
+
+    Returns:
+        CollectionSchema: Updated collection
+    """
+
+    data = await request.json()
+    collection = db_collection_handler.get_collection(id)
+
+    if not collection:
+        raise CollectionNotFoundInDatabaseException(id)
+
+    if collection.user_id != request.user.id:
+        raise CollectionPermissionError(id)
+
+    rom_ids = _validate_rom_ids(data.get("roms") if isinstance(data, dict) else None)
+    return db_collection_handler.add_collection_roms(id, rom_ids)
+
+
+@protected_route(
+    router.post, "/collections/{id}/roms/delete", [Scope.COLLECTIONS_WRITE]
+)
+async def remove_collection_roms(request: Request, id: int) -> CollectionSchema:
+    """Remove roms from a collection endpoint
+
+    Args:
+        request (Request): Fastapi Request object
+        {
+            "roms": List of rom's ids to remove
+        }
+
+    Returns:
+        CollectionSchema: Updated collection
+    """
+
+    data = await request.json()
+    collection = db_collection_handler.get_collection(id)
+
+    if not collection:
+        raise CollectionNotFoundInDatabaseException(id)
+
+    if collection.user_id != request.user.id:
+        raise CollectionPermissionError(id)
 
-    return db_collection_handler.update_collection(id, cleaned_data)
+    rom_ids = _validate_rom_ids(data.get("roms") if isinstance(data, dict) else None)
+    return db_collection_handler.remove_collection_roms(id, rom_ids)
 
 
 @protected_route(router.delete, "/collections/{id}", [Scope.COLLECTIONS_WRITE])
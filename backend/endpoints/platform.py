@@ -79,6 +79,8 @@ def get_supported_platforms(request: Request) -> list[PlatformSchema]:
             "logo_path": "",
             "roms": [],
             "rom_count": 0,
+            "identified_rom_count": 0,
+            "total_file_size_bytes": 0,
             "created_at": now,
             "updated_at": now,
         }
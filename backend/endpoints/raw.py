@@ -26,4 +26,9 @@ def get_raw_asset(request: Request, path: str):
     """
 
     asset_path = f"{ASSETS_BASE_PATH}/{path}"
-    return FileResponse(path=asset_path, filename=path.split("/")[-1])
+    headers = {}
+    # Versioned URLs (see `BaseAsset.download_path`) change along with the file
+    if request.query_params.get("v"):
+        headers["Cache-Control"] = "private, max-age=31536000, immutable"
+
+    return FileResponse(path=asset_path, filename=path.split("/")[-1], headers=headers)
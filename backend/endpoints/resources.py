@@ -0,0 +1,50 @@
+from decorators.auth import protected_route
+from exceptions.endpoint_exceptions import ResourceNotFoundException
+from fastapi import Query, Request
+from fastapi.responses import FileResponse
+from handler.auth.base_handler import Scope
+from handler.filesystem import fs_resource_handler
+from handler.filesystem.base_handler import ImageVariantFormat
+from utils.router import APIRouter
+
+router = APIRouter()
+
+
+@protected_route(router.get, "/resources/{path:path}", [Scope.ROMS_READ])
+async def get_resource_image(
+    request: Request,
+    path: str,
+    width: int | None = Query(default=None, gt=0, le=4096),
+    format: ImageVariantFormat = ImageVariantFormat.WEBP,
+) -> FileResponse:
+    """Get a resized variant of a cover, screenshot or collection artwork
+
+    Args:
+        request (Request): Fastapi Request object
+        path (str): Path of the image, relative to the resources folder
+        width (int, optional): Requested width, rounded up to a supported width. Defaults to the largest supported width.
+        format (ImageVariantFormat, optional): Image format. AVIF falls back to WebP when unsupported. Defaults to WebP.
+
+    Returns:
+        FileResponse: Resized image
+    """
+
+    image_format = fs_resource_handler.get_image_variant_format(format)
+    variant_path = await fs_resource_handler.get_image_variant(
+        path, width, image_format
+    )
+    if not variant_path:
+        raise ResourceNotFoundException(path)
+
+    # Variants of versioned resources never change, as their source can't either
+    cache_control = (
+        "private, max-age=31536000, immutable"
+        if fs_resource_handler.is_versioned_resource(path)
+        else "private, max-age=86400"
+    )
+
+    return FileResponse(
+        path=variant_path,
+        media_type=f"image/{image_format.value}",
+        headers={"Cache-Control": cache_control},
+    )
@@ -10,6 +10,8 @@ class CollectionSchema(BaseModel):
     description: str
     path_cover_l: str | None
     path_cover_s: str | None
+    cover_placeholder: str | None
+    cover_color: str | None
     has_cover: bool
     url_cover: str
     roms: set[int]
@@ -11,6 +11,8 @@ class PlatformSchema(BaseModel):
     fs_slug: str
     name: str
     rom_count: int
+    identified_rom_count: int
+    total_file_size_bytes: int
     igdb_id: int | None = None
     sgdb_id: int | None = None
     moby_id: int | None = None
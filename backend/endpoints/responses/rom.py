@@ -1,18 +1,37 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import NotRequired, TypedDict, get_type_hints
+from typing import Any, Final, NotRequired, TypedDict, get_type_hints
 
 from endpoints.responses.assets import SaveSchema, ScreenshotSchema, StateSchema
 from endpoints.responses.collection import CollectionSchema
 from fastapi import Request
 from handler.metadata.igdb_handler import IGDBMetadata
 from handler.metadata.moby_handler import MobyMetadata
-from models.rom import Rom, RomFile, RomUserStatus
-from pydantic import BaseModel, computed_field
+from models.rom import Rom, RomFile, RomUser, RomUserStatus
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+# Rom columns and relationships that schema fields not mapped to a column of
+# the same name are built from, so partial roms only load what they need
+ROM_SCHEMA_FIELD_ATTRIBUTES: Final[dict[str, tuple[str, ...]]] = {
+    "platform_slug": ("platform",),
+    "platform_name": ("platform",),
+    "youtube_video_id": ("igdb_metadata",),
+    "alternative_names": ("igdb_metadata", "moby_metadata"),
+    "first_release_date": ("igdb_metadata",),
+    "genres": ("igdb_metadata", "moby_metadata"),
+    "franchises": ("igdb_metadata",),
+    "collections": ("igdb_metadata",),
+    "companies": ("igdb_metadata",),
+    "game_modes": ("igdb_metadata",),
+    "age_ratings": ("igdb_metadata",),
+    "has_cover": ("path_cover_s", "path_cover_l"),
+    "full_path": ("file_path", "file_name"),
+    "rom_user": ("rom_users",),
+}
 
-SORT_COMPARE_REGEX = re.compile(r"^([Tt]he|[Aa]|[Aa]nd)\s")
 
 RomIGDBMetadata = TypedDict(  # type: ignore[misc]
     "RomIGDBMetadata",
@@ -69,6 +88,13 @@ class RomUserSchema(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def construct_from_orm(cls, db_rom_user: RomUser) -> RomUserSchema:
+        """Build from a rom user loaded from the database, without validation"""
+        return cls.model_construct(
+            **{field: getattr(db_rom_user, field) for field in cls.model_fields}
+        )
+
     @classmethod
     def for_user(cls, user_id: int, db_rom: Rom) -> RomUserSchema:
         for n in db_rom.rom_users:
@@ -128,6 +154,8 @@ class RomSchema(BaseModel):
 
     path_cover_s: str | None
     path_cover_l: str | None
+    cover_placeholder: str | None
+    cover_color: str | None
     has_cover: bool
     url_cover: str | None
 
@@ -142,23 +170,23 @@ class RomSchema(BaseModel):
     md5_hash: str | None
     sha1_hash: str | None
     full_path: str
+    sort_comparator: str
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
 
-    @computed_field  # type: ignore
-    @property
-    def sort_comparator(self) -> str:
-        return (
-            SORT_COMPARE_REGEX.sub(
-                "",
-                self.name or self.file_name_no_tags,
-            )
-            .strip()
-            .lower()
-        )
+    @classmethod
+    def values_from_orm(cls, db_rom: Rom) -> dict[str, Any]:
+        """Read the fields of a rom loaded from the database, without validation"""
+        # Loaded columns are read from the instance dict, skipping the
+        # attribute instrumentation, and anything else through its attribute
+        loaded = db_rom.__dict__
+        return {
+            field: loaded[field] if field in loaded else getattr(db_rom, field)
+            for field in cls.model_fields
+        }
 
 
 class SimpleRomSchema(RomSchema):
@@ -179,6 +207,69 @@ class SimpleRomSchema(RomSchema):
 
         return cls.model_validate(db_rom)
 
+    @classmethod
+    def dump_json_with_request(cls, db_roms: Iterable[Rom], request: Request) -> bytes:
+        """Serialize roms loaded from the database straight to JSON.
+
+        Rows are trusted to match the schema, so no model is validated, which
+        makes this much faster than building a schema per rom for long lists.
+        """
+        user_id = request.user.id
+        default_rom_user = rom_user_schema_factory()
+
+        def get_rom_user(db_rom: Rom) -> RomUserSchema:
+            for db_rom_user in db_rom.rom_users:
+                if db_rom_user.user_id == user_id:
+                    return RomUserSchema.construct_from_orm(db_rom_user)
+            return default_rom_user
+
+        return to_json(
+            [
+                {
+                    **RomSchema.values_from_orm(db_rom),
+                    "sibling_roms": [
+                        RomSchema.values_from_orm(s) for s in db_rom.sibling_roms
+                    ],
+                    "rom_user": get_rom_user(db_rom),
+                }
+                for db_rom in db_roms
+            ]
+        )
+
+    @classmethod
+    def get_field_names(cls) -> set[str]:
+        return set(cls.model_fields)
+
+    @classmethod
+    def get_rom_attributes(cls, fields: set[str]) -> set[str]:
+        """Rom columns and relationships needed to build the given fields"""
+        return {
+            attribute
+            for field in fields
+            for attribute in ROM_SCHEMA_FIELD_ATTRIBUTES.get(field, (field,))
+        }
+
+    @classmethod
+    def partial_from_orm_with_request(
+        cls, db_rom: Rom, request: Request, fields: set[str]
+    ) -> dict[str, Any]:
+        """Build only some of the fields of a rom, from a partially loaded row.
+
+        Values are read as loaded from the database, without model validation.
+        """
+        values: dict[str, Any] = {}
+        for field in fields:
+            if field == "rom_user":
+                values[field] = RomUserSchema.for_user(request.user.id, db_rom)
+            elif field == "sibling_roms":
+                values[field] = [
+                    RomSchema.values_from_orm(s) for s in db_rom.sibling_roms
+                ]
+            else:
+                values[field] = getattr(db_rom, field)
+
+        return values
+
 
 class DetailedRomSchema(RomSchema):
     merged_screenshots: list[str]
@@ -218,3 +309,27 @@ class UserNotesSchema(TypedDict):
     user_id: int
     username: str
     note_raw_markdown: str
+
+
+class CoverAtlasTile(TypedDict):
+    x: int
+    y: int
+
+
+class CoverAtlasSchema(TypedDict):
+    url: str
+    width: int
+    height: int
+    tile_width: int
+    tile_height: int
+    tiles: dict[int, CoverAtlasTile]
+
+
+class RomSuggestionSchema(TypedDict):
+    id: int
+    name: str | None
+    file_name_no_tags: str
+    platform_id: int
+    platform_name: str
+    path_cover_s: str | None
+    cover_placeholder: str | None
@@ -4,7 +4,22 @@ from typing import TypedDict
 class StatsReturn(TypedDict):
     PLATFORMS: int
     ROMS: int
+    IDENTIFIED_ROMS: int
     SAVES: int
     STATES: int
     SCREENSHOTS: int
     FILESIZE: int
+
+
+class PlatformStatsReturn(TypedDict):
+    PLATFORM_ID: int
+    ROMS: int
+    IDENTIFIED_ROMS: int
+    FILESIZE: int
+
+
+class UserStatsReturn(TypedDict):
+    USER_ID: int
+    SAVES: int
+    STATES: int
+    SCREENSHOTS: int
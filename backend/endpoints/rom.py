@@ -1,6 +1,5 @@
 import binascii
 from base64 import b64encode
-from io import BytesIO
 from shutil import rmtree
 from typing import Annotated
 from urllib.parse import quote
@@ -14,8 +13,17 @@ from config import (
 )
 from decorators.auth import protected_route
 from endpoints.responses import MessageResponse
-from endpoints.responses.rom import DetailedRomSchema, RomUserSchema, SimpleRomSchema
-from exceptions.endpoint_exceptions import RomNotFoundInDatabaseException
+from endpoints.responses.rom import (
+    CoverAtlasSchema,
+    DetailedRomSchema,
+    RomSuggestionSchema,
+    RomUserSchema,
+    SimpleRomSchema,
+)
+from exceptions.endpoint_exceptions import (
+    ResourceNotFoundException,
+    RomNotFoundInDatabaseException,
+)
 from exceptions.fs_exceptions import RomAlreadyExistsException
 from fastapi import HTTPException, Query, Request, UploadFile, status
 from fastapi.responses import Response
@@ -23,9 +31,13 @@ from handler.auth.base_handler import Scope
 from handler.database import db_platform_handler, db_rom_handler
 from handler.filesystem import fs_resource_handler, fs_rom_handler
 from handler.filesystem.base_handler import CoverSize
+from handler.filesystem.resources_handler import (
+    COVER_ATLAS_MAX_TILES,
+    COVER_ATLAS_TILE_SIZE,
+)
 from handler.metadata import meta_igdb_handler, meta_moby_handler
 from logger.logger import log
-from PIL import Image
+from pydantic_core import to_json
 from starlette.requests import ClientDisconnect
 from starlette.responses import FileResponse
 from streaming_form_data import StreamingFormDataParser
@@ -108,19 +120,159 @@ def get_roms(
     search_term: str = "",
     limit: int | None = None,
     offset: int | None = None,
+    cursor: str | None = None,
     order_by: str = "name",
     order_dir: str = "asc",
+    fields: str | None = None,
 ) -> list[SimpleRomSchema]:
     """Get roms endpoint
 
+    Pages requested with a limit and no offset are paginated by cursor: the
+    cursors of the next and previous pages are returned in the `X-Next-Cursor`
+    and `X-Prev-Cursor` headers, and passed back in the `cursor` parameter.
+
+    Roms are serialized straight from the database rows, skipping the response
+    model validation.
+
     Args:
         request (Request): Fastapi Request object
         id (int, optional): Rom internal id
+        fields (str, optional): Comma separated fields to return for each rom, e.g.
+            `name,path_cover_s,rom_user`. Only the columns needed for them are
+            loaded from the database. Defaults to all the fields.
 
     Returns:
         list[SimpleRomSchema]: List of roms stored in the database
     """
 
+    requested_fields: set[str] | None = None
+    attributes: set[str] | None = None
+    if fields:
+        requested_fields = {"id"} | {
+            field.strip() for field in fields.split(",") if field.strip()
+        }
+        unknown_fields = requested_fields - SimpleRomSchema.get_field_names()
+        if unknown_fields:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown rom fields: {', '.join(sorted(unknown_fields))}",
+            )
+        attributes = SimpleRomSchema.get_rom_attributes(requested_fields)
+
+    cursor_headers: dict[str, str] = {}
+    if limit and offset is None:
+        try:
+            roms, next_cursor, prev_cursor = db_rom_handler.get_roms_page(
+                platform_id=platform_id,
+                collection_id=collection_id,
+                search_term=search_term.lower(),
+                order_by=order_by.lower(),
+                order_dir=order_dir.lower(),
+                limit=limit,
+                cursor=cursor,
+                attributes=attributes,
+                user_id=request.user.id,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+
+        if next_cursor:
+            cursor_headers["X-Next-Cursor"] = next_cursor
+        if prev_cursor:
+            cursor_headers["X-Prev-Cursor"] = prev_cursor
+    else:
+        roms = db_rom_handler.get_roms(
+            platform_id=platform_id,
+            collection_id=collection_id,
+            search_term=search_term.lower(),
+            order_by=order_by.lower(),
+            order_dir=order_dir.lower(),
+            limit=limit,
+            offset=offset,
+            attributes=attributes,
+            user_id=request.user.id,
+        )
+
+    if requested_fields:
+        content = to_json(
+            [
+                SimpleRomSchema.partial_from_orm_with_request(
+                    rom, request, requested_fields
+                )
+                for rom in roms
+            ]
+        )
+    else:
+        content = SimpleRomSchema.dump_json_with_request(roms, request)
+
+    return Response(
+        content=content, media_type="application/json", headers=cursor_headers
+    )
+
+
+@protected_route(router.get, "/roms/autocomplete", [Scope.ROMS_READ])
+def autocomplete_roms(
+    request: Request,
+    search_term: str,
+    platform_id: int | None = None,
+    limit: int = Query(default=10, gt=0, le=50),
+) -> list[RomSuggestionSchema]:
+    """Suggest roms while a search term is typed
+
+    Args:
+        request (Request): Fastapi Request object
+        search_term (str): Search term, possibly with partially typed words or typos
+        platform_id (int, optional): Only suggest roms of this platform. Defaults to None.
+        limit (int, optional): Maximum number of suggestions. Defaults to 10.
+
+    Returns:
+        list[RomSuggestionSchema]: Matching roms, best matches first
+    """
+
+    if not search_term.strip():
+        return []
+
+    return [
+        {
+            "id": rom.id,
+            "name": rom.name,
+            "file_name_no_tags": rom.file_name_no_tags,
+            "platform_id": rom.platform_id,
+            "platform_name": rom.platform_name,
+            "path_cover_s": rom.path_cover_s,
+            "cover_placeholder": rom.cover_placeholder,
+        }
+        for rom in db_rom_handler.search_roms(
+            search_term, platform_id=platform_id, limit=limit
+        )
+    ]
+
+
+@protected_route(router.get, "/roms/covers/atlas", [Scope.ROMS_READ])
+async def get_roms_cover_atlas(
+    request: Request,
+    platform_id: int | None = None,
+    collection_id: int | None = None,
+    search_term: str = "",
+    limit: int = Query(default=COVER_ATLAS_MAX_TILES, gt=0, le=COVER_ATLAS_MAX_TILES),
+    offset: int | None = None,
+    order_by: str = "name",
+    order_dir: str = "asc",
+) -> CoverAtlasSchema:
+    """Get the small covers of a page of roms, packed in a single image
+
+    Takes the same filters as the roms endpoint. Roms without a cover aren't part
+    of the atlas.
+
+    Args:
+        request (Request): Fastapi Request object
+
+    Returns:
+        CoverAtlasSchema: Url of the atlas image, and position of each rom cover in it
+    """
+
     roms = db_rom_handler.get_roms(
         platform_id=platform_id,
         collection_id=collection_id,
@@ -129,10 +281,55 @@ def get_roms(
         order_dir=order_dir.lower(),
         limit=limit,
         offset=offset,
+        attributes={"path_cover_s"},
+    )
+    covers = [(rom.id, rom.path_cover_s) for rom in roms if rom.path_cover_s]
+
+    atlas_url = (
+        f"/api/roms/covers/atlas/{await fs_resource_handler.get_cover_atlas(covers)}"
+        if covers
+        else ""
     )
+    width, height = fs_resource_handler.get_cover_atlas_size(covers)
+    tile_width, tile_height = COVER_ATLAS_TILE_SIZE
+
+    return {
+        "url": atlas_url,
+        "width": width,
+        "height": height,
+        "tile_width": tile_width,
+        "tile_height": tile_height,
+        "tiles": {
+            rom_id: {"x": x, "y": y}
+            for rom_id, (x, y) in fs_resource_handler.get_cover_atlas_layout(
+                covers
+            ).items()
+        },
+    }
+
+
+@protected_route(router.get, "/roms/covers/atlas/{key}", [Scope.ROMS_READ])
+def get_roms_cover_atlas_image(request: Request, key: str) -> FileResponse:
+    """Get a cover atlas image
 
-    roms = [SimpleRomSchema.from_orm_with_request(rom, request) for rom in roms]
-    return [rom for rom in roms if rom]
+    Args:
+        request (Request): Fastapi Request object
+        key (str): Atlas key, as returned by the cover atlas endpoint
+
+    Returns:
+        FileResponse: Atlas image
+    """
+
+    atlas_path = fs_resource_handler.find_cover_atlas(key)
+    if not atlas_path:
+        raise ResourceNotFoundException(key)
+
+    # Atlases are keyed by their content, so they never change
+    return FileResponse(
+        path=atlas_path,
+        media_type="image/webp",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
 
 
 @protected_route(
@@ -151,7 +348,7 @@ def get_rom(request: Request, id: int) -> DetailedRomSchema:
         DetailedRomSchema: Rom stored in the database
     """
 
-    rom = db_rom_handler.get_rom(id)
+    rom = db_rom_handler.get_rom(id, user_id=request.user.id)
 
     if not rom:
         raise RomNotFoundInDatabaseException(id)
@@ -335,6 +532,8 @@ async def update_rom(
                 "path_screenshots": [],
                 "path_cover_s": "",
                 "path_cover_l": "",
+                "cover_placeholder": "",
+                "cover_color": "",
                 "url_cover": "",
                 "slug": "",
                 "igdb_metadata": {},
@@ -344,7 +543,7 @@ async def update_rom(
         )
 
         return DetailedRomSchema.from_orm_with_request(
-            db_rom_handler.get_rom(id), request
+            db_rom_handler.get_rom(id, user_id=request.user.id), request
         )
 
     cleaned_data = {
@@ -428,24 +627,20 @@ async def update_rom(
     else:
         if artwork:
             file_ext = artwork.filename.split(".")[-1]
-            (
-                path_cover_l,
-                path_cover_s,
-                artwork_path,
-            ) = await fs_resource_handler.build_artwork_path(rom, file_ext)
+            _, _, artwork_path = await fs_resource_handler.build_artwork_path(
+                rom, file_ext
+            )
+
+            path_cover_s, path_cover_l = await fs_resource_handler.store_cover_content(
+                artwork_path, await artwork.read(), file_ext
+            )
 
             cleaned_data.update(
                 {"path_cover_s": path_cover_s, "path_cover_l": path_cover_l}
             )
-
-            artwork_content = BytesIO(await artwork.read())
-            file_location_small = Path(f"{artwork_path}/small.{file_ext}")
-            file_location_large = Path(f"{artwork_path}/big.{file_ext}")
-            with Image.open(artwork_content) as img:
-                img.save(file_location_large)
-                fs_resource_handler.resize_cover_to_small(
-                    img, save_path=file_location_small
-                )
+            cleaned_data.update(
+                await fs_resource_handler.get_cover_placeholder(path_cover_s)
+            )
 
             cleaned_data.update({"url_cover": ""})
         else:
@@ -461,10 +656,15 @@ async def update_rom(
                 cleaned_data.update(
                     {"path_cover_s": path_cover_s, "path_cover_l": path_cover_l}
                 )
+                cleaned_data.update(
+                    await fs_resource_handler.get_cover_placeholder(path_cover_s)
+                )
 
     db_rom_handler.update_rom(id, cleaned_data)
 
-    return DetailedRomSchema.from_orm_with_request(db_rom_handler.get_rom(id), request)
+    return DetailedRomSchema.from_orm_with_request(
+        db_rom_handler.get_rom(id, user_id=request.user.id), request
+    )
 
 
 @protected_route(router.post, "/roms/delete", [Scope.ROMS_WRITE])
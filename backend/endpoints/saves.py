@@ -73,7 +73,7 @@ def add_saves(
         )
 
     # Refetch the rom to get updated saves
-    rom = db_rom_handler.get_rom(rom_id)
+    rom = db_rom_handler.get_rom(rom_id, user_id=current_user.id)
     if not rom:
         raise RomNotFoundInDatabaseException(rom_id)
 
@@ -1,3 +1,9 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from functools import partial
+from typing import Final
+
 import emoji
 from decorators.auth import protected_route
 from endpoints.responses.search import SearchCoverSchema, SearchRomSchema
@@ -8,12 +14,54 @@ from handler.metadata import meta_igdb_handler, meta_moby_handler, meta_sgdb_han
 from handler.metadata.igdb_handler import IGDB_API_ENABLED
 from handler.metadata.moby_handler import MOBY_API_ENABLED
 from handler.metadata.sgdb_handler import STEAMGRIDDB_API_ENABLED
+from handler.redis_handler import async_cache
 from handler.scan_handler import _get_main_platform_igdb_id
 from logger.logger import log
 from utils.router import APIRouter
 
 router = APIRouter()
 
+# Maximum time to wait for a single metadata provider, in seconds
+SEARCH_PROVIDER_TIMEOUT: Final = 10
+# Time to keep the results of a metadata provider search, in seconds.
+# Empty results aren't kept.
+SEARCH_CACHE_TTL: Final = 60 * 5
+
+
+async def _search_provider(
+    source: str, cache_key: str, search: Callable[[], Awaitable[list]]
+) -> list:
+    """Run a metadata provider search with a deadline, caching its results
+
+    Args:
+        source (str): Metadata provider name
+        cache_key (str): Unique key for the search within the provider
+        search (Callable): Provider search to run
+
+    Returns:
+        list: Matched roms, or an empty list if the provider didn't answer in time
+    """
+
+    cache_key = f"romm:search:{source}:{cache_key.lower()}"
+    cached_results = await async_cache.get(cache_key)
+    if cached_results:
+        return json.loads(cached_results)
+
+    try:
+        results = await asyncio.wait_for(search(), timeout=SEARCH_PROVIDER_TIMEOUT)
+    except TimeoutError:
+        log.warning(
+            f"Search in {source} took more than {SEARCH_PROVIDER_TIMEOUT} seconds, skipping its results"
+        )
+        return []
+
+    # Providers answer errors (e.g. rate limits) with no results, which must not
+    # be served from the cache once they're over
+    if results:
+        await async_cache.set(cache_key, json.dumps(results), ex=SEARCH_CACHE_TTL)
+
+    return results
+
 
 @protected_route(router.get, "/search/roms", [Scope.ROMS_READ])
 async def search_rom(
@@ -60,24 +108,47 @@ async def search_rom(
     log.info(emoji.emojize(f":video_game: {rom.platform_slug}: {rom.file_name}"))
     if search_by.lower() == "id":
         try:
-            igdb_matched_roms = await meta_igdb_handler.get_matched_roms_by_id(
-                int(search_term)
-            )
-            moby_matched_roms = await meta_moby_handler.get_matched_roms_by_id(
-                int(search_term)
-            )
+            search_id = int(search_term)
         except ValueError as exc:
             log.error(f"Search error: invalid ID '{search_term}'")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Tried searching by ID, but '{search_term}' is not a valid ID",
             ) from exc
-    elif search_by.lower() == "name":
-        igdb_matched_roms = await meta_igdb_handler.get_matched_roms_by_name(
-            search_term, (await _get_main_platform_igdb_id(rom.platform))
+
+        igdb_matched_roms, moby_matched_roms = await asyncio.gather(
+            _search_provider(
+                "igdb",
+                f"id:{search_id}",
+                partial(meta_igdb_handler.get_matched_roms_by_id, search_id),
+            ),
+            _search_provider(
+                "moby",
+                f"id:{search_id}",
+                partial(meta_moby_handler.get_matched_roms_by_id, search_id),
+            ),
         )
-        moby_matched_roms = await meta_moby_handler.get_matched_roms_by_name(
-            search_term, rom.platform.moby_id
+    elif search_by.lower() == "name":
+        main_platform_igdb_id = await _get_main_platform_igdb_id(rom.platform)
+        igdb_matched_roms, moby_matched_roms = await asyncio.gather(
+            _search_provider(
+                "igdb",
+                f"name:{main_platform_igdb_id}:{search_term}",
+                partial(
+                    meta_igdb_handler.get_matched_roms_by_name,
+                    search_term,
+                    main_platform_igdb_id,
+                ),
+            ),
+            _search_provider(
+                "moby",
+                f"name:{rom.platform.moby_id}:{search_term}",
+                partial(
+                    meta_moby_handler.get_matched_roms_by_name,
+                    search_term,
+                    rom.platform.moby_id,
+                ),
+            ),
         )
 
     merged_dict = {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any, Final
 
@@ -32,10 +33,13 @@ from models.platform import Platform
 from models.rom import Rom
 from rq import Worker
 from rq.job import Job
-from sqlalchemy.inspection import inspect
 from utils.context import initialize_context
 
 STOP_SCAN_FLAG: Final = "scan:stop"
+# Number of roms whose artwork is fetched concurrently during a scan
+ARTWORK_WORKERS: Final = 8
+# Number of roms waiting for their artwork before the scan is held back
+ARTWORK_QUEUE_SIZE: Final = ARTWORK_WORKERS * 4
 
 
 @dataclass
@@ -64,6 +68,92 @@ class ScanStats:
         )
 
 
+class ArtworkPipeline:
+    """Fetches the artwork of scanned roms in the background.
+
+    Roms are identified and stored right away, and their covers and screenshots
+    are downloaded concurrently while the scan moves on. Once the artwork of a
+    rom is stored, the rom is updated and a `scan:rom_artwork` event is emitted.
+    """
+
+    def __init__(self, socket_manager: socketio.AsyncRedisManager):
+        self.socket_manager = socket_manager
+        self._queue: asyncio.Queue[tuple[Platform, Rom] | None] = asyncio.Queue(
+            maxsize=ARTWORK_QUEUE_SIZE
+        )
+        self._workers: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> ArtworkPipeline:
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(ARTWORK_WORKERS)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None or redis_client.get(STOP_SCAN_FLAG):
+            # Pending artwork is dropped if the scan is stopped or fails
+            for worker in self._workers:
+                worker.cancel()
+        else:
+            for _ in self._workers:
+                await self._queue.put(None)
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    async def enqueue(self, platform: Platform, rom: Rom) -> None:
+        """Queue the rom, waiting for a free slot if the workers fall behind"""
+        await self._queue.put((platform, rom))
+
+    async def _worker(self) -> None:
+        while (item := await self._queue.get()) is not None:
+            # Skip the queued roms once the scan is stopped
+            if redis_client.get(STOP_SCAN_FLAG):
+                continue
+
+            platform, rom = item
+            try:
+                await self._fetch_artwork(platform, rom)
+            except Exception as e:
+                log.error(f"Failure fetching artwork for {rom.file_name}: {e}")
+
+    async def _fetch_artwork(self, platform: Platform, rom: Rom) -> None:
+        path_cover_s, path_cover_l = await fs_resource_handler.get_cover(
+            overwrite=True,
+            entity=rom,
+            url_cover=rom.url_cover,
+        )
+
+        cover_placeholder = await fs_resource_handler.get_cover_placeholder(
+            path_cover_s
+        )
+
+        path_screenshots = await fs_resource_handler.get_rom_screenshots(
+            rom=rom,
+            url_screenshots=rom.url_screenshots,
+        )
+
+        artwork = {
+            "path_cover_s": path_cover_s,
+            "path_cover_l": path_cover_l,
+            "path_screenshots": path_screenshots,
+            **cover_placeholder,
+        }
+        for key, value in artwork.items():
+            setattr(rom, key, value)
+        db_rom_handler.update_rom(rom.id, artwork)
+
+        await self.socket_manager.emit(
+            "scan:rom_artwork",
+            {
+                "platform_name": platform.name,
+                "platform_slug": platform.slug,
+                **SimpleRomSchema.from_orm_with_factory(rom).model_dump(
+                    exclude={"created_at", "updated_at", "rom_user"}
+                ),
+            },
+        )
+
+
 def _get_socket_manager() -> socketio.AsyncRedisManager:
     """Connect to external socketio server"""
     return socketio.AsyncRedisManager(str(REDIS_URL), write_only=True)
@@ -153,15 +243,17 @@ async def scan_platforms(
         else:
             log.info(f"Found {len(platform_list)} platforms in the file system")
 
-        for platform_slug in platform_list:
-            scan_stats += await _identify_platform(
-                platform_slug=platform_slug,
-                scan_type=scan_type,
-                fs_platforms=fs_platforms,
-                roms_ids=roms_ids,
-                metadata_sources=metadata_sources,
-                socket_manager=sm,
-            )
+        async with ArtworkPipeline(sm) as artwork_pipeline:
+            for platform_slug in platform_list:
+                scan_stats += await _identify_platform(
+                    platform_slug=platform_slug,
+                    scan_type=scan_type,
+                    fs_platforms=fs_platforms,
+                    roms_ids=roms_ids,
+                    metadata_sources=metadata_sources,
+                    socket_manager=sm,
+                    artwork_pipeline=artwork_pipeline,
+                )
 
         # Only purge platforms if there are some platforms remaining in the library
         # This protects against accidental deletion of entries when
@@ -173,6 +265,9 @@ async def scan_platforms(
                 for p in purged_platforms:
                     log.info(f" - {p.slug}")
 
+        # Reclaim the artwork no longer used after being replaced during the scan
+        await fs_resource_handler.collect_store_garbage()
+
         log.info(emoji.emojize(":check_mark: Scan completed "))
         await sm.emit("scan:done", scan_stats.__dict__)
     except ScanStoppedException:
@@ -192,6 +287,7 @@ async def _identify_platform(
     roms_ids: list[str],
     metadata_sources: list[str],
     socket_manager: socketio.AsyncRedisManager,
+    artwork_pipeline: ArtworkPipeline,
 ) -> ScanStats:
     # Stop the scan if the flag is set
     if redis_client.get(STOP_SCAN_FLAG):
@@ -273,6 +369,7 @@ async def _identify_platform(
             roms_ids=roms_ids,
             metadata_sources=metadata_sources,
             socket_manager=socket_manager,
+            artwork_pipeline=artwork_pipeline,
         )
 
     # Only purge entries if there are some file remaining in the library
@@ -332,6 +429,7 @@ async def _identify_rom(
     roms_ids: list[str],
     metadata_sources: list[str],
     socket_manager: socketio.AsyncRedisManager,
+    artwork_pipeline: ArtworkPipeline,
 ) -> ScanStats:
     scan_stats = ScanStats()
 
@@ -368,29 +466,6 @@ async def _identify_rom(
     if scan_type == ScanType.HASHES:
         return scan_stats
 
-    path_cover_s, path_cover_l = await fs_resource_handler.get_cover(
-        overwrite=True,
-        entity=_added_rom,
-        url_cover=_added_rom.url_cover,
-    )
-
-    path_screenshots = await fs_resource_handler.get_rom_screenshots(
-        rom=_added_rom,
-        url_screenshots=_added_rom.url_screenshots,
-    )
-
-    _added_rom.path_cover_s = path_cover_s
-    _added_rom.path_cover_l = path_cover_l
-    _added_rom.path_screenshots = path_screenshots
-    # Update the scanned rom with the cover and screenshots paths and update database
-    db_rom_handler.update_rom(
-        _added_rom.id,
-        {
-            c: getattr(_added_rom, c)
-            for c in inspect(_added_rom).mapper.column_attrs.keys()
-        },
-    )
-
     await socket_manager.emit(
         "scan:scanning_rom",
         {
@@ -403,6 +478,9 @@ async def _identify_rom(
     )
     await socket_manager.emit("", None)
 
+    # Covers and screenshots are fetched in the background
+    await artwork_pipeline.enqueue(platform, _added_rom)
+
     return scan_stats
 
 
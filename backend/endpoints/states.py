@@ -72,7 +72,7 @@ def add_states(
             rom_user.id, {"last_played": datetime.now(timezone.utc)}
         )
 
-    rom = db_rom_handler.get_rom(rom_id)
+    rom = db_rom_handler.get_rom(rom_id, user_id=current_user.id)
     return {
         "uploaded": len(states),
         "states": [s for s in rom.states if s.user_id == current_user.id],
@@ -1,5 +1,12 @@
-from endpoints.responses.stats import StatsReturn
-from handler.database import db_stats_handler
+from decorators.auth import protected_route
+from endpoints.responses.stats import (
+    PlatformStatsReturn,
+    StatsReturn,
+    UserStatsReturn,
+)
+from fastapi import Request
+from handler.auth.base_handler import Scope
+from handler.stats_handler import stats_handler
 from utils.router import APIRouter
 
 router = APIRouter()
@@ -13,11 +20,57 @@ def stats() -> StatsReturn:
         dict: Dictionary with all the stats
     """
 
+    stats = stats_handler.get_stats()
     return {
-        "PLATFORMS": db_stats_handler.get_platforms_count(),
-        "ROMS": db_stats_handler.get_roms_count(),
-        "SAVES": db_stats_handler.get_saves_count(),
-        "STATES": db_stats_handler.get_states_count(),
-        "SCREENSHOTS": db_stats_handler.get_screenshots_count(),
-        "FILESIZE": db_stats_handler.get_total_filesize(),
+        "PLATFORMS": stats["platforms"],
+        "ROMS": stats["roms"],
+        "IDENTIFIED_ROMS": stats["identified_roms"],
+        "SAVES": stats["saves"],
+        "STATES": stats["states"],
+        "SCREENSHOTS": stats["screenshots"],
+        "FILESIZE": stats["filesize"],
     }
+
+
+@router.get("/stats/platforms")
+def platforms_stats() -> list[PlatformStatsReturn]:
+    """Endpoint to return the stats of each platform
+
+    Returns:
+        list[PlatformStatsReturn]: Stats of the platforms with any roms
+    """
+
+    return [
+        {
+            "PLATFORM_ID": platform_id,
+            "ROMS": platform_stats["roms"],
+            "IDENTIFIED_ROMS": platform_stats["identified_roms"],
+            "FILESIZE": platform_stats["filesize"],
+        }
+        for platform_id, platform_stats in sorted(
+            stats_handler.get_platforms_stats().items()
+        )
+        if platform_stats["roms"]
+    ]
+
+
+@protected_route(router.get, "/stats/users", [Scope.USERS_READ])
+def users_stats(request: Request) -> list[UserStatsReturn]:
+    """Endpoint to return the stats of each user
+
+    Args:
+        request (Request): Fastapi Request object
+
+    Returns:
+        list[UserStatsReturn]: Stats of the users
+    """
+
+    return [
+        {
+            "USER_ID": user_id,
+            "SAVES": user_stats["saves"],
+            "STATES": user_stats["states"],
+            "SCREENSHOTS": user_stats["screenshots"],
+        }
+        for user_id, user_stats in sorted(stats_handler.get_users_stats().items())
+    ]
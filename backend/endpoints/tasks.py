@@ -2,6 +2,7 @@ from decorators.auth import protected_route
 from endpoints.responses import MessageResponse
 from fastapi import Request
 from handler.auth.base_handler import Scope
+from tasks.reconcile_platform_counters import reconcile_platform_counters_task
 from tasks.update_switch_titledb import update_switch_titledb_task
 from utils.router import APIRouter
 
@@ -19,6 +20,7 @@ async def run_tasks(request: Request) -> MessageResponse:
     """
 
     await update_switch_titledb_task.run()
+    await reconcile_platform_counters_task.run()
     return {"msg": "All tasks ran successfully!"}
 
 
@@ -32,7 +34,10 @@ async def run_task(request: Request, task: str) -> MessageResponse:
         RunTasksResponse: Standard message response
     """
 
-    tasks = {"switch_titledb": update_switch_titledb_task}
+    tasks = {
+        "switch_titledb": update_switch_titledb_task,
+        "platform_counters": reconcile_platform_counters_task,
+    }
 
     await tasks[task].run()
     return {"msg": f"Task {task} run successfully!"}
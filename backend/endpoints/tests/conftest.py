@@ -5,6 +5,7 @@ from handler.auth import oauth_handler
 from handler.tests.conftest import (  # noqa
     admin_user,
     clear_database,
+    collection,
     editor_user,
     platform,
     rom,
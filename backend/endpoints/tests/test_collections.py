@@ -0,0 +1,61 @@
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        yield client
+
+
+def test_add_and_remove_collection_roms(client, access_token, collection, rom):
+    response = client.post(
+        f"/api/collections/{collection.id}/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"roms": [rom.id, rom.id]},
+    )
+    assert response.status_code == 200
+    assert response.json()["roms"] == [rom.id]
+
+    response = client.post(
+        f"/api/collections/{collection.id}/roms/delete",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json={"roms": [rom.id]},
+    )
+    assert response.status_code == 200
+    assert response.json()["roms"] == []
+
+
+@pytest.mark.parametrize("body", [{}, {"roms": "1,2"}, {"roms": [1, "2"]}, [1]])
+def test_add_collection_roms_invalid(client, access_token, collection, body):
+    response = client.post(
+        f"/api/collections/{collection.id}/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        json=body,
+    )
+    assert response.status_code == 400
+
+
+def test_update_collection_roms(client, access_token, collection, rom):
+    response = client.put(
+        f"/api/collections/{collection.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        data={"roms": f"[{rom.id}]", "url_cover": ""},
+    )
+    assert response.status_code == 200
+    assert response.json()["roms"] == [rom.id]
+
+    response = client.put(
+        f"/api/collections/{collection.id}",
+        headers={"Authorization": f"Bearer {access_token}"},
+        data={"roms": "not a list", "name": "renamed"},
+    )
+    assert response.status_code == 400
+    assert (
+        client.get(
+            f"/api/collections/{collection.id}",
+            headers={"Authorization": f"Bearer {access_token}"},
+        ).json()["name"]
+        == "test_collection"
+    )
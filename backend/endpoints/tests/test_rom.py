@@ -1,10 +1,13 @@
 from unittest.mock import patch
 
 import pytest
+from endpoints.responses.rom import SimpleRomSchema
 from fastapi.testclient import TestClient
+from handler.database import db_rom_handler
 from handler.filesystem.roms_handler import FSRomsHandler
 from handler.metadata.igdb_handler import IGDBBaseHandler, IGDBRom
 from main import app
+from models.rom import Rom
 
 
 @pytest.fixture
@@ -35,6 +38,100 @@ def test_get_all_roms(client, access_token, rom, platform):
     body = response.json()
     assert len(body) == 1
     assert body[0]["id"] == rom.id
+    assert body[0]["sort_comparator"] == "test_rom"
+
+    # Roms are serialized without validation, but must still match the schema
+    assert SimpleRomSchema.model_validate(body[0]).id == rom.id
+
+
+def test_get_roms_page(client, access_token, rom, platform):
+    db_rom_handler.add_rom(
+        Rom(
+            platform_id=platform.id,
+            name="test_rom_2",
+            slug="test_rom_2_slug",
+            file_name="test_rom_2.zip",
+            file_name_no_tags="test_rom_2",
+            file_name_no_ext="test_rom_2",
+            file_extension="zip",
+            file_path=f"{platform.slug}/roms",
+            file_size_bytes=1000.0,
+        )
+    )
+
+    response = client.get(
+        "/api/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"platform_id": platform.id, "limit": 1},
+    )
+    assert response.status_code == 200
+    assert [r["name"] for r in response.json()] == ["test_rom"]
+    assert "X-Prev-Cursor" not in response.headers
+    next_cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(
+        "/api/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"platform_id": platform.id, "limit": 1, "cursor": next_cursor},
+    )
+    assert response.status_code == 200
+    assert [r["name"] for r in response.json()] == ["test_rom_2"]
+    assert "X-Next-Cursor" not in response.headers
+    assert "X-Prev-Cursor" in response.headers
+
+
+def test_get_roms_page_invalid_cursor(client, access_token, rom, platform):
+    response = client.get(
+        "/api/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"platform_id": platform.id, "limit": 1, "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+
+def test_get_roms_fields(client, access_token, rom, platform):
+    response = client.get(
+        "/api/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"platform_id": platform.id, "fields": "name,file_size_bytes"},
+    )
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body == [
+        {"id": rom.id, "name": "test_rom", "file_size_bytes": rom.file_size_bytes}
+    ]
+
+
+def test_get_roms_unknown_fields(client, access_token, rom, platform):
+    response = client.get(
+        "/api/roms",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"platform_id": platform.id, "fields": "name,unknown_field"},
+    )
+    assert response.status_code == 400
+    assert "unknown_field" in response.json()["detail"]
+
+
+def test_autocomplete_roms(client, access_token, rom, platform):
+    response = client.get(
+        "/api/roms/autocomplete",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"search_term": "test_r", "platform_id": platform.id},
+    )
+    assert response.status_code == 200
+
+    body = response.json()
+    assert [suggestion["id"] for suggestion in body] == [rom.id]
+    assert body[0]["platform_name"] == platform.name
+
+    response = client.get(
+        "/api/roms/autocomplete",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"search_term": "tset", "platform_id": platform.id},
+    )
+    assert response.status_code == 200
+    assert response.json() == []
 
 
 @patch.object(FSRomsHandler, "rename_file")
@@ -35,6 +35,17 @@ class CollectionNotFoundInDatabaseException(Exception):
         return self.message
 
 
+class ResourceNotFoundException(Exception):
+    def __init__(self, path):
+        self.message = f"Resource '{path}' not found"
+        super().__init__(self.message)
+        log.critical(self.message)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=self.message)
+
+    def __repr__(self) -> str:
+        return self.message
+
+
 class CollectionPermissionError(Exception):
     def __init__(self, id):
         self.message = f"Permission denied for collection with id '{id}'"
@@ -1,9 +1,13 @@
 from config.config_manager import ConfigManager
+from handler.library_handler import library_handler
+from handler.stats_handler import stats_handler
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 sync_engine = create_engine(ConfigManager.get_db_engine(), pool_pre_ping=True)
 sync_session = sessionmaker(bind=sync_engine, expire_on_commit=False)
+library_handler.track_sessions(sync_session)
+stats_handler.track_sessions(sync_session)
 
 
 class DBBaseHandler: ...
@@ -1,6 +1,8 @@
+from collections.abc import Iterable
+
 from decorators.database import begin_session
-from models.collection import Collection
-from sqlalchemy import Select, delete, select, update
+from models.collection import Collection, CollectionRom
+from sqlalchemy import Select, delete, func, insert, select, update
 from sqlalchemy.orm import Session
 
 from .base_handler import DBBaseHandler
@@ -37,8 +39,16 @@ class DBCollectionsHandler(DBBaseHandler):
 
     @begin_session
     def update_collection(
-        self, id: int, data: dict, session: Session = None
+        self,
+        id: int,
+        data: dict,
+        rom_ids: Iterable[int] | None = None,
+        session: Session = None,
     ) -> Collection:
+        """Update a collection, and replace its roms if given"""
+        if rom_ids is not None:
+            self._set_collection_roms(id, set(rom_ids), session)
+
         session.execute(
             update(Collection)
             .where(Collection.id == id)
@@ -54,3 +64,59 @@ class DBCollectionsHandler(DBBaseHandler):
             .where(Collection.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+
+    def _add_collection_roms(self, id: int, rom_ids: set[int], session: Session):
+        if rom_ids:
+            # Roms already in the collection, or deleted meanwhile, are ignored
+            session.execute(
+                insert(CollectionRom).prefix_with("IGNORE"),
+                [{"collection_id": id, "rom_id": rom_id} for rom_id in rom_ids],
+            )
+
+    def _remove_collection_roms(
+        self, id: int, rom_ids: set[int], session: Session
+    ) -> None:
+        if rom_ids:
+            session.execute(
+                delete(CollectionRom)
+                .where(
+                    CollectionRom.collection_id == id,
+                    CollectionRom.rom_id.in_(rom_ids),
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+    def _set_collection_roms(
+        self, id: int, rom_ids: set[int], session: Session
+    ) -> None:
+        """Replace the roms of a collection, only writing the changed memberships"""
+        current_rom_ids = set(
+            session.scalars(
+                select(CollectionRom.rom_id).filter_by(collection_id=id)
+            ).all()
+        )
+        self._add_collection_roms(id, rom_ids - current_rom_ids, session)
+        self._remove_collection_roms(id, current_rom_ids - rom_ids, session)
+
+    def _touch_collection(self, id: int, session: Session) -> Collection:
+        session.execute(
+            update(Collection)
+            .where(Collection.id == id)
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return session.query(Collection).filter_by(id=id).one()
+
+    @begin_session
+    def add_collection_roms(
+        self, id: int, rom_ids: Iterable[int], session: Session = None
+    ) -> Collection:
+        self._add_collection_roms(id, set(rom_ids), session)
+        return self._touch_collection(id, session)
+
+    @begin_session
+    def remove_collection_roms(
+        self, id: int, rom_ids: Iterable[int], session: Session = None
+    ) -> Collection:
+        self._remove_collection_roms(id, set(rom_ids), session)
+        return self._touch_collection(id, session)
@@ -1,7 +1,8 @@
 from decorators.database import begin_session
+from handler.stats_handler import stats_handler
 from models.platform import Platform
 from models.rom import Rom
-from sqlalchemy import Select, delete, or_, select
+from sqlalchemy import Select, delete, func, or_, select, update
 from sqlalchemy.orm import Session
 
 from .base_handler import DBBaseHandler
@@ -57,6 +58,7 @@ class DBPlatformsHandler(DBBaseHandler):
             .where(Platform.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        stats_handler.invalidate(session)
 
     @begin_session
     def purge_platforms(
@@ -78,4 +80,29 @@ class DBPlatformsHandler(DBBaseHandler):
             .where(or_(Platform.fs_slug.not_in(fs_platforms), Platform.slug.is_(None)))  # type: ignore[attr-defined]
             .execution_options(synchronize_session="fetch")
         )
+        if purged_platforms:
+            stats_handler.invalidate(session)
+
         return purged_platforms
+
+    @begin_session
+    def reconcile_platform_counters(self, session: Session) -> None:
+        """Recompute the rom counters of every platform from the roms table"""
+        platform_roms = Rom.platform_id == Platform.id
+        session.execute(
+            update(Platform)
+            .values(
+                rom_count=select(func.count(Rom.id))
+                .where(platform_roms)
+                .scalar_subquery(),
+                identified_rom_count=select(func.count(Rom.id))
+                .where(platform_roms, Rom.is_identified)
+                .scalar_subquery(),
+                total_file_size_bytes=select(
+                    func.coalesce(func.sum(Rom.file_size_bytes), 0)
+                )
+                .where(platform_roms)
+                .scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        )
@@ -1,13 +1,60 @@
+import binascii
 import functools
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Final
 
 from decorators.database import begin_session
-from models.collection import Collection
-from models.rom import Rom, RomUser
-from sqlalchemy import and_, delete, func, or_, select, update
-from sqlalchemy.orm import Query, Session, selectinload
+from handler.stats_handler import stats_handler
+from models.assets import Save, State
+from models.collection import Collection, CollectionRom
+from models.platform import Platform
+from models.rom import Rom, RomUser, SiblingRom
+from sqlakeyset import Marker, select_page, unserialize_bookmark
+from sqlakeyset.serial import BadBookmark
+from sqlalchemy import (
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    union,
+    update,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Query, Session, aliased, load_only, selectinload
+from utils.search import (
+    TYPO_CANDIDATES_LIMIT,
+    TYPO_MIN_SIMILARITY,
+    SearchTerms,
+    get_similarity,
+    get_typo_prefixes,
+    parse_search_term,
+    to_boolean_query,
+)
 
 from .base_handler import DBBaseHandler
 
+# Roms are siblings when they share these
+SIBLING_ROM_KEYS: Final = frozenset({"platform_id", "igdb_id", "moby_id"})
+# The rom counters of platforms depend on these
+PLATFORM_COUNTER_KEYS: Final = frozenset(
+    {"platform_id", "file_size_bytes", "igdb_id", "moby_id"}
+)
+
+# Number, identified number and total file size of roms
+PlatformCounters = tuple[int, int, int]
+
+
+def _user_scoped(relationship, user_id: int | None, criteria):
+    """Only load the related rows matching the criteria, if a user is given"""
+    return relationship if user_id is None else relationship.and_(criteria)
+
+
+def _user_rom_users(user_id: int | None):
+    return _user_scoped(Rom.rom_users, user_id, RomUser.user_id == user_id)
+
 
 def with_details(func):
     @functools.wraps(func)
@@ -18,11 +65,19 @@ def with_details(func):
                 f"{func} is missing required kwarg 'session' with type 'Session'"
             )
 
+        # When given, only the rows of the requesting user (and public notes) are loaded
+        user_id = kwargs.get("user_id")
         kwargs["query"] = select(Rom).options(
-            selectinload(Rom.saves),
-            selectinload(Rom.states),
+            selectinload(_user_scoped(Rom.saves, user_id, Save.user_id == user_id)),
+            selectinload(_user_scoped(Rom.states, user_id, State.user_id == user_id)),
             selectinload(Rom.screenshots),
-            selectinload(Rom.rom_users),
+            selectinload(
+                _user_scoped(
+                    Rom.rom_users,
+                    user_id,
+                    or_(RomUser.user_id == user_id, RomUser.note_is_public.is_(True)),
+                )
+            ),
             selectinload(Rom.sibling_roms),
         )
         return func(*args, **kwargs)
@@ -39,14 +94,27 @@ def with_simple(func):
                 f"{func} is missing required kwarg 'session' with type 'Session'"
             )
 
+        # When given, only the rows of the requesting user are loaded
+        user_id = kwargs.get("user_id")
         kwargs["query"] = select(Rom).options(
-            selectinload(Rom.rom_users), selectinload(Rom.sibling_roms)
+            selectinload(_user_rom_users(user_id)), selectinload(Rom.sibling_roms)
         )
         return func(*args, **kwargs)
 
     return wrapper
 
 
+def _encode_cursor(bookmark: str) -> str:
+    return urlsafe_b64encode(bookmark.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Marker:
+    try:
+        return unserialize_bookmark(urlsafe_b64decode(cursor.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, BadBookmark) as exc:
+        raise ValueError(f"Invalid cursor '{cursor}'") from exc
+
+
 class DBRomsHandler(DBBaseHandler):
     def _filter(
         self,
@@ -54,54 +122,232 @@ class DBRomsHandler(DBBaseHandler):
         platform_id: int | None,
         collection_id: int | None,
         search_term: str,
-        session: Session,
     ):
         if platform_id:
             data = data.filter(Rom.platform_id == platform_id)
 
         if collection_id:
-            collection = (
-                session.query(Collection)
-                .filter(Collection.id == collection_id)
-                .one_or_none()
+            data = data.join(CollectionRom, CollectionRom.rom_id == Rom.id).filter(
+                CollectionRom.collection_id == collection_id
             )
-            if collection:
-                data = data.filter(Rom.id.in_(collection.roms))
 
         if search_term:
-            data = data.filter(
-                or_(
-                    Rom.file_name.ilike(f"%{search_term}%"),  # type: ignore[attr-defined]
-                    Rom.name.ilike(f"%{search_term}%"),  # type: ignore[attr-defined]
-                )
-            )
+            data = data.filter(*self._search(parse_search_term(search_term)))
 
         return data
 
+    def _search(self, terms: SearchTerms, required: bool = True) -> list:
+        """Match the roms whose names contain words starting with the terms
+
+        The unindexed terms must always match, `required` only applies to the
+        indexed ones.
+        """
+        criteria = [
+            Rom.search_text.contains(term, autoescape=True)  # type: ignore[attr-defined]
+            for term in terms.unindexed
+        ]
+        if terms.indexed:
+            criteria.append(self._relevance(terms, required))
+
+        # Nothing to look up in the index, e.g. only punctuation was typed
+        return criteria or [Rom.id.is_(None)]
+
+    def _relevance(self, terms: SearchTerms, required: bool = True):
+        return match(
+            Rom.search_text, against=to_boolean_query(terms.indexed, required)
+        ).in_boolean_mode()
+
+    def _project(self, attributes: set[str], user_id: int | None):
+        """Only load the given columns and relationships of the roms"""
+        mapper = Rom.__mapper__
+        columns = [
+            getattr(Rom, attribute)
+            for attribute in attributes
+            if attribute in mapper.column_attrs
+        ]
+        relationships = [
+            (
+                _user_rom_users(user_id)
+                if attribute == "rom_users"
+                else getattr(Rom, attribute)
+            )
+            for attribute in attributes
+            # The platform is always loaded along the rom
+            if attribute in mapper.relationships and attribute != "platform"
+        ]
+        # The platform id is needed to load the platform
+        return select(Rom).options(
+            load_only(Rom.platform_id, *columns),
+            *(selectinload(relationship) for relationship in relationships),
+        )
+
     def _order(self, data, order_by: str, order_dir: str):
+        # The id breaks ties, so the order is stable across pages
         if order_by == "id":
-            _column = Rom.id
+            _columns = [Rom.id]
         else:
-            _column = func.lower(Rom.name)
+            _columns = [Rom.sort_name, Rom.id]
 
         if order_dir == "desc":
-            return data.order_by(_column.desc())
+            return data.order_by(*(column.desc() for column in _columns))
         else:
-            return data.order_by(_column.asc())
+            return data.order_by(*(column.asc() for column in _columns))
+
+    def _update_sibling_roms(self, rom_ids: list[int], session: Session) -> None:
+        """Rebuild the sibling pairs of the given roms, from their current ids"""
+        session.execute(
+            delete(SiblingRom)
+            .where(
+                or_(
+                    SiblingRom.rom_id.in_(rom_ids),
+                    SiblingRom.sibling_rom_id.in_(rom_ids),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        rom = aliased(Rom)
+        sibling = aliased(Rom)
+
+        def select_pairs(rom_id_column, sibling_rom_id_column):
+            return (
+                select(
+                    rom_id_column,
+                    sibling_rom_id_column,
+                    rom.platform_id,
+                    case((rom.igdb_id == sibling.igdb_id, rom.igdb_id)),
+                    case((rom.moby_id == sibling.moby_id, rom.moby_id)),
+                ).join(
+                    sibling,
+                    and_(
+                        sibling.platform_id == rom.platform_id,
+                        sibling.id != rom.id,
+                        or_(
+                            and_(
+                                rom.igdb_id.isnot(None),
+                                sibling.igdb_id == rom.igdb_id,
+                            ),
+                            and_(
+                                rom.moby_id.isnot(None),
+                                sibling.moby_id == rom.moby_id,
+                            ),
+                        ),
+                    ),
+                )
+                # Driven from the primary key of the given roms
+                .where(rom.id.in_(rom_ids))
+            )
+
+        # Both directions of each pair
+        session.execute(
+            insert(SiblingRom).from_select(
+                ["rom_id", "sibling_rom_id", "platform_id", "igdb_id", "moby_id"],
+                union(
+                    select_pairs(rom.id, sibling.id), select_pairs(sibling.id, rom.id)
+                ),
+            )
+        )
+
+    def _get_platform_counters(
+        self, where, session: Session
+    ) -> dict[int, PlatformCounters]:
+        """Count the roms matching the criteria, by platform"""
+        rows = session.execute(
+            select(
+                Rom.platform_id,
+                func.count(Rom.id),
+                func.count(case((Rom.is_identified, Rom.id))),
+                func.coalesce(func.sum(Rom.file_size_bytes), 0),
+            )
+            .where(where)
+            .group_by(Rom.platform_id)
+        ).all()
+        return {
+            platform_id: (rom_count, identified_rom_count, int(total_file_size_bytes))
+            for platform_id, rom_count, identified_rom_count, total_file_size_bytes in rows
+        }
+
+    def _update_platform_counters(
+        self,
+        before: dict[int, PlatformCounters],
+        after: dict[int, PlatformCounters],
+        session: Session,
+    ) -> None:
+        """Apply the change of counted roms to the counters of their platforms"""
+        for platform_id in before.keys() | after.keys():
+            rom_count, identified_rom_count, total_file_size_bytes = (
+                new - old
+                for new, old in zip(
+                    after.get(platform_id, (0, 0, 0)),
+                    before.get(platform_id, (0, 0, 0)),
+                )
+            )
+            if not (rom_count or identified_rom_count or total_file_size_bytes):
+                continue
+
+            # Relative updates, so concurrent writes don't overwrite each other
+            session.execute(
+                update(Platform)
+                .where(Platform.id == platform_id)
+                .values(
+                    rom_count=Platform.rom_count + rom_count,
+                    identified_rom_count=Platform.identified_rom_count
+                    + identified_rom_count,
+                    total_file_size_bytes=Platform.total_file_size_bytes
+                    + total_file_size_bytes,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            stats_handler.increment_platform(
+                platform_id,
+                session=session,
+                roms=rom_count,
+                identified_roms=identified_rom_count,
+                filesize=total_file_size_bytes,
+            )
 
     @begin_session
     @with_details
     def add_rom(self, rom: Rom, query: Query = None, session: Session = None) -> Rom:
+        counters_before = (
+            self._get_platform_counters(Rom.id == rom.id, session) if rom.id else {}
+        )
+        sibling_keys_before = (
+            session.execute(
+                select(Rom.platform_id, Rom.igdb_id, Rom.moby_id).filter_by(id=rom.id)
+            ).first()
+            if rom.id
+            else None
+        )
         rom = session.merge(rom)
         session.flush()
+        self._update_platform_counters(
+            counters_before,
+            self._get_platform_counters(Rom.id == rom.id, session),
+            session,
+        )
+        # Most writes, e.g. quick scans updating filesystem data, keep the siblings
+        if sibling_keys_before is None or tuple(sibling_keys_before) != (
+            rom.platform_id,
+            rom.igdb_id,
+            rom.moby_id,
+        ):
+            self._update_sibling_roms([rom.id], session)
 
         return session.scalar(query.filter_by(id=rom.id).limit(1))
 
     @begin_session
     @with_details
     def get_rom(
-        self, id: int, *, query: Query = None, session: Session = None
+        self,
+        id: int,
+        *,
+        user_id: int | None = None,
+        query: Query = None,
+        session: Session = None,
     ) -> Rom | None:
+        """Get a rom, with the assets and user data of every user, or only of
+        `user_id` and the public notes of others if given"""
         return session.scalar(query.filter_by(id=id).limit(1))
 
     @begin_session
@@ -116,17 +362,152 @@ class DBRomsHandler(DBBaseHandler):
         order_dir: str = "asc",
         limit: int | None = None,
         offset: int | None = None,
+        attributes: set[str] | None = None,
+        user_id: int | None = None,
         query: Query = None,
         session: Session = None,
     ) -> list[Rom]:
-        filtered_query = self._filter(
-            query, platform_id, collection_id, search_term, session
-        )
+        if attributes is not None:
+            query = self._project(attributes, user_id)
+
+        filtered_query = self._filter(query, platform_id, collection_id, search_term)
         ordered_query = self._order(filtered_query, order_by, order_dir)
         offset_query = ordered_query.offset(offset)
         limited_query = offset_query.limit(limit)
         return session.scalars(limited_query).unique().all()
 
+    @begin_session
+    @with_simple
+    def get_roms_page(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        platform_id: int | None = None,
+        collection_id: int | None = None,
+        search_term: str = "",
+        order_by: str = "name",
+        order_dir: str = "asc",
+        attributes: set[str] | None = None,
+        user_id: int | None = None,
+        query: Query = None,
+        session: Session = None,
+    ) -> tuple[list[Rom], str | None, str | None]:
+        """Get a page of roms, paginated by their sort key instead of an offset,
+        so every page costs the same to fetch.
+
+        Args:
+            limit: number of roms per page
+            cursor: opaque cursor of the page, as returned for the previous or
+                next page. Defaults to the first page.
+            attributes: only load these columns and relationships of the roms
+            user_id: only load the user data of this user
+
+        Returns:
+            tuple[list[Rom], str | None, str | None]: Roms of the page, and cursors
+                of the next and previous pages, if any
+
+        Raises:
+            ValueError: The cursor is invalid
+        """
+        if attributes is not None:
+            query = self._project(attributes, user_id)
+
+        filtered_query = self._filter(query, platform_id, collection_id, search_term)
+        ordered_query = self._order(filtered_query, order_by, order_dir)
+        page = select_page(
+            session,
+            ordered_query,
+            per_page=limit,
+            page=_decode_cursor(cursor) if cursor else None,
+        )
+
+        return (
+            [row[0] for row in page],
+            _encode_cursor(page.paging.bookmark_next) if page.paging.has_next else None,
+            (
+                _encode_cursor(page.paging.bookmark_previous)
+                if page.paging.has_previous
+                else None
+            ),
+        )
+
+    @begin_session
+    def search_roms(
+        self,
+        search_term: str,
+        *,
+        platform_id: int | None = None,
+        limit: int = 10,
+        session: Session = None,
+    ) -> list[Rom]:
+        """Search roms by name, file name and alternative names, best matches first
+
+        Words are matched by prefix, so partially typed words are found. When there
+        are too few matches, roms with words similar to the terms are added, to
+        tolerate typos.
+
+        Args:
+            search_term: search term, as typed
+            platform_id: only search the roms of this platform
+            limit: maximum number of roms to return
+
+        Returns:
+            list[Rom]: Matching roms, with only their names and covers loaded
+        """
+        terms = parse_search_term(search_term)
+        query = select(Rom).options(
+            load_only(
+                Rom.name,
+                Rom.file_name_no_tags,
+                Rom.platform_id,
+                Rom.path_cover_s,
+                Rom.cover_placeholder,
+            )
+        )
+        if platform_id:
+            query = query.filter(Rom.platform_id == platform_id)
+
+        # Names starting with the search term first, then the most relevant ones
+        ranking = [Rom.sort_name.startswith(search_term.lower(), autoescape=True)]
+        if terms.indexed:
+            ranking.append(self._relevance(terms))
+        roms = list(
+            session.scalars(
+                query.filter(*self._search(terms))
+                .order_by(*(rank.desc() for rank in ranking), Rom.sort_name, Rom.id)
+                .limit(limit)
+            ).all()
+        )
+        if len(roms) >= limit or not terms.indexed:
+            return roms
+
+        # A term with a typo matches no word, look for words close to it instead
+        typo_terms = SearchTerms(
+            indexed=get_typo_prefixes(terms.indexed), unindexed=terms.unindexed
+        )
+        candidates = session.scalars(
+            query.filter(
+                *self._search(typo_terms, required=False),
+                Rom.id.not_in([rom.id for rom in roms]),
+            )
+            .order_by(self._relevance(typo_terms, required=False).desc())
+            .limit(TYPO_CANDIDATES_LIMIT)
+        ).all()
+        scored_candidates = [
+            (get_similarity(terms.indexed, rom.name or rom.file_name_no_tags), rom)
+            for rom in candidates
+        ]
+        roms.extend(
+            rom
+            for similarity, rom in sorted(
+                scored_candidates, key=lambda candidate: candidate[0], reverse=True
+            )[: limit - len(roms)]
+            if similarity >= TYPO_MIN_SIMILARITY
+        )
+
+        return roms
+
     @begin_session
     @with_details
     def get_rom_by_filename(
@@ -158,6 +539,26 @@ class DBRomsHandler(DBBaseHandler):
             query.filter_by(file_name_no_ext=file_name_no_ext).limit(1)
         )
 
+    @begin_session
+    def get_matched_rom_by_filename_no_tags(
+        self,
+        platform_id: int,
+        file_name_no_tags: str,
+        exclude_id: int | None = None,
+        session: Session = None,
+    ) -> Rom | None:
+        """Get a rom in the same platform and with the same file name (without tags)
+        that has already been matched against a metadata provider."""
+        query = select(Rom).filter(
+            Rom.platform_id == platform_id,
+            Rom.file_name_no_tags == file_name_no_tags,
+            or_(Rom.igdb_id.isnot(None), Rom.moby_id.isnot(None)),
+        )
+        if exclude_id:
+            query = query.filter(Rom.id != exclude_id)
+
+        return session.scalar(query.order_by(Rom.id.asc()).limit(1))
+
     @begin_session
     def get_rom_collections(
         self, rom: Rom, session: Session = None
@@ -165,7 +566,8 @@ class DBRomsHandler(DBBaseHandler):
         return (
             session.scalars(
                 select(Collection)
-                .filter(func.json_contains(Collection.roms, f"{rom.id}"))
+                .join(CollectionRom, CollectionRom.collection_id == Collection.id)
+                .filter(CollectionRom.rom_id == rom.id)
                 .order_by(Collection.name.asc())
             )
             .unique()
@@ -174,20 +576,41 @@ class DBRomsHandler(DBBaseHandler):
 
     @begin_session
     def update_rom(self, id: int, data: dict, session: Session = None) -> Rom:
-        return session.execute(
+        counted = bool(PLATFORM_COUNTER_KEYS & data.keys())
+        if counted:
+            counters_before = self._get_platform_counters(Rom.id == id, session)
+
+        result = session.execute(
             update(Rom)
             .where(Rom.id == id)
             .values(**data)
             .execution_options(synchronize_session="evaluate")
         )
+        if counted:
+            self._update_platform_counters(
+                counters_before,
+                self._get_platform_counters(Rom.id == id, session),
+                session,
+            )
+        if SIBLING_ROM_KEYS & data.keys():
+            self._update_sibling_roms([id], session)
+
+        return result
 
     @begin_session
     def delete_rom(self, id: int, session: Session = None) -> Rom:
-        return session.execute(
+        self._update_platform_counters(
+            self._get_platform_counters(Rom.id == id, session), {}, session
+        )
+        result = session.execute(
             delete(Rom)
             .where(Rom.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        # The assets of the rom are deleted along it
+        stats_handler.invalidate(session)
+
+        return result
 
     @begin_session
     def purge_roms(
@@ -204,11 +627,26 @@ class DBRomsHandler(DBBaseHandler):
             .unique()
             .all()
         )
+        self._update_platform_counters(
+            {
+                platform_id: (
+                    len(purged_roms),
+                    sum(rom.is_identified for rom in purged_roms),
+                    sum(rom.file_size_bytes for rom in purged_roms),
+                )
+            },
+            {},
+            session,
+        )
         session.execute(
             delete(Rom)
             .where(and_(Rom.platform_id == platform_id, Rom.file_name.not_in(fs_roms)))  # type: ignore[attr-defined]
             .execution_options(synchronize_session="evaluate")
         )
+        if purged_roms:
+            # The assets of the roms are deleted along them
+            stats_handler.invalidate(session)
+
         return purged_roms
 
     @begin_session
@@ -1,4 +1,5 @@
 from decorators.database import begin_session
+from handler.stats_handler import stats_handler
 from models.assets import Save
 from sqlalchemy import and_, delete, select, update
 from sqlalchemy.orm import Session
@@ -9,7 +10,12 @@ from .base_handler import DBBaseHandler
 class DBSavesHandler(DBBaseHandler):
     @begin_session
     def add_save(self, save: Save, session: Session = None) -> Save:
-        return session.merge(save)
+        is_new = save.id is None
+        save = session.merge(save)
+        if is_new:
+            stats_handler.increment_user(save.user_id, session=session, saves=1)
+
+        return save
 
     @begin_session
     def get_save(self, id: int, session: Session = None) -> Save:
@@ -36,17 +42,24 @@ class DBSavesHandler(DBBaseHandler):
 
     @begin_session
     def delete_save(self, id: int, session: Session = None) -> None:
-        return session.execute(
+        user_id = session.scalar(select(Save.user_id).filter_by(id=id))
+        result = session.execute(
             delete(Save)
             .where(Save.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        if user_id is not None:
+            stats_handler.increment_user(
+                user_id, session=session, saves=-result.rowcount
+            )
+
+        return result
 
     @begin_session
     def purge_saves(
         self, rom_id: int, user_id: int, saves: list[str], session: Session = None
     ) -> None:
-        return session.execute(
+        result = session.execute(
             delete(Save)
             .where(
                 and_(
@@ -57,3 +70,6 @@ class DBSavesHandler(DBBaseHandler):
             )
             .execution_options(synchronize_session="evaluate")
         )
+        stats_handler.increment_user(user_id, session=session, saves=-result.rowcount)
+
+        return result
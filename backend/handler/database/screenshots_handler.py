@@ -1,4 +1,5 @@
 from decorators.database import begin_session
+from handler.stats_handler import stats_handler
 from models.assets import Screenshot
 from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
@@ -11,7 +12,14 @@ class DBScreenshotsHandler(DBBaseHandler):
     def add_screenshot(
         self, screenshot: Screenshot, session: Session = None
     ) -> Screenshot:
-        return session.merge(screenshot)
+        is_new = screenshot.id is None
+        screenshot = session.merge(screenshot)
+        if is_new:
+            stats_handler.increment_user(
+                screenshot.user_id, session=session, screenshots=1
+            )
+
+        return screenshot
 
     @begin_session
     def get_screenshot(self, id, session: Session = None) -> Screenshot:
@@ -40,17 +48,24 @@ class DBScreenshotsHandler(DBBaseHandler):
 
     @begin_session
     def delete_screenshot(self, id: int, session: Session = None) -> None:
-        return session.execute(
+        user_id = session.scalar(select(Screenshot.user_id).filter_by(id=id))
+        result = session.execute(
             delete(Screenshot)
             .where(Screenshot.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        if user_id is not None:
+            stats_handler.increment_user(
+                user_id, session=session, screenshots=-result.rowcount
+            )
+
+        return result
 
     @begin_session
     def purge_screenshots(
         self, rom_id: int, user_id: int, screenshots: list[str], session: Session = None
     ) -> None:
-        return session.execute(
+        result = session.execute(
             delete(Screenshot)
             .where(
                 Screenshot.rom_id == rom_id,
@@ -59,3 +74,8 @@ class DBScreenshotsHandler(DBBaseHandler):
             )
             .execution_options(synchronize_session="evaluate")
         )
+        stats_handler.increment_user(
+            user_id, session=session, screenshots=-result.rowcount
+        )
+
+        return result
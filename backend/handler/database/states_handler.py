@@ -1,4 +1,5 @@
 from decorators.database import begin_session
+from handler.stats_handler import stats_handler
 from models.assets import State
 from sqlalchemy import and_, delete, select, update
 from sqlalchemy.orm import Session
@@ -9,7 +10,12 @@ from .base_handler import DBBaseHandler
 class DBStatesHandler(DBBaseHandler):
     @begin_session
     def add_state(self, state: State, session: Session = None) -> State:
-        return session.merge(state)
+        is_new = state.id is None
+        state = session.merge(state)
+        if is_new:
+            stats_handler.increment_user(state.user_id, session=session, states=1)
+
+        return state
 
     @begin_session
     def get_state(self, id: int, session: Session = None) -> State:
@@ -36,17 +42,24 @@ class DBStatesHandler(DBBaseHandler):
 
     @begin_session
     def delete_state(self, id: int, session: Session = None) -> None:
-        return session.execute(
+        user_id = session.scalar(select(State.user_id).filter_by(id=id))
+        result = session.execute(
             delete(State)
             .where(State.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        if user_id is not None:
+            stats_handler.increment_user(
+                user_id, session=session, states=-result.rowcount
+            )
+
+        return result
 
     @begin_session
     def purge_states(
         self, rom_id: int, user_id: int, states: list[str], session: Session = None
     ) -> None:
-        return session.execute(
+        result = session.execute(
             delete(State)
             .where(
                 and_(
@@ -57,3 +70,6 @@ class DBStatesHandler(DBBaseHandler):
             )
             .execution_options(synchronize_session="evaluate")
         )
+        stats_handler.increment_user(user_id, session=session, states=-result.rowcount)
+
+        return result
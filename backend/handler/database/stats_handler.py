@@ -1,7 +1,7 @@
 from decorators.database import begin_session
 from models.assets import Save, Screenshot, State
-from models.rom import Rom
-from sqlalchemy import distinct, func, select
+from models.platform import Platform
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from .base_handler import DBBaseHandler
@@ -12,12 +12,12 @@ class DBStatsHandler(DBBaseHandler):
     def get_platforms_count(self, session: Session = None) -> int:
         """Get the number of platforms with any roms."""
         return session.scalar(
-            select(func.count(distinct(Rom.platform_id))).select_from(Rom)
+            select(func.count()).select_from(Platform).where(Platform.rom_count > 0)
         )
 
     @begin_session
     def get_roms_count(self, session: Session = None) -> int:
-        return session.scalar(select(func.count()).select_from(Rom))
+        return session.scalar(select(func.coalesce(func.sum(Platform.rom_count), 0)))
 
     @begin_session
     def get_saves_count(self, session: Session = None) -> int:
@@ -34,6 +34,50 @@ class DBStatsHandler(DBBaseHandler):
     @begin_session
     def get_total_filesize(self, session: Session = None) -> int:
         """Get the total filesize of all roms in the database, in bytes."""
-        return (
-            session.scalar(select(func.sum(Rom.file_size_bytes)).select_from(Rom)) or 0
+        return session.scalar(
+            select(func.coalesce(func.sum(Platform.total_file_size_bytes), 0))
         )
+
+    @begin_session
+    def get_platforms_stats(
+        self, session: Session = None
+    ) -> list[tuple[int, dict[str, int]]]:
+        """Get the rom counters of every platform."""
+        return [
+            (
+                platform.id,
+                {
+                    "roms": platform.rom_count,
+                    "identified_roms": platform.identified_rom_count,
+                    "filesize": platform.total_file_size_bytes,
+                },
+            )
+            for platform in session.execute(
+                select(
+                    Platform.id,
+                    Platform.rom_count,
+                    Platform.identified_rom_count,
+                    Platform.total_file_size_bytes,
+                )
+            ).all()
+        ]
+
+    @begin_session
+    def get_users_stats(
+        self, session: Session = None
+    ) -> list[tuple[int, dict[str, int]]]:
+        """Get the number of saves, states and screenshots of every user."""
+        users_stats: dict[int, dict[str, int]] = {}
+        for field, asset in (
+            ("saves", Save),
+            ("states", State),
+            ("screenshots", Screenshot),
+        ):
+            for user_id, count in session.execute(
+                select(asset.user_id, func.count()).group_by(asset.user_id)
+            ).all():
+                users_stats.setdefault(
+                    user_id, {"saves": 0, "states": 0, "screenshots": 0}
+                )[field] = count
+
+        return list(users_stats.items())
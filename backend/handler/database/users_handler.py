@@ -1,4 +1,6 @@
 from decorators.database import begin_session
+from handler.library_handler import library_handler
+from handler.stats_handler import stats_handler
 from models.user import Role, User
 from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
@@ -23,6 +25,10 @@ class DBUsersHandler(DBBaseHandler):
 
     @begin_session
     def update_user(self, id: int, data: dict, session: Session = None) -> User:
+        if "username" in data:
+            # Usernames are rendered along the collections
+            library_handler.mark_changed(session)
+
         return session.execute(
             update(User)
             .where(User.id == id)
@@ -36,11 +42,15 @@ class DBUsersHandler(DBBaseHandler):
 
     @begin_session
     def delete_user(self, id: int, session: Session = None):
-        return session.execute(
+        result = session.execute(
             delete(User)
             .where(User.id == id)
             .execution_options(synchronize_session="evaluate")
         )
+        # The assets of the user are deleted along it
+        stats_handler.invalidate(session)
+
+        return result
 
     @begin_session
     def get_admin_users(self, session: Session = None) -> list[User]:
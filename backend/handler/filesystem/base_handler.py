@@ -71,6 +71,12 @@ class CoverSize(Enum):
     BIG = "big"
 
 
+class ImageVariantFormat(Enum):
+    WEBP = "webp"
+    AVIF = "avif"
+    JPEG = "jpeg"
+
+
 class Asset(Enum):
     SAVES = "saves"
     STATES = "states"
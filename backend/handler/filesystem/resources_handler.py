@@ -1,39 +1,155 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
 import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Final
 
 import httpx
-from anyio import Path, open_file
-from config import RESOURCES_BASE_PATH
+from anyio import Path
+from config import (
+    IMAGE_VARIANTS_CACHE_MAX_SIZE_MB,
+    IMAGE_VARIANTS_CACHE_PATH,
+    RESOURCES_BASE_PATH,
+    RESOURCES_STORE_PATH,
+)
 from fastapi import HTTPException, status
+from handler.redis_handler import sync_cache
 from logger.logger import log
 from models.collection import Collection
 from models.rom import Rom
-from PIL import Image, ImageFile
-from utils.context import ctx_httpx_client
+from PIL import Image, ImageFile, ImageOps, UnidentifiedImageError
+from utils.downloader import DownloadResult, downloader
 
-from .base_handler import CoverSize, FSHandler
+from .base_handler import CoverSize, FSHandler, ImageVariantFormat
+
+# Decoding and resizing images is CPU bound, so it's kept out of the event loop
+IMAGE_WORKERS: Final = min(4, os.cpu_count() or 1)
+image_executor = ThreadPoolExecutor(
+    max_workers=IMAGE_WORKERS, thread_name_prefix="romm-images"
+)
+
+# Requested widths are rounded up to one of these, to bound the number of variants
+IMAGE_VARIANT_WIDTHS: Final = (64, 128, 256, 384, 512, 768, 1024, 1536)
+IMAGE_VARIANT_SAVE_PARAMS: Final[dict[ImageVariantFormat, dict[str, Any]]] = {
+    ImageVariantFormat.WEBP: {"quality": 80, "method": 4},
+    ImageVariantFormat.AVIF: {"quality": 60},
+    ImageVariantFormat.JPEG: {"quality": 85, "optimize": True, "progressive": True},
+}
+IMAGE_VARIANTS_CACHE_MAX_SIZE: Final = IMAGE_VARIANTS_CACHE_MAX_SIZE_MB * 1024 * 1024
+
+# Small covers of a page of roms, packed in a single image
+COVER_ATLAS_TILE_SIZE: Final = (128, 192)
+COVER_ATLAS_COLUMNS: Final = 10
+# Keeps the atlas under ~10 MB once decoded to RGBA
+COVER_ATLAS_MAX_TILES: Final = 100
+COVER_ATLAS_KEY_PATTERN: Final = re.compile(r"[0-9a-f]{40}")
+
+# Tiny cover rendered by clients while the real one loads
+COVER_PLACEHOLDER_SIZE: Final = 16
+COVER_PLACEHOLDER_QUALITY: Final = 40
+
+# Content-addressed store: resource files of every entity are hard links to a
+# single copy of each file, named after its SHA-256 hash. The link count of a
+# stored file is its reference count.
+RESOURCES_URL_HASHES_KEY: Final = "romm:resources:url_hashes"
+# HTTP validators of each fetched url, to revalidate it with conditional requests
+RESOURCES_URL_VALIDATORS_KEY: Final = "romm:resources:url_validators"
+RESOURCES_SMALL_COVER_HASHES_KEY: Final = "romm:resources:small_cover_hashes"
+# Recently linked files are kept by the garbage collection, to avoid racing a scan
+RESOURCES_STORE_GC_GRACE_PERIOD: Final = 60 * 10  # 10 minutes
+
+# Resource files are named after their content, e.g. `cover/big.<hash>.png`, so a
+# resource URL always serves the same content and can be cached forever
+RESOURCE_VERSION_LENGTH: Final = 16
+VERSIONED_RESOURCE_PATTERN: Final = re.compile(
+    rf"\.[0-9a-f]{{{RESOURCE_VERSION_LENGTH}}}\.[A-Za-z0-9]+$"
+)
+
+
+def save_image_atomically(
+    img: Image.Image, save_path: str | Path, **params: Any
+) -> None:
+    """Save an image through a temporary file, so it's replaced atomically."""
+    folder, file_name = os.path.split(save_path)
+    tmp_path = os.path.join(folder, f".{uuid.uuid4().hex}.{file_name}")
+    try:
+        img.save(tmp_path, **params)
+        os.replace(tmp_path, save_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 class FSResourcesHandler(FSHandler):
+    def __init__(self) -> None:
+        # Size of the image variants cache, computed lazily and shared by the threads
+        self._variants_cache_size: int | None = None
+        self._variants_cache_lock = threading.Lock()
+
     @staticmethod
-    async def cover_exists(entity: Rom | Collection, size: CoverSize) -> bool:
+    def _find_covers(entity: Rom | Collection) -> dict[CoverSize, str]:
+        """Find the cover variants of an entity in filesystem
+
+        The cover paths recorded on the entity are the index of its variants, and
+        are verified with a stat each. The cover folder is only listed when they
+        are missing or stale.
+
+        Returns:
+            dict[CoverSize, str]: Existing variants, relative to the resources folder
+        """
+        recorded_covers = {
+            CoverSize.SMALL: entity.path_cover_s,
+            CoverSize.BIG: entity.path_cover_l,
+        }
+        if all(
+            path and os.path.isfile(f"{RESOURCES_BASE_PATH}/{path}")
+            for path in recorded_covers.values()
+        ):
+            return recorded_covers  # type: ignore[return-value]
+
+        covers: dict[CoverSize, str] = {}
+        cover_path = f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover"
+        try:
+            with os.scandir(cover_path) as entries:
+                for entry in entries:
+                    size_name, _, ext = entry.name.partition(".")
+                    # Skip files still being written, see `Downloader`
+                    if ext.endswith(".tmp"):
+                        continue
+                    for size in CoverSize:
+                        if size.value == size_name:
+                            covers[size] = (
+                                f"{entity.fs_resources_path}/cover/{entry.name}"
+                            )
+        except FileNotFoundError:
+            pass
+
+        return covers
+
+    @classmethod
+    async def cover_exists(cls, entity: Rom | Collection, size: CoverSize) -> bool:
         """Check if rom cover exists in filesystem
 
         Args:
-            fs_slug: short name of the platform
-            rom_name: name of rom file
+            entity: rom or collection the cover belongs to
             size: size of the cover
         Returns
             True if cover exists in filesystem else False
         """
-        async for _ in Path(
-            f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover"
-        ).glob(f"{size.value}.*"):
-            # At least one file found.
-            return True
-        return False
+        return size in await asyncio.to_thread(cls._find_covers, entity)
 
     @staticmethod
-    def resize_cover_to_small(cover: ImageFile.ImageFile, save_path: Path) -> None:
+    def resize_cover_to_small(
+        cover: ImageFile.ImageFile, save_path: str | Path
+    ) -> None:
         """Resize cover to small size, and save it to filesystem."""
         if cover.height >= 1000:
             ratio = 0.2
@@ -42,57 +158,310 @@ class FSResourcesHandler(FSHandler):
         small_width = int(cover.width * ratio)
         small_height = int(cover.height * ratio)
         small_size = (small_width, small_height)
+        # Let JPEG covers be decoded at a reduced scale, when not loaded yet
+        cover.draft(cover.mode, small_size)
         small_img = cover.resize(small_size)
-        small_img.save(save_path)
+        save_image_atomically(small_img, save_path)
 
-    async def _store_cover(
-        self, entity: Rom | Collection, url_cover: str, size: CoverSize
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        hasher = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 64), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def is_versioned_resource(path: str) -> bool:
+        """Whether a resource path is named after its content"""
+        return bool(VERSIONED_RESOURCE_PATTERN.search(path))
+
+    @classmethod
+    def _publish_file(cls, file_path: str, content_hash: str | None = None) -> str:
+        """Rename a resource file after its content, replacing its previous versions
+
+        Args:
+            file_path: resource file, e.g. `cover/big.png`
+            content_hash: hash of the file, if already known
+
+        Returns:
+            str: Path of the versioned file, relative to the resources folder
+        """
+        content_hash = content_hash or cls._hash_file(file_path)
+        folder, file_name = os.path.split(file_path)
+        stem, ext = os.path.splitext(file_name)
+        versioned_name = f"{stem}.{content_hash[:RESOURCE_VERSION_LENGTH]}{ext}"
+        os.replace(file_path, os.path.join(folder, versioned_name))
+
+        previous_version = re.compile(
+            rf"{re.escape(stem)}\.[0-9a-f]{{{RESOURCE_VERSION_LENGTH}}}\.[A-Za-z0-9]+"
+        )
+        for entry in os.scandir(folder):
+            if entry.name != versioned_name and previous_version.fullmatch(entry.name):
+                os.remove(entry.path)
+
+        return os.path.relpath(
+            os.path.join(folder, versioned_name), RESOURCES_BASE_PATH
+        )
+
+    @staticmethod
+    def _get_store_path(content_hash: str) -> str:
+        return f"{RESOURCES_STORE_PATH}/{content_hash[:2]}/{content_hash}"
+
+    @classmethod
+    def _link_from_store(cls, content_hash: str, file_path: str) -> bool:
+        """Replace a resource file with a hard link to a file in the store
+
+        Returns:
+            bool: Whether the file is in the store and was linked
+        """
+        store_path = cls._get_store_path(content_hash)
+        folder, file_name = os.path.split(file_path)
+        tmp_path = os.path.join(folder, f".{uuid.uuid4().hex}.{file_name}")
+        try:
+            os.makedirs(folder, exist_ok=True)
+            os.link(store_path, tmp_path)
+            os.replace(tmp_path, file_path)
+            return True
+        except OSError:
+            return False
+        finally:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def _intern_file(cls, file_path: str) -> str | None:
+        """Add a resource file to the store, or link it to an identical stored file
+
+        Returns:
+            str | None: Hash of the file, or None if it couldn't be stored
+        """
+        content_hash = cls._hash_file(file_path)
+        store_path = cls._get_store_path(content_hash)
+        try:
+            if not os.path.exists(store_path):
+                os.makedirs(os.path.dirname(store_path), exist_ok=True)
+                os.link(file_path, store_path)
+            elif not os.path.samefile(file_path, store_path):
+                if not cls._link_from_store(content_hash, file_path):
+                    return None
+        except OSError:
+            # e.g. the filesystem doesn't support hard links
+            log.debug(f"Couldn't add {file_path} to the resources store")
+            return None
+
+        return content_hash
+
+    @classmethod
+    def _get_stored_url(cls, url: str) -> tuple[str | None, dict[str, Any]]:
+        """Hash and HTTP validators of the stored copy of a previously fetched url"""
+        content_hash = sync_cache.hget(RESOURCES_URL_HASHES_KEY, url)
+        validators = sync_cache.hget(RESOURCES_URL_VALIDATORS_KEY, url)
+        if not content_hash:
+            return None, {}
+
+        validators = json.loads(validators) if validators else {}
+        # A stored copy that doesn't match the fetched size can't be trusted
+        try:
+            stored_size = os.path.getsize(cls._get_store_path(content_hash))
+        except OSError:
+            return None, {}
+        if validators.get("size") not in (None, stored_size):
+            return None, {}
+
+        return content_hash, validators
+
+    @classmethod
+    def _intern_url_file(
+        cls, url: str, file_path: str, download: DownloadResult
     ) -> None:
-        """Store roms resources in filesystem
+        """Add a file fetched from a url to the store, and remember its hash and
+        HTTP validators"""
+        content_hash = cls._intern_file(file_path)
+        if not content_hash:
+            return
+
+        sync_cache.hset(RESOURCES_URL_HASHES_KEY, url, content_hash)
+        validators = {
+            "etag": download.headers.get("ETag"),
+            "last_modified": download.headers.get("Last-Modified"),
+        }
+        if any(validators.values()):
+            validators["size"] = os.path.getsize(file_path)
+            sync_cache.hset(RESOURCES_URL_VALIDATORS_KEY, url, json.dumps(validators))
+        else:
+            sync_cache.hdel(RESOURCES_URL_VALIDATORS_KEY, url)
+
+    @classmethod
+    async def _fetch_resource(cls, url: str, file_path: str) -> bool:
+        """Fetch a remote resource file, reusing the stored copy if it's unchanged
+
+        Urls fetched before are revalidated with a conditional request when
+        their server provided validators, and are otherwise assumed immutable.
+
+        Returns:
+            bool: Whether the resource file was stored
+
+        Raises:
+            httpx.NetworkError: The host couldn't be reached
+        """
+        loop = asyncio.get_running_loop()
+        content_hash, validators = await loop.run_in_executor(
+            image_executor, cls._get_stored_url, url
+        )
+
+        headers = {}
+        if content_hash:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+            if not headers and await loop.run_in_executor(
+                image_executor, cls._link_from_store, content_hash, file_path
+            ):
+                return True
+
+        download = await downloader.download(url, file_path, headers=headers)
+        if content_hash and download and not download.modified:
+            if await loop.run_in_executor(
+                image_executor, cls._link_from_store, content_hash, file_path
+            ):
+                return True
+            # The stored copy is gone, fetch it again
+            download = await downloader.download(url, file_path)
+
+        if not download:
+            return False
+
+        await loop.run_in_executor(
+            image_executor, cls._intern_url_file, url, file_path, download
+        )
+        return True
+
+    @staticmethod
+    def _collect_store_garbage() -> int:
+        removed_files = 0
+        expired_at = time.time() - RESOURCES_STORE_GC_GRACE_PERIOD
+        if not os.path.isdir(RESOURCES_STORE_PATH):
+            return removed_files
+
+        for folder in os.scandir(RESOURCES_STORE_PATH):
+            if not folder.is_dir():
+                continue
+            for entry in os.scandir(folder.path):
+                stat = entry.stat()
+                # Linking a file updates its ctime
+                if stat.st_nlink <= 1 and stat.st_ctime < expired_at:
+                    try:
+                        os.remove(entry.path)
+                        removed_files += 1
+                    except FileNotFoundError:
+                        pass
+
+        return removed_files
+
+    async def collect_store_garbage(self) -> None:
+        """Remove stored resource files no longer referenced by any entity"""
+        removed_files = await asyncio.get_running_loop().run_in_executor(
+            image_executor, self._collect_store_garbage
+        )
+        if removed_files:
+            log.info(f"Removed {removed_files} unreferenced resource files")
+
+    @classmethod
+    def _write_cover_variants(
+        cls, cover_path: str, file_ext: str, content: bytes | None = None
+    ) -> tuple[str, str]:
+        """Derive the cover variants from a single decode of the big cover.
 
         Args:
-            fs_slug: short name of the platform
-            rom_name: name of rom file
+            cover_path: folder where the cover variants are stored
+            file_ext: extension of the cover files
+            content: original cover image, to be encoded as the big cover. If not
+                provided, the big cover is read from the filesystem.
+
+        Returns:
+            tuple[str, str]: Versioned paths of the small and big covers
+        """
+        big_cover_file = f"{cover_path}/{CoverSize.BIG.value}.{file_ext}"
+        small_cover_file = f"{cover_path}/{CoverSize.SMALL.value}.{file_ext}"
+
+        if content:
+            with Image.open(BytesIO(content)) as img:
+                save_image_atomically(img, big_cover_file)
+                cls.resize_cover_to_small(img, save_path=small_cover_file)
+            big_hash = cls._intern_file(big_cover_file)
+            small_hash = cls._intern_file(small_cover_file)
+        else:
+            big_hash = cls._intern_file(big_cover_file)
+            # The small cover is derived from the big one, so it can be reused
+            small_hash = big_hash and sync_cache.hget(
+                RESOURCES_SMALL_COVER_HASHES_KEY, big_hash
+            )
+            if not small_hash or not cls._link_from_store(small_hash, small_cover_file):
+                with Image.open(big_cover_file) as img:
+                    cls.resize_cover_to_small(img, save_path=small_cover_file)
+                small_hash = cls._intern_file(small_cover_file)
+
+        if big_hash and small_hash:
+            sync_cache.hset(RESOURCES_SMALL_COVER_HASHES_KEY, big_hash, small_hash)
+
+        return (
+            cls._publish_file(small_cover_file, small_hash),
+            cls._publish_file(big_cover_file, big_hash),
+        )
+
+    async def store_cover_content(
+        self, cover_path: str, content: bytes, file_ext: str
+    ) -> tuple[str, str]:
+        """Store an uploaded cover and its variants, processing the image in a worker thread
+
+        Args:
+            cover_path: folder where the cover variants are stored
+            content: original cover image
+            file_ext: extension of the cover files
+
+        Returns:
+            tuple[str, str]: Versioned paths of the small and big covers
+        """
+        await Path(cover_path).mkdir(parents=True, exist_ok=True)
+        return await asyncio.get_running_loop().run_in_executor(
+            image_executor, self._write_cover_variants, cover_path, file_ext, content
+        )
+
+    async def _store_cover(
+        self, entity: Rom | Collection, url_cover: str
+    ) -> tuple[str, str] | None:
+        """Download a cover once, and store all its variants in filesystem
+
+        Args:
+            entity: rom or collection the cover belongs to
             url_cover: url to get the cover
-            size: size of the cover
+
+        Returns:
+            tuple[str, str] | None: Versioned paths of the small and big covers,
+                or None if the cover couldn't be stored
         """
-        cover_path = Path(f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover")
-        cover_file = cover_path / Path(f"{size.value}.png")
+        cover_path = f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover"
+        big_cover_file = f"{cover_path}/{CoverSize.BIG.value}.png"
 
-        httpx_client = ctx_httpx_client.get()
         try:
-            async with httpx_client.stream("GET", url_cover, timeout=120) as response:
-                if response.status_code == 200:
-                    await cover_path.mkdir(parents=True, exist_ok=True)
-                    async with await cover_file.open("wb") as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
+            # Covers already fetched, e.g. for another entity, aren't downloaded
+            if not await self._fetch_resource(url_cover, big_cover_file):
+                return None
         except httpx.NetworkError as exc:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=f"Unable to fetch cover at {url_cover}: {str(exc)}",
             ) from exc
-        except httpx.ProtocolError:
-            log.warning(f"Failure writing cover {url_cover} to file (ProtocolError)")
 
-        if size == CoverSize.SMALL:
-            with Image.open(cover_file) as img:
-                self.resize_cover_to_small(img, save_path=cover_file)
-
-    @staticmethod
-    async def _get_cover_path(entity: Rom | Collection, size: CoverSize) -> str:
-        """Returns rom cover filesystem path adapted to frontend folder structure
-
-        Args:
-            fs_slug: short name of the platform
-            file_name: name of rom file
-            size: size of the cover
-        """
-        async for matched_file in Path(
-            f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover"
-        ).glob(f"{size.value}.*"):
-            return str(matched_file.relative_to(RESOURCES_BASE_PATH))
-        return ""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                image_executor, self._write_cover_variants, cover_path, "png"
+            )
+        except OSError:
+            log.warning(f"Failure processing cover {url_cover}", exc_info=True)
+            return None
 
     async def get_cover(
         self, entity: Rom | Collection | None, overwrite: bool, url_cover: str = ""
@@ -100,32 +469,71 @@ class FSResourcesHandler(FSHandler):
         if not entity:
             return "", ""
 
-        small_cover_exists = await self.cover_exists(entity, CoverSize.SMALL)
-        if url_cover and (overwrite or not small_cover_exists):
-            await self._store_cover(entity, url_cover, CoverSize.SMALL)
-            small_cover_exists = await self.cover_exists(entity, CoverSize.SMALL)
-        path_cover_s = (
-            (await self._get_cover_path(entity, CoverSize.SMALL))
-            if small_cover_exists
-            else ""
-        )
+        covers = await asyncio.to_thread(self._find_covers, entity)
+        if url_cover and (
+            overwrite or CoverSize.SMALL not in covers or CoverSize.BIG not in covers
+        ):
+            stored_covers = await self._store_cover(entity, url_cover)
+            if stored_covers:
+                return stored_covers
 
-        big_cover_exists = await self.cover_exists(entity, CoverSize.BIG)
-        if url_cover and (overwrite or not big_cover_exists):
-            await self._store_cover(entity, url_cover, CoverSize.BIG)
-            big_cover_exists = await self.cover_exists(entity, CoverSize.BIG)
-        path_cover_l = (
-            (await self._get_cover_path(entity, CoverSize.BIG))
-            if big_cover_exists
-            else ""
-        )
+        return covers.get(CoverSize.SMALL, ""), covers.get(CoverSize.BIG, "")
+
+    @staticmethod
+    def _build_cover_placeholder(cover_file: str) -> dict[str, str]:
+        with Image.open(cover_file) as img:
+            img.draft("RGB", (COVER_PLACEHOLDER_SIZE, COVER_PLACEHOLDER_SIZE))
+            thumbnail = img.convert("RGB")
+        thumbnail.thumbnail((COVER_PLACEHOLDER_SIZE, COVER_PLACEHOLDER_SIZE))
+
+        # Most frequent color once the thumbnail is reduced to a few colors
+        palette_img = thumbnail.quantize(colors=8)
+        _, color_index = max(palette_img.getcolors())
+        palette = palette_img.getpalette() or []
+        red, green, blue = palette[color_index * 3 : color_index * 3 + 3]
+
+        image_format = "webp" if ".webp" in Image.registered_extensions() else "png"
+        buffer = BytesIO()
+        thumbnail.save(buffer, image_format, quality=COVER_PLACEHOLDER_QUALITY)
+        encoded = base64.b64encode(buffer.getvalue()).decode()
+
+        return {
+            "cover_placeholder": f"data:image/{image_format};base64,{encoded}",
+            "cover_color": f"#{red:02x}{green:02x}{blue:02x}",
+        }
+
+    async def get_cover_placeholder(self, path_cover_s: str) -> dict[str, str]:
+        """Build the placeholder and dominant color of a cover, from its small variant
+
+        Args:
+            path_cover_s: path of the small cover, relative to the resources folder
+
+        Returns:
+            dict[str, str]: `cover_placeholder` data URI and `cover_color` hex code
+        """
+        if not path_cover_s:
+            return {"cover_placeholder": "", "cover_color": ""}
 
-        return path_cover_s, path_cover_l
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                image_executor,
+                self._build_cover_placeholder,
+                f"{RESOURCES_BASE_PATH}/{path_cover_s}",
+            )
+        except (OSError, UnidentifiedImageError):
+            log.warning(f"Failure building placeholder of cover {path_cover_s}")
+            return {"cover_placeholder": "", "cover_color": ""}
 
     @staticmethod
     def remove_cover(entity: Rom | Collection | None):
+        empty_cover = {
+            "path_cover_s": "",
+            "path_cover_l": "",
+            "cover_placeholder": "",
+            "cover_color": "",
+        }
         if not entity:
-            return {"path_cover_s": "", "path_cover_l": ""}
+            return empty_cover
 
         cover_path = f"{RESOURCES_BASE_PATH}/{entity.fs_resources_path}/cover"
         try:
@@ -135,7 +543,7 @@ class FSResourcesHandler(FSHandler):
                 f"Couldn't remove cover from '{entity.name or entity.id}' since '{cover_path}' doesn't exists."
             )
 
-        return {"path_cover_s": "", "path_cover_l": ""}
+        return empty_cover
 
     @staticmethod
     async def build_artwork_path(entity: Rom | Collection | None, file_ext: str):
@@ -151,45 +559,35 @@ class FSResourcesHandler(FSHandler):
         return path_cover_l, path_cover_s, artwork_path
 
     @staticmethod
-    async def _store_screenshot(rom: Rom, url: str, idx: int):
+    async def _store_screenshot(rom: Rom, url: str, idx: int) -> str:
         """Store roms resources in filesystem
 
         Args:
             fs_slug: short name of the platform
             file_name: name of rom
             url: url to get the screenshot
+
+        Returns:
+            str: Versioned path of the screenshot, or an empty string if not stored
         """
         screenshot_file = f"{idx}.jpg"
         screenshot_path = f"{RESOURCES_BASE_PATH}/{rom.fs_resources_path}/screenshots"
 
-        httpx_client = ctx_httpx_client.get()
+        screenshot_file_path = f"{screenshot_path}/{screenshot_file}"
+
         try:
-            async with httpx_client.stream("GET", url, timeout=120) as response:
-                if response.status_code == 200:
-                    await Path(screenshot_path).mkdir(parents=True, exist_ok=True)
-                    async with await open_file(
-                        f"{screenshot_path}/{screenshot_file}", "wb"
-                    ) as f:
-                        async for chunk in response.aiter_raw():
-                            await f.write(chunk)
+            # Screenshots already fetched, e.g. for another rom, aren't downloaded
+            if not await FSResourcesHandler._fetch_resource(url, screenshot_file_path):
+                return ""
         except httpx.NetworkError as exc:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=f"Unable to fetch screenshot at {url}: {str(exc)}",
             ) from exc
-        except httpx.ProtocolError:
-            log.warning(f"Failure writing screenshot {url} to file (ProtocolError)")
-
-    @staticmethod
-    def _get_screenshot_path(rom: Rom, idx: str):
-        """Returns rom cover filesystem path adapted to frontend folder structure
 
-        Args:
-            fs_slug: short name of the platform
-            file_name: name of rom
-            idx: index number of screenshot
-        """
-        return f"{rom.fs_resources_path}/screenshots/{idx}.jpg"
+        return await asyncio.get_running_loop().run_in_executor(
+            image_executor, FSResourcesHandler._publish_file, screenshot_file_path
+        )
 
     async def get_rom_screenshots(
         self, rom: Rom | None, url_screenshots: list
@@ -197,9 +595,250 @@ class FSResourcesHandler(FSHandler):
         if not rom:
             return []
 
-        path_screenshots: list[str] = []
-        for idx, url in enumerate(url_screenshots):
-            await self._store_screenshot(rom, url, idx)
-            path_screenshots.append(self._get_screenshot_path(rom, str(idx)))
+        # Downloads are bounded per host by the downloader
+        screenshots = await asyncio.gather(
+            *(
+                self._store_screenshot(rom, url, idx)
+                for idx, url in enumerate(url_screenshots)
+            )
+        )
+
+        return [screenshot for screenshot in screenshots if screenshot]
+
+    @staticmethod
+    def get_image_variant_format(
+        image_format: ImageVariantFormat,
+    ) -> ImageVariantFormat:
+        """Fall back to WebP when AVIF encoding isn't available in Pillow"""
+        if (
+            image_format == ImageVariantFormat.AVIF
+            and ".avif" not in Image.registered_extensions()
+        ):
+            return ImageVariantFormat.WEBP
+
+        return image_format
+
+    @staticmethod
+    def _build_image_variant(
+        source_path: str,
+        variant_path: str,
+        width: int,
+        image_format: ImageVariantFormat,
+    ) -> None:
+        with Image.open(source_path) as source:
+            img = source
+            # Palette, 1-bit and other modes can't be reduced nor resampled
+            if img.mode not in ("RGB", "RGBA", "L", "LA"):
+                img = img.convert("RGBA" if img.has_transparency_data else "RGB")
+
+            if img.width > width:
+                height = max(1, round(img.height * width / img.width))
+                # Let JPEG images be decoded at a reduced scale
+                img.draft(img.mode, (width, height))
+                # Cheap integer downscale first, then resample to the exact size
+                factor = min(img.width // width, img.height // height)
+                resized = img.reduce(factor) if factor >= 2 else img
+                resized = resized.resize((width, height), Image.Resampling.LANCZOS)
+            else:
+                resized = img.copy()
+
+        if image_format == ImageVariantFormat.JPEG and resized.mode not in ("RGB", "L"):
+            resized = resized.convert("RGB")
+
+        save_image_atomically(
+            resized, variant_path, **IMAGE_VARIANT_SAVE_PARAMS[image_format]
+        )
+
+    def _evict_image_variants(self, added_path: str) -> None:
+        """Keep the image variants cache under its size limit, evicting the least
+        recently used variants first, except for the one just added."""
+        with self._variants_cache_lock:
+            if self._variants_cache_size is not None:
+                self._variants_cache_size += os.path.getsize(added_path)
+                if self._variants_cache_size <= IMAGE_VARIANTS_CACHE_MAX_SIZE:
+                    return
+
+            entries = [
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in os.scandir(IMAGE_VARIANTS_CACHE_PATH)
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+            total_size = sum(size for _, size, _ in entries)
+
+            if total_size > IMAGE_VARIANTS_CACHE_MAX_SIZE:
+                # Evict down to 90% of the limit, to avoid evicting on every write
+                target_size = IMAGE_VARIANTS_CACHE_MAX_SIZE * 0.9
+                for _, size, path in sorted(entries):
+                    if total_size <= target_size:
+                        break
+                    if path == added_path:
+                        continue
+                    try:
+                        os.remove(path)
+                        total_size -= size
+                    except FileNotFoundError:
+                        pass
+
+            self._variants_cache_size = total_size
+
+    def _get_image_variant(
+        self, source_path: str, width: int, image_format: ImageVariantFormat
+    ) -> str:
+        source_stat = os.stat(source_path)
+        # The source modification time is part of the key, so variants of
+        # replaced images are never served
+        variant_key = hashlib.sha1(
+            f"{source_path}:{source_stat.st_mtime_ns}:{width}".encode()
+        ).hexdigest()
+        variant_path = os.path.join(
+            IMAGE_VARIANTS_CACHE_PATH, f"{variant_key}.{image_format.value}"
+        )
+
+        try:
+            # The modification time tracks the last access, for the LRU eviction
+            os.utime(variant_path)
+            return variant_path
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(IMAGE_VARIANTS_CACHE_PATH, exist_ok=True)
+        self._build_image_variant(source_path, variant_path, width, image_format)
+        self._evict_image_variants(variant_path)
+
+        return variant_path
+
+    async def get_image_variant(
+        self, path: str, width: int | None, image_format: ImageVariantFormat
+    ) -> str | None:
+        """Get a resized and re-encoded variant of a resource image, generating it if needed
+
+        Args:
+            path: path of the image, relative to the resources folder
+            width: requested width, rounded up to one of the supported widths
+            image_format: format of the variant
+
+        Returns:
+            str | None: Path of the variant, or None if the image doesn't exist
+        """
+        source_path = os.path.normpath(os.path.join(RESOURCES_BASE_PATH, path))
+        if not source_path.startswith(
+            os.path.join(RESOURCES_BASE_PATH, "")
+        ) or not os.path.isfile(source_path):
+            return None
+
+        requested_width = width or IMAGE_VARIANT_WIDTHS[-1]
+        variant_width = next(
+            (w for w in IMAGE_VARIANT_WIDTHS if w >= requested_width),
+            IMAGE_VARIANT_WIDTHS[-1],
+        )
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                image_executor,
+                self._get_image_variant,
+                source_path,
+                variant_width,
+                image_format,
+            )
+        except (FileNotFoundError, UnidentifiedImageError):
+            return None
+
+    @staticmethod
+    def get_cover_atlas_layout(
+        covers: list[tuple[int, str]],
+    ) -> dict[int, tuple[int, int]]:
+        """Position of each cover in the atlas, in pixels
+
+        Args:
+            covers: ids and small cover paths of the entities, in display order
+
+        Returns:
+            dict[int, tuple[int, int]]: Map of entity ids to the (x, y) of their tile
+        """
+        tile_width, tile_height = COVER_ATLAS_TILE_SIZE
+        return {
+            entity_id: (
+                (idx % COVER_ATLAS_COLUMNS) * tile_width,
+                (idx // COVER_ATLAS_COLUMNS) * tile_height,
+            )
+            for idx, (entity_id, _) in enumerate(covers)
+        }
+
+    @staticmethod
+    def get_cover_atlas_size(covers: list[tuple[int, str]]) -> tuple[int, int]:
+        tile_width, tile_height = COVER_ATLAS_TILE_SIZE
+        rows = -(-len(covers) // COVER_ATLAS_COLUMNS)
+        return (
+            min(len(covers), COVER_ATLAS_COLUMNS) * tile_width,
+            rows * tile_height,
+        )
+
+    def _build_cover_atlas(self, covers: list[tuple[int, str]], atlas_path: str):
+        atlas = Image.new("RGBA", self.get_cover_atlas_size(covers))
+        layout = self.get_cover_atlas_layout(covers)
+        for entity_id, path_cover_s in covers:
+            try:
+                with Image.open(f"{RESOURCES_BASE_PATH}/{path_cover_s}") as img:
+                    img.draft("RGB", COVER_ATLAS_TILE_SIZE)
+                    tile = ImageOps.fit(
+                        img.convert("RGBA"),
+                        COVER_ATLAS_TILE_SIZE,
+                        Image.Resampling.LANCZOS,
+                    )
+            except (OSError, UnidentifiedImageError):
+                log.warning(f"Failure adding cover {path_cover_s} to atlas")
+                continue
+            atlas.paste(tile, layout[entity_id])
+
+        save_image_atomically(
+            atlas, atlas_path, **IMAGE_VARIANT_SAVE_PARAMS[ImageVariantFormat.WEBP]
+        )
+
+    def _get_cover_atlas(self, atlas_key: str, covers: list[tuple[int, str]]) -> None:
+        atlas_path = self.get_cover_atlas_path(atlas_key)
+        try:
+            os.utime(atlas_path)
+            return
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(IMAGE_VARIANTS_CACHE_PATH, exist_ok=True)
+        self._build_cover_atlas(covers, atlas_path)
+        self._evict_image_variants(atlas_path)
+
+    @staticmethod
+    def get_cover_atlas_path(atlas_key: str) -> str:
+        return os.path.join(IMAGE_VARIANTS_CACHE_PATH, f"atlas-{atlas_key}.webp")
+
+    async def get_cover_atlas(self, covers: list[tuple[int, str]]) -> str:
+        """Pack small covers in a single image, generating it if needed
+
+        Atlases are stored with the image variants, and keyed by their covers.
+        Cover paths are named after their content, so replacing a cover changes
+        the key of every atlas it's part of.
+
+        Args:
+            covers: ids and small cover paths of the entities, in display order
+
+        Returns:
+            str: Key of the atlas
+        """
+        atlas_key = hashlib.sha1(
+            "\n".join(
+                f"{entity_id}:{path_cover_s}" for entity_id, path_cover_s in covers
+            ).encode()
+        ).hexdigest()
+
+        await asyncio.get_running_loop().run_in_executor(
+            image_executor, self._get_cover_atlas, atlas_key, covers
+        )
+
+        return atlas_key
+
+    def find_cover_atlas(self, atlas_key: str) -> str | None:
+        """Path of a previously generated atlas, if still cached"""
+        if not COVER_ATLAS_KEY_PATTERN.fullmatch(atlas_key):
+            return None
 
-        return path_screenshots
+        atlas_path = self.get_cover_atlas_path(atlas_key)
+        return atlas_path if os.path.isfile(atlas_path) else None
@@ -1,8 +1,11 @@
 import os
 from pathlib import Path
 
+import pytest
 from handler.filesystem import fs_platform_handler, fs_resource_handler, fs_rom_handler
+from handler.filesystem.base_handler import ImageVariantFormat
 from models.platform import Platform
+from PIL import Image
 
 
 async def test_get_rom_cover():
@@ -14,6 +17,23 @@ async def test_get_rom_cover():
     assert "" in path_cover_l
 
 
+@pytest.mark.parametrize(
+    "image_format", [ImageVariantFormat.WEBP, ImageVariantFormat.JPEG]
+)
+def test_build_image_variant_from_palette_image(tmp_path, image_format):
+    source_path = str(tmp_path / "cover.png")
+    variant_path = str(tmp_path / f"cover.{image_format.value}")
+    Image.new("P", (600, 800), color=3).save(source_path)
+
+    fs_resource_handler._build_image_variant(
+        source_path, variant_path, 128, image_format
+    )
+
+    with Image.open(variant_path) as variant:
+        assert variant.size == (128, 171)
+        assert variant.mode == "RGB"
+
+
 def test_get_platforms():
     platforms = fs_platform_handler.get_platforms()
 
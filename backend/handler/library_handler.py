@@ -0,0 +1,129 @@
+import json
+from typing import Final
+
+from handler.redis_handler import async_cache, sync_cache
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+LIBRARY_VERSION_KEY: Final = "romm:library:version"
+RESPONSE_CACHE_KEY_PREFIX: Final = "romm:library:response"
+# Cached responses are keyed by library version, so the ones of past versions
+# are never read again and only need to expire
+RESPONSE_CACHE_TTL: Final = 60 * 60  # 1 hour, in seconds
+RESPONSE_CACHE_MAX_SIZE: Final = 32 * 1024 * 1024  # 32 MiB
+
+# Tables rendered by the library list endpoints, any write to them bumps the
+# library version. Users are left out as they are updated on every request.
+LIBRARY_TABLES: Final = frozenset(
+    {
+        "collection_roms",
+        "collections",
+        "firmware",
+        "platforms",
+        "rom_user",
+        "roms",
+        "sibling_roms",
+    }
+)
+
+_SESSION_CHANGED_KEY: Final = "library_changed"
+
+
+def _encode(value: str | bytes) -> bytes:
+    return value.encode() if isinstance(value, str) else value
+
+
+class LibraryHandler:
+    """Version of the library, bumped by every committed write to it.
+
+    List endpoints derive their ETags from it, and cache their rendered
+    responses under it, so a write invalidates all of them at once.
+    """
+
+    def get_version(self) -> int:
+        return int(sync_cache.get(LIBRARY_VERSION_KEY) or 0)
+
+    async def get_version_async(self) -> int:
+        return int(await async_cache.get(LIBRARY_VERSION_KEY) or 0)
+
+    def bump_version(self) -> int:
+        return sync_cache.incr(LIBRARY_VERSION_KEY)
+
+    async def bump_version_async(self) -> int:
+        return await async_cache.incr(LIBRARY_VERSION_KEY)
+
+    def mark_changed(self, session: Session) -> None:
+        """Bump the library version once the session is committed"""
+        session.info[_SESSION_CHANGED_KEY] = True
+
+    def _on_flush(self, session: Session, _flush_context) -> None:
+        for instance in (*session.new, *session.dirty, *session.deleted):
+            if getattr(instance, "__tablename__", None) in LIBRARY_TABLES:
+                self.mark_changed(session)
+                return
+
+    def _on_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        if not (
+            orm_execute_state.is_insert
+            or orm_execute_state.is_update
+            or orm_execute_state.is_delete
+        ):
+            return
+
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None) in LIBRARY_TABLES:
+            self.mark_changed(orm_execute_state.session)
+
+    def _on_commit(self, session: Session) -> None:
+        if session.info.pop(_SESSION_CHANGED_KEY, False):
+            self.bump_version()
+
+    def _on_rollback(self, session: Session) -> None:
+        session.info.pop(_SESSION_CHANGED_KEY, None)
+
+    def track_sessions(self, session_factory) -> None:
+        """Bump the library version on commits of sessions writing to it"""
+        event.listen(session_factory, "after_flush", self._on_flush)
+        event.listen(session_factory, "do_orm_execute", self._on_execute)
+        event.listen(session_factory, "after_commit", self._on_commit)
+        event.listen(session_factory, "after_rollback", self._on_rollback)
+
+    async def get_cached_response(
+        self, key: str
+    ) -> tuple[list[tuple[bytes, bytes]], bytes] | None:
+        cached = await async_cache.hgetall(f"{RESPONSE_CACHE_KEY_PREFIX}:{key}")
+        if not cached:
+            return None
+
+        cached = {_encode(field): value for field, value in cached.items()}
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in json.loads(cached[b"headers"])
+        ]
+        return headers, _encode(cached[b"body"])
+
+    async def cache_response(
+        self, key: str, headers: list[tuple[bytes, bytes]], body: bytes
+    ) -> None:
+        if len(body) > RESPONSE_CACHE_MAX_SIZE:
+            return
+
+        cache_key = f"{RESPONSE_CACHE_KEY_PREFIX}:{key}"
+        async with async_cache.pipeline() as pipe:
+            pipe.hset(
+                cache_key,
+                mapping={
+                    "headers": json.dumps(
+                        [
+                            (name.decode("latin-1"), value.decode("latin-1"))
+                            for name, value in headers
+                        ]
+                    ),
+                    "body": body,
+                },
+            )
+            pipe.expire(cache_key, RESPONSE_CACHE_TTL)
+            await pipe.execute()
+
+
+library_handler = LibraryHandler()
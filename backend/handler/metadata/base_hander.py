@@ -2,30 +2,18 @@ import json
 import os
 import re
 import unicodedata
-from itertools import batched
 from typing import Final
 
-from handler.redis_handler import async_cache, sync_cache
+from handler.redis_handler import async_cache
 from logger.logger import log
 from tasks.update_switch_titledb import (
     SWITCH_PRODUCT_ID_KEY,
     SWITCH_TITLEDB_INDEX_KEY,
     update_switch_titledb_task,
 )
+from utils.fixture_index import FixtureIndex
 
-
-def conditionally_set_cache(
-    index_key: str, filename: str, parent_dir: str = os.path.dirname(__file__)
-) -> None:
-    fixtures_path = os.path.join(parent_dir, "fixtures")
-    if not sync_cache.exists(index_key):
-        index_data = json.loads(open(os.path.join(fixtures_path, filename)).read())
-        with sync_cache.pipeline() as pipe:
-            for data_batch in batched(index_data.items(), 2000):
-                data_map = {k: json.dumps(v) for k, v in dict(data_batch).items()}
-                pipe.hset(index_key, mapping=data_map)
-            pipe.execute()
-
+FIXTURES_DIR: Final = os.path.join(os.path.dirname(__file__), "fixtures")
 
 # These are loaded in cache in update_switch_titledb_task
 SWITCH_TITLEDB_REGEX: Final = re.compile(r"(70[0-9]{12})")
@@ -33,25 +21,24 @@ SWITCH_PRODUCT_ID_REGEX: Final = re.compile(r"(0100[0-9A-F]{12})")
 
 
 # No regex needed for MAME
-MAME_XML_KEY: Final = "romm:mame_xml"
-conditionally_set_cache(MAME_XML_KEY, "mame_index.json")
+MAME_XML_INDEX: Final = FixtureIndex(os.path.join(FIXTURES_DIR, "mame_index.json"))
 
 # PS2 OPL
 PS2_OPL_REGEX: Final = re.compile(r"^([A-Z]{4}_\d{3}\.\d{2})\..*$")
-PS2_OPL_KEY: Final = "romm:ps2_opl_index"
-conditionally_set_cache(PS2_OPL_KEY, "ps2_opl_index.json")
+PS2_OPL_INDEX: Final = FixtureIndex(os.path.join(FIXTURES_DIR, "ps2_opl_index.json"))
 
 # Sony serial codes for PS1, PS2, and PSP
 SONY_SERIAL_REGEX: Final = re.compile(r".*([a-zA-Z]{4}-\d{5}).*$")
 
-PS1_SERIAL_INDEX_KEY: Final = "romm:ps1_serial_index"
-conditionally_set_cache(PS1_SERIAL_INDEX_KEY, "ps1_serial_index.json")
-
-PS2_SERIAL_INDEX_KEY: Final = "romm:ps2_serial_index"
-conditionally_set_cache(PS2_SERIAL_INDEX_KEY, "ps2_serial_index.json")
-
-PSP_SERIAL_INDEX_KEY: Final = "romm:psp_serial_index"
-conditionally_set_cache(PSP_SERIAL_INDEX_KEY, "psp_serial_index.json")
+PS1_SERIAL_INDEX: Final = FixtureIndex(
+    os.path.join(FIXTURES_DIR, "ps1_serial_index.json")
+)
+PS2_SERIAL_INDEX: Final = FixtureIndex(
+    os.path.join(FIXTURES_DIR, "ps2_serial_index.json")
+)
+PSP_SERIAL_INDEX: Final = FixtureIndex(
+    os.path.join(FIXTURES_DIR, "psp_serial_index.json")
+)
 
 
 class MetadataHandler:
@@ -99,17 +86,17 @@ class MetadataHandler:
 
     async def _ps2_opl_format(self, match: re.Match[str], search_term: str) -> str:
         serial_code = match.group(1)
-        index_entry = await async_cache.hget(PS2_OPL_KEY, serial_code)
+        index_entry = PS2_OPL_INDEX.get(serial_code)
         if index_entry:
-            index_entry = json.loads(index_entry)
-            search_term = index_entry["Name"]  # type: ignore
+            search_term = index_entry["Name"]
 
         return search_term
 
-    async def _sony_serial_format(self, index_key: str, serial_code: str) -> str | None:
-        index_entry = await async_cache.hget(index_key, serial_code)
+    async def _sony_serial_format(
+        self, index: FixtureIndex, serial_code: str
+    ) -> str | None:
+        index_entry = index.get(serial_code)
         if index_entry:
-            index_entry = json.loads(index_entry)
             return index_entry["title"]
 
         return None
@@ -117,22 +104,19 @@ class MetadataHandler:
     async def _ps1_serial_format(self, match: re.Match[str], search_term: str) -> str:
         serial_code = match.group(1)
         return (
-            await self._sony_serial_format(PS1_SERIAL_INDEX_KEY, serial_code)
-            or search_term
+            await self._sony_serial_format(PS1_SERIAL_INDEX, serial_code) or search_term
         )
 
     async def _ps2_serial_format(self, match: re.Match[str], search_term: str) -> str:
         serial_code = match.group(1)
         return (
-            await self._sony_serial_format(PS2_SERIAL_INDEX_KEY, serial_code)
-            or search_term
+            await self._sony_serial_format(PS2_SERIAL_INDEX, serial_code) or search_term
         )
 
     async def _psp_serial_format(self, match: re.Match[str], search_term: str) -> str:
         serial_code = match.group(1)
         return (
-            await self._sony_serial_format(PSP_SERIAL_INDEX_KEY, serial_code)
-            or search_term
+            await self._sony_serial_format(PSP_SERIAL_INDEX, serial_code) or search_term
         )
 
     async def _switch_titledb_format(
@@ -173,7 +157,11 @@ class MetadataHandler:
                 log.error("Could not fetch the Switch productID index file")
                 return search_term, None
 
-        index_entry = await async_cache.hget(SWITCH_PRODUCT_ID_KEY, product_id)
+        title_key = await async_cache.hget(SWITCH_PRODUCT_ID_KEY, product_id)
+        if not title_key:
+            return search_term, None
+
+        index_entry = await async_cache.hget(SWITCH_TITLEDB_INDEX_KEY, title_key)
         if index_entry:
             index_entry = json.loads(index_entry)
             return index_entry["name"], index_entry
@@ -183,9 +171,8 @@ class MetadataHandler:
     async def _mame_format(self, search_term: str) -> str:
         from handler.filesystem import fs_rom_handler
 
-        index_entry = await async_cache.hget(MAME_XML_KEY, search_term)
+        index_entry = MAME_XML_INDEX.get(search_term)
         if index_entry:
-            index_entry = json.loads(index_entry)
             search_term = fs_rom_handler.get_file_name_with_no_tags(
                 index_entry.get("description", search_term)
             )
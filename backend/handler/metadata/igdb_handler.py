@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import re
 import time
@@ -546,14 +547,16 @@ class IGDBBaseHandler(MetadataHandler):
             return []
 
         search_term = uc(search_term)
-        matched_roms = await self._request(
-            self.games_endpoint,
-            data=f'search "{search_term}"; fields {",".join(self.games_fields)}; where platforms=[{platform_igdb_id}];',
-        )
-
-        alternative_matched_roms = await self._request(
-            self.search_endpoint,
-            data=f'fields {",".join(self.search_fields)}; where game.platforms=[{platform_igdb_id}] & (name ~ *"{search_term}"* | alternative_name ~ *"{search_term}"*);',
+        # Both searches are independent, so run them concurrently
+        matched_roms, alternative_matched_roms = await asyncio.gather(
+            self._request(
+                self.games_endpoint,
+                data=f'search "{search_term}"; fields {",".join(self.games_fields)}; where platforms=[{platform_igdb_id}];',
+            ),
+            self._request(
+                self.search_endpoint,
+                data=f'fields {",".join(self.search_fields)}; where game.platforms=[{platform_igdb_id}] & (name ~ *"{search_term}"* | alternative_name ~ *"{search_term}"*);',
+            ),
         )
 
         if alternative_matched_roms:
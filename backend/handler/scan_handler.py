@@ -1,10 +1,11 @@
 import asyncio
+import functools
 from enum import Enum
 from typing import Any
 
 import emoji
 from config.config_manager import config_manager as cm
-from handler.database import db_platform_handler
+from handler.database import db_platform_handler, db_rom_handler
 from handler.filesystem import fs_asset_handler, fs_firmware_handler, fs_rom_handler
 from handler.filesystem.roms_handler import FSRom
 from handler.metadata import meta_igdb_handler, meta_moby_handler
@@ -120,6 +121,32 @@ async def scan_platform(
     return Platform(**platform_attrs)
 
 
+def _get_igdb_rom_from_match(matched_rom: Rom) -> IGDBRom:
+    log.info(f"\t   Reusing IGDB match from {hl(matched_rom.file_name)}")
+    return IGDBRom(
+        igdb_id=matched_rom.igdb_id,
+        slug=matched_rom.slug or "",
+        name=matched_rom.name or "",
+        summary=matched_rom.summary or "",
+        url_cover=matched_rom.url_cover or "",
+        url_screenshots=matched_rom.url_screenshots or [],
+        igdb_metadata=matched_rom.igdb_metadata or {},
+    )
+
+
+def _get_moby_rom_from_match(matched_rom: Rom) -> MobyGamesRom:
+    log.info(f"\t   Reusing MobyGames match from {hl(matched_rom.file_name)}")
+    return MobyGamesRom(
+        moby_id=matched_rom.moby_id,
+        slug=matched_rom.slug or "",
+        name=matched_rom.name or "",
+        summary=matched_rom.summary or "",
+        url_cover=matched_rom.url_cover or "",
+        url_screenshots=matched_rom.url_screenshots or [],
+        moby_metadata=matched_rom.moby_metadata or {},
+    )
+
+
 def scan_firmware(
     platform: Platform,
     file_name: str,
@@ -208,6 +235,8 @@ async def scan_rom(
                 "url_cover": rom.url_cover,
                 "path_cover_s": rom.path_cover_s,
                 "path_cover_l": rom.path_cover_l,
+                "cover_placeholder": rom.cover_placeholder,
+                "cover_color": rom.cover_color,
                 "path_screenshots": rom.path_screenshots,
                 "url_screenshots": rom.url_screenshots,
             }
@@ -253,6 +282,24 @@ async def scan_rom(
     if scan_type == ScanType.HASHES:
         return Rom(**rom_attrs)
 
+    # Regional variants and revisions of the same game share the same file name
+    # without tags, so reuse the match of a sibling rom instead of searching again.
+    # Only looked up once, and only when a provider is about to be queried.
+    @functools.cache
+    def get_matched_rom() -> Rom | None:
+        if (
+            scan_type == ScanType.COMPLETE
+            or not platform.id
+            or not rom_attrs["file_name_no_tags"]
+        ):
+            return None
+
+        return db_rom_handler.get_matched_rom_by_filename_no_tags(
+            platform_id=platform.id,
+            file_name_no_tags=rom_attrs["file_name_no_tags"],
+            exclude_id=rom.id if rom else None,
+        )
+
     async def fetch_igdb_rom():
         if (
             "igdb" in metadata_sources
@@ -264,6 +311,10 @@ async def scan_rom(
                 or (scan_type == ScanType.UNIDENTIFIED and not rom.igdb_id)
             )
         ):
+            matched_rom = get_matched_rom()
+            if matched_rom and matched_rom.igdb_id:
+                return _get_igdb_rom_from_match(matched_rom)
+
             main_platform_igdb_id = await _get_main_platform_igdb_id(platform)
             return await meta_igdb_handler.get_rom(
                 rom_attrs["file_name"], main_platform_igdb_id
@@ -282,6 +333,10 @@ async def scan_rom(
                 or (scan_type == ScanType.UNIDENTIFIED and not rom.moby_id)
             )
         ):
+            matched_rom = get_matched_rom()
+            if matched_rom and matched_rom.moby_id:
+                return _get_moby_rom_from_match(matched_rom)
+
             return await meta_moby_handler.get_rom(
                 rom_attrs["file_name"], platform_moby_id=platform.moby_id
             )
@@ -0,0 +1,164 @@
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Final
+
+from handler.redis_handler import sync_cache
+from logger.logger import log
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+STATS_KEY: Final = "romm:stats"
+# Only set by a full refresh, so counters incremented while the stats aren't
+# loaded (which creates a partial hash) are never read
+STATS_READY_FIELD: Final = "ready"
+
+PLATFORM_STATS_FIELDS: Final = ("roms", "identified_roms", "filesize")
+USER_STATS_FIELDS: Final = ("saves", "states", "screenshots")
+
+_SESSION_CHANGES_KEY: Final = "stats_changes"
+
+
+def _decode(value: str | bytes) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class StatsHandler:
+    """Library statistics, cached in Redis and kept up to date incrementally.
+
+    Write paths increment the counters they change, and writes whose effects
+    can't be counted cheaply (e.g. deletes cascading to assets) invalidate the
+    cache instead. The stats are rebuilt from the database when missing, and
+    periodically to correct any drift.
+
+    Changes made along a database session are only applied once it commits,
+    so the cache never holds uncommitted or rolled back counts.
+    """
+
+    def _after_commit(
+        self, change: Callable[[], None], session: Session | None
+    ) -> None:
+        if session is None:
+            change()
+        else:
+            session.info.setdefault(_SESSION_CHANGES_KEY, []).append(change)
+
+    def _apply_session_changes(self, session: Session) -> None:
+        for change in session.info.pop(_SESSION_CHANGES_KEY, []):
+            change()
+
+    def _discard_session_changes(self, session: Session) -> None:
+        session.info.pop(_SESSION_CHANGES_KEY, None)
+
+    def track_sessions(self, session_factory) -> None:
+        """Apply the stats changes of sessions once they commit"""
+        event.listen(session_factory, "after_commit", self._apply_session_changes)
+        event.listen(session_factory, "after_rollback", self._discard_session_changes)
+
+    def increment_platform(
+        self, platform_id: int, session: Session | None = None, **deltas: int
+    ) -> None:
+        self._increment("platform", platform_id, PLATFORM_STATS_FIELDS, deltas, session)
+
+    def increment_user(
+        self, user_id: int, session: Session | None = None, **deltas: int
+    ) -> None:
+        self._increment("user", user_id, USER_STATS_FIELDS, deltas, session)
+
+    def _increment(
+        self,
+        scope: str,
+        id: int,
+        fields: tuple[str, ...],
+        deltas: dict[str, int],
+        session: Session | None,
+    ) -> None:
+        if unknown_fields := deltas.keys() - set(fields):
+            raise ValueError(f"Unknown {scope} stats: {', '.join(unknown_fields)}")
+
+        def increment() -> None:
+            with sync_cache.pipeline(transaction=False) as pipe:
+                for field, delta in deltas.items():
+                    if delta:
+                        pipe.hincrby(STATS_KEY, f"{scope}:{id}:{field}", delta)
+                pipe.execute()
+
+        self._after_commit(increment, session)
+
+    def invalidate(self, session: Session | None = None) -> None:
+        self._after_commit(lambda: sync_cache.delete(STATS_KEY), session)
+
+    def refresh(self) -> dict[str, int]:
+        """Rebuild the stats from the database"""
+        from handler.database import db_stats_handler
+
+        stats = {STATS_READY_FIELD: 1}
+        for platform_id, platform_stats in db_stats_handler.get_platforms_stats():
+            for field in PLATFORM_STATS_FIELDS:
+                stats[f"platform:{platform_id}:{field}"] = platform_stats[field]
+        for user_id, user_stats in db_stats_handler.get_users_stats():
+            for field in USER_STATS_FIELDS:
+                stats[f"user:{user_id}:{field}"] = user_stats[field]
+
+        with sync_cache.pipeline() as pipe:
+            pipe.delete(STATS_KEY)
+            pipe.hset(STATS_KEY, mapping=stats)
+            pipe.execute()
+
+        log.debug(f"Refreshed the library stats, {len(stats)} counters")
+        return stats
+
+    def _load(self) -> dict[str, int]:
+        stats = {
+            _decode(field): int(value)
+            for field, value in sync_cache.hgetall(STATS_KEY).items()
+        }
+        if STATS_READY_FIELD not in stats:
+            return self.refresh()
+
+        return stats
+
+    def _group(self, stats: dict[str, int], scope: str) -> dict[int, dict[str, int]]:
+        grouped: dict[int, dict[str, int]] = defaultdict(dict)
+        for key, value in stats.items():
+            key_scope, _, id_and_field = key.partition(":")
+            if key_scope == scope:
+                id, _, field = id_and_field.partition(":")
+                grouped[int(id)][field] = value
+
+        return grouped
+
+    def get_platforms_stats(self) -> dict[int, dict[str, int]]:
+        return {
+            platform_id: {
+                field: platform_stats.get(field, 0) for field in PLATFORM_STATS_FIELDS
+            }
+            for platform_id, platform_stats in self._group(
+                self._load(), "platform"
+            ).items()
+        }
+
+    def get_users_stats(self) -> dict[int, dict[str, int]]:
+        return {
+            user_id: {field: user_stats.get(field, 0) for field in USER_STATS_FIELDS}
+            for user_id, user_stats in self._group(self._load(), "user").items()
+        }
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the totals of the whole library"""
+        stats = self._load()
+        platforms_stats = self._group(stats, "platform").values()
+        users_stats = self._group(stats, "user").values()
+
+        def total(grouped_stats, field: str) -> int:
+            return sum(group_stats.get(field, 0) for group_stats in grouped_stats)
+
+        return {
+            "platforms": sum(
+                1 for platform_stats in platforms_stats if platform_stats.get("roms")
+            ),
+            **{field: total(platforms_stats, field) for field in PLATFORM_STATS_FIELDS},
+            **{field: total(users_stats, field) for field in USER_STATS_FIELDS},
+        }
+
+
+stats_handler = StatsHandler()
@@ -3,6 +3,7 @@ import pytest
 from config.config_manager import ConfigManager
 from handler.auth import auth_handler
 from handler.database import (
+    db_collection_handler,
     db_platform_handler,
     db_rom_handler,
     db_save_handler,
@@ -11,6 +12,7 @@ from handler.database import (
     db_user_handler,
 )
 from models.assets import Save, Screenshot, State
+from models.collection import Collection
 from models.platform import Platform
 from models.rom import Rom
 from models.user import Role, User
@@ -61,6 +63,16 @@ def rom(platform: Platform):
     return db_rom_handler.add_rom(rom)
 
 
+@pytest.fixture
+def collection(admin_user: User):
+    collection = Collection(
+        name="test_collection",
+        description="test_collection_description",
+        user_id=admin_user.id,
+    )
+    return db_collection_handler.add_collection(collection)
+
+
 @pytest.fixture
 def save(rom: Rom, platform: Platform, admin_user: User):
     save = Save(
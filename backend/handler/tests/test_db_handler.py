@@ -1,5 +1,7 @@
+import pytest
 from handler.auth import auth_handler
 from handler.database import (
+    db_collection_handler,
     db_platform_handler,
     db_rom_handler,
     db_save_handler,
@@ -8,6 +10,7 @@ from handler.database import (
     db_user_handler,
 )
 from models.assets import Save, Screenshot, State
+from models.collection import Collection
 from models.platform import Platform
 from models.rom import Rom
 from models.user import Role, User
@@ -69,6 +72,270 @@ def test_roms(rom: Rom, platform: Platform):
     assert len(roms) == 0
 
 
+def test_roms_page(rom: Rom, platform: Platform):
+    for name in ("test_rom_2", "test_rom_3"):
+        db_rom_handler.add_rom(
+            Rom(
+                platform_id=platform.id,
+                name=name,
+                slug=f"{name}_slug",
+                file_name=f"{name}.zip",
+                file_name_no_tags=name,
+                file_name_no_ext=name,
+                file_extension="zip",
+                file_path=f"{platform.slug}/roms",
+                file_size_bytes=1000.0,
+            )
+        )
+
+    roms, next_cursor, prev_cursor = db_rom_handler.get_roms_page(
+        platform_id=platform.id, limit=2
+    )
+    assert [r.name for r in roms] == ["test_rom", "test_rom_2"]
+    assert next_cursor is not None
+    assert prev_cursor is None
+
+    roms, next_cursor, prev_cursor = db_rom_handler.get_roms_page(
+        platform_id=platform.id, limit=2, cursor=next_cursor
+    )
+    assert [r.name for r in roms] == ["test_rom_3"]
+    assert next_cursor is None
+    assert prev_cursor is not None
+
+    roms, _, _ = db_rom_handler.get_roms_page(
+        platform_id=platform.id, limit=2, cursor=prev_cursor
+    )
+    assert [r.name for r in roms] == ["test_rom", "test_rom_2"]
+
+    with pytest.raises(ValueError):
+        db_rom_handler.get_roms_page(
+            platform_id=platform.id, limit=2, cursor="not-a-cursor"
+        )
+
+
+def test_search_roms(platform: Platform):
+    for name, file_name in (
+        ("Dr. Mario", "Dr. Mario.nes"),
+        ("Mario Kart 64", "Mario Kart 64.z64"),
+        ("Super Mario 64", "Super Mario 64.z64"),
+        ("", "Super_Mario_World.sfc"),
+    ):
+        db_rom_handler.add_rom(
+            Rom(
+                platform_id=platform.id,
+                name=name,
+                file_name=file_name,
+                file_name_no_tags=file_name.rsplit(".", 1)[0],
+                file_name_no_ext=file_name.rsplit(".", 1)[0],
+                file_extension=file_name.rsplit(".", 1)[1],
+                file_path=f"{platform.slug}/roms",
+                file_size_bytes=1000.0,
+            )
+        )
+
+    # Names starting with the search term come first
+    roms = db_rom_handler.search_roms("mario", platform_id=platform.id)
+    assert roms[0].name == "Mario Kart 64"
+    assert {rom.file_name_no_tags for rom in roms} == {
+        "Dr. Mario",
+        "Mario Kart 64",
+        "Super Mario 64",
+        "Super_Mario_World",
+    }
+
+    # Words are matched by prefix
+    roms = db_rom_handler.search_roms("super mar", platform_id=platform.id)
+    assert {rom.file_name_no_tags for rom in roms} == {
+        "Super Mario 64",
+        "Super_Mario_World",
+    }
+
+    # Terms too short to be indexed are matched as substrings
+    roms = db_rom_handler.search_roms("mario 64", platform_id=platform.id)
+    assert {rom.name for rom in roms} == {"Mario Kart 64", "Super Mario 64"}
+
+    roms = db_rom_handler.search_roms("64", platform_id=platform.id)
+    assert {rom.name for rom in roms} == {"Mario Kart 64", "Super Mario 64"}
+
+    # Terms with a typo fall back to similar words
+    roms = db_rom_handler.search_roms("marip kart", platform_id=platform.id)
+    assert roms[0].name == "Mario Kart 64"
+
+    assert db_rom_handler.search_roms("zelda", platform_id=platform.id) == []
+
+
+def test_collection_roms(collection: Collection, rom: Rom, platform: Platform):
+    rom_2 = db_rom_handler.add_rom(
+        Rom(
+            platform_id=platform.id,
+            name="test_rom_2",
+            slug="test_rom_slug_2",
+            file_name="test_rom_2.zip",
+            file_name_no_tags="test_rom_2",
+            file_name_no_ext="test_rom_2",
+            file_extension="zip",
+            file_path=f"{platform.slug}/roms",
+            file_size_bytes=1000.0,
+        )
+    )
+
+    # Roms already in the collection are ignored
+    collection = db_collection_handler.add_collection_roms(collection.id, [rom.id])
+    collection = db_collection_handler.add_collection_roms(
+        collection.id, [rom.id, rom.id, rom_2.id]
+    )
+    assert collection.roms == {rom.id, rom_2.id}
+    assert collection.rom_count == 2
+
+    roms = db_rom_handler.get_roms(collection_id=collection.id)
+    assert [r.id for r in roms] == [rom.id, rom_2.id]
+
+    collection_2 = db_collection_handler.add_collection(
+        Collection(name="test_collection_2", user_id=collection.user_id)
+    )
+    db_collection_handler.add_collection_roms(collection_2.id, [rom.id])
+    assert [c.name for c in db_rom_handler.get_rom_collections(rom)] == [
+        "test_collection",
+        "test_collection_2",
+    ]
+    assert [c.name for c in db_rom_handler.get_rom_collections(rom_2)] == [
+        "test_collection"
+    ]
+
+    collection = db_collection_handler.remove_collection_roms(collection.id, [rom_2.id])
+    assert collection.roms == {rom.id}
+    assert db_rom_handler.get_rom_collections(rom_2) == []
+
+    collection = db_collection_handler.update_collection(
+        collection.id, {"name": "test_collection_renamed"}, rom_ids=[rom_2.id]
+    )
+    assert collection.name == "test_collection_renamed"
+    assert collection.roms == {rom_2.id}
+
+    roms = db_rom_handler.get_roms(collection_id=collection.id)
+    assert [r.id for r in roms] == [rom_2.id]
+
+    # Roms are left untouched when not given
+    collection = db_collection_handler.update_collection(
+        collection.id, {"description": "updated"}
+    )
+    assert collection.roms == {rom_2.id}
+
+    db_rom_handler.delete_rom(rom_2.id)
+    collection = db_collection_handler.get_collection(collection.id)
+    assert collection.roms == set()
+
+
+def test_sibling_roms(rom: Rom, platform: Platform):
+    def get_sibling_ids(rom_id: int) -> set[int]:
+        return {sibling.id for sibling in db_rom_handler.get_rom(rom_id).sibling_roms}
+
+    def add_rom(name: str, igdb_id: int | None) -> Rom:
+        return db_rom_handler.add_rom(
+            Rom(
+                platform_id=platform.id,
+                name=name,
+                slug=f"{name}_slug",
+                file_name=f"{name}.zip",
+                file_name_no_tags=name,
+                file_name_no_ext=name,
+                file_extension="zip",
+                file_path=f"{platform.slug}/roms",
+                file_size_bytes=1000.0,
+                igdb_id=igdb_id,
+            )
+        )
+
+    db_rom_handler.update_rom(rom.id, {"igdb_id": 1})
+    assert get_sibling_ids(rom.id) == set()
+
+    # A second rom matched to the same game is a sibling both ways
+    rom_2 = add_rom("test_rom_2", igdb_id=1)
+    rom_3 = add_rom("test_rom_3", igdb_id=2)
+    assert get_sibling_ids(rom.id) == {rom_2.id}
+    assert get_sibling_ids(rom_2.id) == {rom.id}
+    assert get_sibling_ids(rom_3.id) == set()
+
+    # Re-matching a rom moves it to the siblings of its new game
+    rom_2.igdb_id = 2
+    db_rom_handler.add_rom(rom_2)
+    assert get_sibling_ids(rom.id) == set()
+    assert get_sibling_ids(rom_2.id) == {rom_3.id}
+    assert get_sibling_ids(rom_3.id) == {rom_2.id}
+
+    db_rom_handler.update_rom(rom.id, {"igdb_id": 2})
+    assert get_sibling_ids(rom.id) == {rom_2.id, rom_3.id}
+    assert get_sibling_ids(rom_3.id) == {rom.id, rom_2.id}
+
+    # Unmatching a rom removes it from its siblings
+    db_rom_handler.update_rom(rom.id, {"igdb_id": None})
+    assert get_sibling_ids(rom.id) == set()
+    assert get_sibling_ids(rom_2.id) == {rom_3.id}
+
+    # Deleting a rom removes its pairs
+    db_rom_handler.delete_rom(rom_3.id)
+    assert get_sibling_ids(rom_2.id) == set()
+
+
+def test_platform_rom_counters(rom: Rom, platform: Platform):
+    platform_2 = db_platform_handler.add_platform(
+        Platform(
+            name="test_platform_2",
+            slug="test_platform_slug_2",
+            fs_slug="test_platform_slug_2",
+        )
+    )
+
+    def get_counters(platform_id: int) -> tuple[int, int, int]:
+        platform = db_platform_handler.get_platform(platform_id)
+        return (
+            platform.rom_count,
+            platform.identified_rom_count,
+            platform.total_file_size_bytes,
+        )
+
+    def assert_counters(expected: dict[int, tuple[int, int, int]]) -> None:
+        assert {id: get_counters(id) for id in expected} == expected
+        # The counters kept up to date match the ones computed from the roms
+        db_platform_handler.reconcile_platform_counters()
+        assert {id: get_counters(id) for id in expected} == expected
+
+    assert_counters({platform.id: (1, 0, 1000), platform_2.id: (0, 0, 0)})
+
+    rom_2 = db_rom_handler.add_rom(
+        Rom(
+            platform_id=platform.id,
+            name="test_rom_2",
+            slug="test_rom_slug_2",
+            file_name="test_rom_2.zip",
+            file_name_no_tags="test_rom_2",
+            file_name_no_ext="test_rom_2",
+            file_extension="zip",
+            file_path=f"{platform.slug}/roms",
+            file_size_bytes=2000.0,
+            igdb_id=1,
+        )
+    )
+    assert_counters({platform.id: (2, 1, 3000), platform_2.id: (0, 0, 0)})
+
+    db_rom_handler.update_rom(rom.id, {"file_size_bytes": 1500, "igdb_id": 2})
+    assert_counters({platform.id: (2, 2, 3500), platform_2.id: (0, 0, 0)})
+
+    db_rom_handler.update_rom(rom_2.id, {"platform_id": platform_2.id})
+    assert_counters({platform.id: (1, 1, 1500), platform_2.id: (1, 1, 2000)})
+
+    rom_2.igdb_id = None
+    rom_2.platform_id = platform_2.id
+    db_rom_handler.add_rom(rom_2)
+    assert_counters({platform.id: (1, 1, 1500), platform_2.id: (1, 0, 2000)})
+
+    db_rom_handler.delete_rom(rom.id)
+    assert_counters({platform.id: (0, 0, 0), platform_2.id: (1, 0, 2000)})
+
+    db_rom_handler.purge_roms(platform_2.id, [])
+    assert_counters({platform.id: (0, 0, 0), platform_2.id: (0, 0, 0)})
+
+
 def test_utils(rom: Rom, platform: Platform):
     roms = db_rom_handler.get_roms(platform_id=platform.id)
     assert (
@@ -79,6 +346,47 @@ def test_utils(rom: Rom, platform: Platform):
     )
 
 
+def test_matched_rom_by_filename_no_tags(rom: Rom, platform: Platform):
+    assert (
+        db_rom_handler.get_matched_rom_by_filename_no_tags(
+            platform_id=platform.id, file_name_no_tags=rom.file_name_no_tags
+        )
+        is None
+    )
+
+    db_rom_handler.update_rom(rom.id, {"igdb_id": 1234})
+    sibling_rom = db_rom_handler.add_rom(
+        Rom(
+            platform_id=platform.id,
+            name="test_rom (Europe)",
+            file_name="test_rom (Europe).zip",
+            file_name_no_tags="test_rom",
+            file_name_no_ext="test_rom (Europe)",
+            file_extension="zip",
+            file_path=f"{platform.slug}/roms",
+            file_size_bytes=1000.0,
+        )
+    )
+
+    matched_rom = db_rom_handler.get_matched_rom_by_filename_no_tags(
+        platform_id=platform.id,
+        file_name_no_tags=sibling_rom.file_name_no_tags,
+        exclude_id=sibling_rom.id,
+    )
+    assert matched_rom is not None
+    assert matched_rom.id == rom.id
+    assert matched_rom.igdb_id == 1234
+
+    assert (
+        db_rom_handler.get_matched_rom_by_filename_no_tags(
+            platform_id=platform.id,
+            file_name_no_tags=rom.file_name_no_tags,
+            exclude_id=rom.id,
+        )
+        is None
+    )
+
+
 def test_users(admin_user):
     db_user_handler.add_user(
         User(
@@ -0,0 +1,31 @@
+from handler.redis_handler import sync_cache
+from handler.stats_handler import STATS_KEY, STATS_READY_FIELD, stats_handler
+
+
+def test_stats_handler():
+    sync_cache.delete(STATS_KEY)
+    sync_cache.hset(STATS_KEY, STATS_READY_FIELD, 1)
+
+    stats_handler.increment_platform(1, roms=2, filesize=100)
+    stats_handler.increment_platform(2, roms=1, identified_roms=1, filesize=50)
+    stats_handler.increment_platform(2, roms=-1, identified_roms=-1, filesize=-50)
+    stats_handler.increment_user(1, saves=3, screenshots=1)
+
+    assert stats_handler.get_platforms_stats() == {
+        1: {"roms": 2, "identified_roms": 0, "filesize": 100},
+        2: {"roms": 0, "identified_roms": 0, "filesize": 0},
+    }
+    assert stats_handler.get_users_stats() == {
+        1: {"saves": 3, "states": 0, "screenshots": 1}
+    }
+    assert stats_handler.get_stats() == {
+        "platforms": 1,
+        "roms": 2,
+        "identified_roms": 0,
+        "filesize": 100,
+        "saves": 3,
+        "states": 0,
+        "screenshots": 1,
+    }
+
+    sync_cache.delete(STATS_KEY)
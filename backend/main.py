@@ -21,6 +21,7 @@ from endpoints import (
     heartbeat,
     platform,
     raw,
+    resources,
     rom,
     saves,
     screenshots,
@@ -39,6 +40,7 @@ from handler.socket_handler import socket_handler
 from starlette.middleware.authentication import AuthenticationMiddleware
 from utils import get_version
 from utils.context import ctx_httpx_client, initialize_context, set_context_middleware
+from utils.response_cache import ResponseCacheMiddleware
 
 
 @asynccontextmanager
@@ -56,6 +58,9 @@ app = FastAPI(
     redoc_url="/api/redoc",
 )
 
+# Caches the library list responses, runs after the authentication
+app.add_middleware(ResponseCacheMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -105,6 +110,7 @@ app.include_router(feeds.router, prefix="/api")
 app.include_router(config.router, prefix="/api")
 app.include_router(stats.router, prefix="/api")
 app.include_router(raw.router, prefix="/api")
+app.include_router(resources.router, prefix="/api")
 app.include_router(screenshots.router, prefix="/api")
 app.include_router(firmware.router, prefix="/api")
 app.include_router(collections.router, prefix="/api")
@@ -29,7 +29,12 @@ class BaseAsset(BaseModel):
 
     @cached_property
     def download_path(self) -> str:
-        return f"/api/raw/assets/{self.full_path}?timestamp={self.updated_at}"
+        return f"/api/raw/assets/{self.full_path}?v={self.version}"
+
+    @cached_property
+    def version(self) -> str:
+        # Assets are only rewritten through uploads, which update both fields
+        return f"{int(self.updated_at.timestamp())}-{self.file_size_bytes}"
 
 
 class RomAsset(BaseAsset):
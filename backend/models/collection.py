@@ -4,7 +4,7 @@ from functools import cached_property
 
 from models.base import BaseModel
 from models.user import User
-from sqlalchemy import JSON, ForeignKey, String, Text
+from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -18,13 +18,17 @@ class Collection(BaseModel):
 
     path_cover_l: Mapped[str | None] = mapped_column(Text, default="")
     path_cover_s: Mapped[str | None] = mapped_column(Text, default="")
+    cover_placeholder: Mapped[str | None] = mapped_column(
+        Text, default="", doc="Data URI of a tiny cover, shown while loading"
+    )
+    cover_color: Mapped[str | None] = mapped_column(String(length=7), default="")
 
     url_cover: Mapped[str | None] = mapped_column(
         Text, default="", doc="URL to cover image stored in IGDB"
     )
 
-    roms: Mapped[set[int]] = mapped_column(
-        JSON, default=[], doc="Rom id's that belong to this collection"
+    collection_roms: Mapped[list[CollectionRom]] = relationship(
+        lazy="selectin", passive_deletes=True
     )
 
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
@@ -35,9 +39,13 @@ class Collection(BaseModel):
     def user__username(self) -> str:
         return self.user.username
 
+    @property
+    def roms(self) -> set[int]:
+        return {collection_rom.rom_id for collection_rom in self.collection_roms}
+
     @property
     def rom_count(self) -> int:
-        return len(self.roms)
+        return len(self.collection_roms)
 
     @cached_property
     def has_cover(self) -> bool:
@@ -49,3 +57,14 @@ class Collection(BaseModel):
 
     def __repr__(self) -> str:
         return self.name
+
+
+class CollectionRom(BaseModel):
+    __tablename__ = "collection_roms"
+
+    collection_id: Mapped[int] = mapped_column(
+        ForeignKey("collections.id", ondelete="CASCADE"), primary_key=True
+    )
+    rom_id: Mapped[int] = mapped_column(
+        ForeignKey("roms.id", ondelete="CASCADE"), primary_key=True
+    )
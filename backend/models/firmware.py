@@ -1,22 +1,19 @@
 from __future__ import annotations
 
-import json
 import os
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
-from handler.metadata.base_hander import conditionally_set_cache
-from handler.redis_handler import sync_cache
 from models.base import BaseModel
 from sqlalchemy import BigInteger, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from utils.fixture_index import FixtureIndex
 
 if TYPE_CHECKING:
     from models.platform import Platform
 
-KNOWN_BIOS_KEY = "romm:known_bios_files"
-conditionally_set_cache(
-    KNOWN_BIOS_KEY, "known_bios_files.json", os.path.dirname(__file__)
+KNOWN_BIOS_INDEX: Final = FixtureIndex(
+    os.path.join(os.path.dirname(__file__), "fixtures", "known_bios_files.json")
 )
 
 
@@ -55,15 +52,12 @@ class Firmware(BaseModel):
 
     @cached_property
     def is_verified(self) -> bool:
-        cache_entry = sync_cache.hget(
-            KNOWN_BIOS_KEY, f"{self.platform_slug}:{self.file_name}"
-        )
-        if cache_entry:
-            cache_json = json.loads(cache_entry)
-            return self.file_size_bytes == int(cache_json.get("size", 0)) and (
-                self.md5_hash == cache_json.get("md5")
-                or self.sha1_hash == cache_json.get("sha1")
-                or self.crc_hash == cache_json.get("crc")
+        index_entry = KNOWN_BIOS_INDEX.get(f"{self.platform_slug}:{self.file_name}")
+        if index_entry:
+            return self.file_size_bytes == int(index_entry.get("size", 0)) and (
+                self.md5_hash == index_entry.get("md5")
+                or self.sha1_hash == index_entry.get("sha1")
+                or self.crc_hash == index_entry.get("crc")
             )
 
         return False
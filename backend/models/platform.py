@@ -4,8 +4,8 @@ from typing import TYPE_CHECKING
 
 from models.base import BaseModel
 from models.rom import Rom
-from sqlalchemy import String, func, select
-from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
+from sqlalchemy import BigInteger, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from models.firmware import Firmware
@@ -28,9 +28,12 @@ class Platform(BaseModel):
         lazy="selectin", back_populates="platform"
     )
 
-    # This runs a subquery to get the count of roms for the platform
-    rom_count = column_property(
-        select(func.count(Rom.id)).where(Rom.platform_id == id).scalar_subquery()
+    # Counters of the roms of the platform, updated along the roms by the roms
+    # handler, and periodically reconciled with the roms table
+    rom_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    identified_rom_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    total_file_size_bytes: Mapped[int] = mapped_column(
+        BigInteger(), default=0, server_default="0"
     )
 
     def __repr__(self) -> str:
@@ -10,6 +10,7 @@ from models.base import BaseModel
 from sqlalchemy import (
     JSON,
     BigInteger,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
@@ -17,8 +18,10 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    or_,
 )
 from sqlalchemy.dialects.mysql.json import JSON as MySQLJSON
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -51,6 +54,32 @@ class Rom(BaseModel):
     file_size_bytes: Mapped[int] = mapped_column(BigInteger(), default=0)
 
     name: Mapped[str | None] = mapped_column(String(length=350))
+    sort_name: Mapped[str | None] = mapped_column(
+        String(length=350),
+        Computed("lower(`name`)", persisted=True),
+        doc="Lowercase name, indexed for sorting and paginating roms",
+    )
+    sort_comparator: Mapped[str | None] = mapped_column(
+        String(length=450),
+        Computed(
+            "lower(trim(regexp_replace("
+            "coalesce(nullif(`name`, ''), `file_name_no_tags`), "
+            "'^([Tt]he|[Aa]|[Aa]nd)[[:space:]]', '')))",
+            persisted=True,
+        ),
+        doc="Name without leading articles, used by clients to sort roms",
+    )
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        Computed(
+            "replace(concat_ws(' ', `name`, `file_name`, "
+            "json_extract(`igdb_metadata`, '$.alternative_names'), "
+            "json_extract(`moby_metadata`, '$.alternate_titles')), '_', ' ')",
+            persisted=True,
+        ),
+        deferred=True,
+        doc="Names and file name of the rom, FULLTEXT indexed for searching roms",
+    )
     slug: Mapped[str | None] = mapped_column(String(length=400))
     summary: Mapped[str | None] = mapped_column(Text)
     igdb_metadata: Mapped[dict[str, Any] | None] = mapped_column(
@@ -62,6 +91,10 @@ class Rom(BaseModel):
 
     path_cover_s: Mapped[str | None] = mapped_column(Text, default="")
     path_cover_l: Mapped[str | None] = mapped_column(Text, default="")
+    cover_placeholder: Mapped[str | None] = mapped_column(
+        Text, default="", doc="Data URI of a tiny cover, shown while loading"
+    )
+    cover_color: Mapped[str | None] = mapped_column(String(length=7), default="")
     url_cover: Mapped[str | None] = mapped_column(
         Text, default="", doc="URL to cover image stored in IGDB"
     )
@@ -129,6 +162,15 @@ class Rom(BaseModel):
 
         return db_rom_handler.get_rom_collections(self)
 
+    @hybrid_property
+    def is_identified(self) -> bool:
+        return self.igdb_id is not None or self.moby_id is not None
+
+    @is_identified.inplace.expression
+    @classmethod
+    def _is_identified_expression(cls):
+        return or_(cls.igdb_id.isnot(None), cls.moby_id.isnot(None))
+
     # Metadata fields
     @property
     def youtube_video_id(self) -> str:
@@ -225,12 +267,17 @@ class RomUser(BaseModel):
         return self.user.username
 
 
+# Roms of the same platform matched to the same IGDB or MobyGames game, kept up
+# to date by the roms handler when the platform or metadata ids of a rom change
 class SiblingRom(BaseModel):
     __tablename__ = "sibling_roms"
 
-    rom_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    sibling_rom_id: Mapped[int] = mapped_column(Integer, primary_key=True)
-
-    __table_args__ = (
-        UniqueConstraint("rom_id", "sibling_rom_id", name="unique_sibling_roms"),
+    rom_id: Mapped[int] = mapped_column(
+        ForeignKey("roms.id", ondelete="CASCADE"), primary_key=True
+    )
+    sibling_rom_id: Mapped[int] = mapped_column(
+        ForeignKey("roms.id", ondelete="CASCADE"), primary_key=True
     )
+    platform_id: Mapped[int] = mapped_column(Integer)
+    igdb_id: Mapped[int | None]
+    moby_id: Mapped[int | None]
@@ -1,4 +1,5 @@
 from logger.logger import log
+from tasks.reconcile_platform_counters import reconcile_platform_counters_task
 from tasks.scan_library import scan_library_task
 from tasks.tasks import tasks_scheduler
 from tasks.update_switch_titledb import update_switch_titledb_task
@@ -7,6 +8,7 @@ if __name__ == "__main__":
     # Initialize the tasks
     scan_library_task.init()
     update_switch_titledb_task.init()
+    reconcile_platform_counters_task.init()
 
     log.info("Starting scheduler")
 
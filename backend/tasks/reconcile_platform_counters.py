@@ -0,0 +1,35 @@
+from config import (
+    ENABLE_SCHEDULED_RECONCILE_PLATFORM_COUNTERS,
+    SCHEDULED_RECONCILE_PLATFORM_COUNTERS_CRON,
+)
+from handler.database import db_platform_handler
+from handler.stats_handler import stats_handler
+from logger.logger import log
+from tasks.tasks import PeriodicTask
+
+
+class ReconcilePlatformCountersTask(PeriodicTask):
+    def __init__(self):
+        super().__init__(
+            func="tasks.reconcile_platform_counters.reconcile_platform_counters_task.run",
+            description="platform counters reconciliation",
+            enabled=ENABLE_SCHEDULED_RECONCILE_PLATFORM_COUNTERS,
+            cron_string=SCHEDULED_RECONCILE_PLATFORM_COUNTERS_CRON,
+        )
+
+    async def run(self):
+        if not ENABLE_SCHEDULED_RECONCILE_PLATFORM_COUNTERS:
+            log.info(
+                "Scheduled platform counters reconciliation not enabled, unscheduling..."
+            )
+            self.unschedule()
+            return
+
+        log.info("Scheduled platform counters reconciliation started...")
+        db_platform_handler.reconcile_platform_counters()
+        # Also corrects any drift of the cached stats
+        stats_handler.refresh()
+        log.info("Scheduled platform counters reconciliation done")
+
+
+reconcile_platform_counters_task = ReconcilePlatformCountersTask()
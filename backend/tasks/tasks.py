@@ -1,15 +1,18 @@
+import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Final
 
 import httpx
 from exceptions.task_exceptions import SchedulerException
-from handler.redis_handler import low_prio_queue
+from handler.redis_handler import async_cache, low_prio_queue
 from logger.logger import log
 from rq_scheduler import Scheduler
 from utils.context import ctx_httpx_client
 
 tasks_scheduler = Scheduler(queue=low_prio_queue, connection=low_prio_queue.connection)
 
+REMOTE_FILE_VALIDATORS_KEY: Final = "romm:remote_file_validators"
+
 
 class PeriodicTask(ABC):
     def __init__(
@@ -76,20 +79,69 @@ class RemoteFilePullTask(PeriodicTask):
         super().__init__(*args, **kwargs)
         self.url = url
 
-    async def run(self, force: bool = False) -> bytes | None:
+    async def _get_conditional_headers(self) -> dict[str, str]:
+        validators = await async_cache.hget(REMOTE_FILE_VALIDATORS_KEY, self.url)
+        if not validators:
+            return {}
+
+        validators = json.loads(validators)
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    async def _store_validators(self, response: httpx.Response) -> None:
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if any(validators.values()):
+            await async_cache.hset(
+                REMOTE_FILE_VALIDATORS_KEY, self.url, json.dumps(validators)
+            )
+        else:
+            await async_cache.hdel(REMOTE_FILE_VALIDATORS_KEY, self.url)
+
+    @abstractmethod
+    async def process_response(self, response: httpx.Response) -> None:
+        """Consume the streamed response of an updated remote file."""
+
+    async def run(self, force: bool = False) -> bool:
+        """Pull the remote file, skipping it if it hasn't changed since the last run.
+
+        Args:
+            force (bool, optional): Run even if the task is disabled, and download the file unconditionally. Defaults to False.
+
+        Returns:
+            bool: Whether the remote file was downloaded and processed
+        """
         if not self.enabled and not force:
             log.info(f"Scheduled {self.description} not enabled, unscheduling...")
             self.unschedule()
-            return None
+            return False
 
         log.info(f"Scheduled {self.description} started...")
 
+        headers = {} if force else await self._get_conditional_headers()
         httpx_client = ctx_httpx_client.get()
         try:
-            response = await httpx_client.get(self.url, timeout=120)
-            response.raise_for_status()
-            return response.content
-        except httpx.HTTPError as e:
+            async with httpx_client.stream(
+                "GET", self.url, headers=headers, timeout=120
+            ) as response:
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    log.info(
+                        f"Scheduled {self.description} skipped, remote file is unchanged"
+                    )
+                    return False
+
+                response.raise_for_status()
+                await self.process_response(response)
+        except (httpx.HTTPError, ValueError) as e:
             log.error(f"Scheduled {self.description} failed", exc_info=True)
             log.error(e)
-            return None
+            return False
+
+        await self._store_validators(response)
+        return True
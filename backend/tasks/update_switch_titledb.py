@@ -1,19 +1,39 @@
 import json
-from itertools import batched
 from typing import Final
 
+import httpx
 from config import (
     ENABLE_SCHEDULED_UPDATE_SWITCH_TITLEDB,
     SCHEDULED_UPDATE_SWITCH_TITLEDB_CRON,
 )
+from handler.library_handler import library_handler
 from handler.redis_handler import async_cache
 from logger.logger import log
 from tasks.tasks import RemoteFilePullTask
 from utils.context import initialize_context
+from utils.json_stream import iter_json_object_items
 
 SWITCH_TITLEDB_INDEX_KEY: Final = "romm:switch_titledb"
+# Maps each productID to its key in the titleDB index
 SWITCH_PRODUCT_ID_KEY: Final = "romm:switch_product_id"
 
+# Only the fields used by the metadata handlers and the Tinfoil feed are stored
+SWITCH_TITLEDB_FIELDS: Final = (
+    "id",
+    "name",
+    "description",
+    "iconUrl",
+    "screenshots",
+    "nsuId",
+    "size",
+    "version",
+    "region",
+    "releaseDate",
+    "rating",
+    "publisher",
+)
+SWITCH_TITLEDB_BATCH_SIZE: Final = 2000
+
 
 class UpdateSwitchTitleDBTask(RemoteFilePullTask):
     def __init__(self):
@@ -25,30 +45,68 @@ class UpdateSwitchTitleDBTask(RemoteFilePullTask):
             url="https://raw.githubusercontent.com/blawar/titledb/master/US.en.json",
         )
 
-    @initialize_context()
-    async def run(self, force: bool = False) -> None:
-        content = await super().run(force)
-        if content is None:
-            return
+    async def process_response(self, response: httpx.Response) -> None:
+        # Build the new indexes under temporary keys, and swap them at the end
+        # so lookups never see a partially updated index
+        titledb_tmp_key = f"{SWITCH_TITLEDB_INDEX_KEY}:tmp"
+        product_id_tmp_key = f"{SWITCH_PRODUCT_ID_KEY}:tmp"
+        await async_cache.delete(titledb_tmp_key, product_id_tmp_key)
 
-        index_json = json.loads(content)
-        relevant_data = {k: v for k, v in index_json.items() if k and v}
+        titledb_map: dict[str, str] = {}
+        product_map: dict[str, str] = {}
+        total_entries = 0
+        total_product_ids = 0
 
-        async with async_cache.pipeline() as pipe:
-            for data_batch in batched(relevant_data.items(), 2000):
-                titledb_map = {k: json.dumps(v) for k, v in dict(data_batch).items()}
-                await pipe.hset(SWITCH_TITLEDB_INDEX_KEY, mapping=titledb_map)
-            for data_batch in batched(relevant_data.items(), 2000):
-                product_map = {
-                    v["id"]: json.dumps(v)
-                    for v in dict(data_batch).values()
-                    if v.get("id")
-                }
+        async def flush() -> None:
+            async with async_cache.pipeline() as pipe:
+                if titledb_map:
+                    await pipe.hset(titledb_tmp_key, mapping=titledb_map)
                 if product_map:
-                    await pipe.hset(SWITCH_PRODUCT_ID_KEY, mapping=product_map)
+                    await pipe.hset(product_id_tmp_key, mapping=product_map)
+                await pipe.execute()
+            titledb_map.clear()
+            product_map.clear()
+
+        async for key, entry in iter_json_object_items(response.aiter_text()):
+            if not key or not entry:
+                continue
+
+            titledb_map[key] = json.dumps(
+                {field: entry.get(field) for field in SWITCH_TITLEDB_FIELDS},
+                separators=(",", ":"),
+            )
+            if entry.get("id"):
+                product_map[entry["id"]] = key
+                total_product_ids += 1
+
+            total_entries += 1
+            if len(titledb_map) >= SWITCH_TITLEDB_BATCH_SIZE:
+                await flush()
+
+        await flush()
+
+        if not total_entries:
+            raise ValueError("Switch titledb is empty, keeping the current index")
+
+        async with async_cache.pipeline() as pipe:
+            await pipe.rename(titledb_tmp_key, SWITCH_TITLEDB_INDEX_KEY)
+            if total_product_ids:
+                await pipe.rename(product_id_tmp_key, SWITCH_PRODUCT_ID_KEY)
+            else:
+                await pipe.delete(SWITCH_PRODUCT_ID_KEY)
             await pipe.execute()
+        # The tinfoil feed is rendered from the titledb
+        await library_handler.bump_version_async()
+
+        log.info(f"Indexed {total_entries} switch titledb entries")
+
+    @initialize_context()
+    async def run(self, force: bool = False) -> bool:
+        updated = await super().run(force)
+        if updated:
+            log.info("Scheduled switch titledb update completed!")
 
-        log.info("Scheduled switch titledb update completed!")
+        return updated
 
 
 update_switch_titledb_task = UpdateSwitchTitleDBTask()
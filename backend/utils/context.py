@@ -5,6 +5,7 @@ from typing import TypeVar
 
 import httpx
 from fastapi import Request, Response
+from utils.http_client import http_client_manager
 
 _T = TypeVar("_T")
 
@@ -24,7 +25,7 @@ async def set_context_var(
 @asynccontextmanager
 async def initialize_context() -> AsyncGenerator[None, None]:
     """Initialize context variables."""
-    async with httpx.AsyncClient() as httpx_client:
+    async with http_client_manager.client() as httpx_client:
         async with set_context_var(ctx_httpx_client, httpx_client):
             yield
 
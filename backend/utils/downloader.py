@@ -0,0 +1,128 @@
+import asyncio
+import os
+import random
+import uuid
+from dataclasses import dataclass
+from typing import Final
+from weakref import WeakKeyDictionary
+
+import httpx
+from anyio import Path, open_file
+from logger.logger import log
+from utils.context import ctx_httpx_client
+
+DOWNLOAD_MAX_CONCURRENCY_PER_HOST: Final = 6
+DOWNLOAD_MAX_ATTEMPTS: Final = 3
+DOWNLOAD_BACKOFF_SECONDS: Final = 0.5
+DOWNLOAD_TIMEOUT: Final = 120
+
+RETRYABLE_STATUS_CODES: Final = frozenset(
+    {
+        httpx.codes.TOO_MANY_REQUESTS,
+        httpx.codes.INTERNAL_SERVER_ERROR,
+        httpx.codes.BAD_GATEWAY,
+        httpx.codes.SERVICE_UNAVAILABLE,
+        httpx.codes.GATEWAY_TIMEOUT,
+    }
+)
+
+
+class _RetryableStatusError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    # False when the remote file matched the conditional request headers,
+    # in which case nothing was written
+    modified: bool
+    headers: httpx.Headers
+
+
+class Downloader:
+    """Downloads remote files to disk, concurrently and with retries.
+
+    Concurrent downloads are bounded per host, and each file is streamed to a
+    temporary file that is atomically renamed once complete, so readers never
+    see partially written files.
+    """
+
+    def __init__(
+        self, max_concurrency_per_host: int = DOWNLOAD_MAX_CONCURRENCY_PER_HOST
+    ):
+        self.max_concurrency_per_host = max_concurrency_per_host
+        # Semaphores are bound to the event loop they are used in
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = WeakKeyDictionary()
+
+    def _get_semaphore(self, host: str) -> asyncio.Semaphore:
+        loop_semaphores = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        if host not in loop_semaphores:
+            loop_semaphores[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+        return loop_semaphores[host]
+
+    @staticmethod
+    async def _stream_to_file(
+        url: str, file_path: str, headers: dict[str, str]
+    ) -> DownloadResult | None:
+        httpx_client = ctx_httpx_client.get()
+        tmp_path = Path(f"{file_path}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with httpx_client.stream(
+                "GET", url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                if response.status_code in RETRYABLE_STATUS_CODES:
+                    raise _RetryableStatusError(f"HTTP {response.status_code}")
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return DownloadResult(modified=False, headers=response.headers)
+                if response.status_code != httpx.codes.OK:
+                    return None
+
+                await Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+                async with await open_file(tmp_path, "wb") as f:
+                    async for chunk in response.aiter_raw():
+                        await f.write(chunk)
+
+            os.replace(tmp_path, file_path)
+            return DownloadResult(modified=True, headers=response.headers)
+        finally:
+            await tmp_path.unlink(missing_ok=True)
+
+    async def download(
+        self, url: str, file_path: str, headers: dict[str, str] | None = None
+    ) -> DownloadResult | None:
+        """Download a remote file, retrying transient failures with jittered backoff
+
+        Args:
+            url: url of the remote file
+            file_path: where to store the file
+            headers: extra request headers, e.g. conditional request headers
+
+        Returns:
+            DownloadResult | None: Result of the download, or None if it failed
+
+        Raises:
+            httpx.NetworkError: The host couldn't be reached after all the attempts
+        """
+        async with self._get_semaphore(httpx.URL(url).host):
+            for attempt in range(1, DOWNLOAD_MAX_ATTEMPTS + 1):
+                try:
+                    return await self._stream_to_file(url, file_path, headers or {})
+                except (
+                    httpx.TransportError,
+                    _RetryableStatusError,
+                ) as exc:
+                    if attempt == DOWNLOAD_MAX_ATTEMPTS:
+                        if isinstance(exc, httpx.NetworkError):
+                            raise
+                        log.warning(f"Failure downloading {url} to file ({exc!r})")
+                        return None
+
+                    backoff = DOWNLOAD_BACKOFF_SECONDS * 2 ** (attempt - 1)
+                    await asyncio.sleep(backoff + random.uniform(0, backoff))
+
+        return None
+
+
+downloader = Downloader()
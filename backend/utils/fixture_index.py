@@ -0,0 +1,195 @@
+# python3 -m utils.fixture_index handler/metadata/fixtures models/fixtures
+"""Compact, read-only indexes for the JSON fixtures.
+
+Each `<name>.json` fixture (a JSON object) is compiled at build time into a
+`<name>.idx` file next to it, with the following layout:
+
+    header:  magic (4 bytes) | version (uint32) | entries count (uint32)
+    offsets: one uint32 per entry, pointing to its record, sorted by key
+    records: key length (uint16) | key | value length (uint32) | value (JSON)
+
+The index file is memory-mapped on first lookup, so processes don't pay for
+parsing fixtures they never use, and lookups are a binary search over the keys.
+This module only depends on the standard library, so it can run at build time.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from collections.abc import Iterable
+from typing import Any, Final
+
+INDEX_MAGIC: Final = b"RIDX"
+INDEX_VERSION: Final = 1
+INDEX_EXTENSION: Final = ".idx"
+
+_HEADER = struct.Struct("<4sII")
+_OFFSET = struct.Struct("<I")
+_KEY_LENGTH = struct.Struct("<H")
+_VALUE_LENGTH = struct.Struct("<I")
+
+
+def get_index_path(fixture_path: str) -> str:
+    return f"{os.path.splitext(fixture_path)[0]}{INDEX_EXTENSION}"
+
+
+def build_index(fixture_path: str, index_path: str | None = None) -> int:
+    """Compile a JSON fixture into a compact index file
+
+    Args:
+        fixture_path (str): Path to the JSON fixture
+        index_path (str, optional): Path to the index file. Defaults to the fixture path with the .idx extension.
+
+    Returns:
+        int: Number of entries in the index
+    """
+
+    index_path = index_path or get_index_path(fixture_path)
+    with open(fixture_path, "rb") as f:
+        data: dict[str, Any] = json.load(f)
+
+    records = sorted(
+        (
+            key.encode(),
+            json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode(),
+        )
+        for key, value in data.items()
+        if key
+    )
+
+    offsets: list[int] = []
+    position = _HEADER.size + _OFFSET.size * len(records)
+    for key, value in records:
+        offsets.append(position)
+        position += _KEY_LENGTH.size + len(key) + _VALUE_LENGTH.size + len(value)
+
+    # Write to a temporary file first, so readers never see a partial index
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(records)))
+        for offset in offsets:
+            f.write(_OFFSET.pack(offset))
+        for key, value in records:
+            f.write(_KEY_LENGTH.pack(len(key)))
+            f.write(key)
+            f.write(_VALUE_LENGTH.pack(len(value)))
+            f.write(value)
+    os.replace(tmp_path, index_path)
+
+    return len(records)
+
+
+class FixtureIndex:
+    """Lazy, read-only mapping over a JSON fixture
+
+    Uses the compiled index when it's available and up to date, and falls back
+    to loading the JSON fixture in memory otherwise (e.g. in development).
+    """
+
+    def __init__(self, fixture_path: str) -> None:
+        self.fixture_path = fixture_path
+        self.index_path = get_index_path(fixture_path)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._mmap: mmap.mmap | None = None
+        self._count = 0
+        self._data: dict[str, Any] = {}
+
+    def _is_index_current(self) -> bool:
+        if not os.path.exists(self.index_path):
+            return False
+        if not os.path.exists(self.fixture_path):
+            return True
+        return os.path.getmtime(self.index_path) >= os.path.getmtime(self.fixture_path)
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+
+            if self._is_index_current():
+                with open(self.index_path, "rb") as f:
+                    index_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, version, count = _HEADER.unpack_from(index_mmap, 0)
+                if magic == INDEX_MAGIC and version == INDEX_VERSION:
+                    self._mmap = index_mmap
+                    self._count = count
+                    self._loaded = True
+                    return
+                index_mmap.close()
+
+            if os.path.exists(self.fixture_path):
+                with open(self.fixture_path, "rb") as f:
+                    self._data = json.load(f)
+
+            self._loaded = True
+
+    def _key_at(self, position: int) -> tuple[bytes, int]:
+        assert self._mmap is not None
+        (offset,) = _OFFSET.unpack_from(
+            self._mmap, _HEADER.size + _OFFSET.size * position
+        )
+        (key_length,) = _KEY_LENGTH.unpack_from(self._mmap, offset)
+        key_start = offset + _KEY_LENGTH.size
+        return self._mmap[key_start : key_start + key_length], key_start + key_length
+
+    def _lookup(self, key: str) -> Any | None:
+        assert self._mmap is not None
+        encoded_key = key.encode()
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            middle_key, value_offset = self._key_at(middle)
+            if middle_key < encoded_key:
+                low = middle + 1
+            elif middle_key > encoded_key:
+                high = middle
+            else:
+                (value_length,) = _VALUE_LENGTH.unpack_from(self._mmap, value_offset)
+                value_start = value_offset + _VALUE_LENGTH.size
+                return json.loads(self._mmap[value_start : value_start + value_length])
+
+        return None
+
+    def get(self, key: str) -> Any | None:
+        """Get the entry for a key, or None if it's not in the index"""
+        if not self._loaded:
+            self._load()
+
+        if self._mmap is None:
+            return self._data.get(key)
+
+        return self._lookup(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the entries for several keys, skipping the ones not in the index"""
+        entries = {}
+        for key in set(keys):
+            entry = self.get(key)
+            if entry is not None:
+                entries[key] = entry
+
+        return entries
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        if not self._loaded:
+            self._load()
+
+        return self._count if self._mmap is not None else len(self._data)
+
+
+if __name__ == "__main__":
+    for fixtures_dir in sys.argv[1:]:
+        for file_name in sorted(os.listdir(fixtures_dir)):
+            if not file_name.endswith(".json"):
+                continue
+
+            fixture_path = os.path.join(fixtures_dir, file_name)
+            count = build_index(fixture_path)
+            print(f"Built {get_index_path(fixture_path)} ({count} entries)")
@@ -0,0 +1,218 @@
+import asyncio
+import importlib.util
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Final
+
+import httpx
+from config import (
+    HTTP_ENABLE_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+from httpx._utils import get_environment_proxies
+from logger.logger import log
+
+# How often the metrics of long-lived clients are logged, in seconds
+HTTP_METRICS_LOG_INTERVAL: Final = 15 * 60
+
+
+@dataclass
+class HTTPClientMetrics:
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    tls_handshakes: int = 0
+    pool_waits: int = 0
+    pool_wait_seconds: float = 0.0
+
+
+class _ReleasingByteStream(httpx.AsyncByteStream):
+    """Response stream that frees its host slot once the response is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport limiting concurrent connections per host and recording metrics."""
+
+    # Time spent waiting before this is considered a pool wait, in seconds
+    POOL_WAIT_THRESHOLD = 0.005
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        max_connections_per_host: int,
+        metrics: HTTPClientMetrics,
+    ):
+        self._transport = transport
+        self._max_connections_per_host = max_connections_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.perf_counter()
+        connection_state: dict[str, Any] = {"new": False, "waited": None}
+        parent_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.started":
+                connection_state["new"] = True
+            elif event_name == "connection.start_tls.complete":
+                self._metrics.tls_handshakes += 1
+
+            # The request got a connection from the pool, either a new or a reused one
+            if connection_state["waited"] is None and event_name in (
+                "connection.connect_tcp.started",
+                "http11.send_request_headers.started",
+                "http2.send_request_headers.started",
+            ):
+                connection_state["waited"] = time.perf_counter() - started_at
+
+            if parent_trace:
+                await parent_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+
+        semaphore = self._host_semaphores.setdefault(
+            request.url.host, asyncio.Semaphore(self._max_connections_per_host)
+        )
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        self._metrics.requests += 1
+        if connection_state["new"]:
+            self._metrics.new_connections += 1
+        else:
+            self._metrics.reused_connections += 1
+
+        waited = connection_state["waited"] or 0.0
+        if waited > self.POOL_WAIT_THRESHOLD:
+            self._metrics.pool_waits += 1
+            self._metrics.pool_wait_seconds += waited
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingByteStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@dataclass
+class _LoopClient:
+    client: httpx.AsyncClient
+    references: int = 0
+    metrics_logger: asyncio.Task | None = field(default=None, repr=False)
+
+
+class HTTPClientManager:
+    """Shares a tuned `httpx.AsyncClient` between every user of an event loop.
+
+    Clients are bound to the event loop they are created in, so one client is kept
+    per loop, and it's closed when its last user releases it. Long-lived processes
+    (e.g. the web server, through its lifespan) keep a reference for their whole
+    lifetime, so connections and TLS sessions are reused across requests, scans
+    and tasks.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[asyncio.AbstractEventLoop, _LoopClient] = {}
+        self.metrics = HTTPClientMetrics()
+        self.http2 = HTTP_ENABLE_HTTP2 and self._is_http2_available()
+
+    @staticmethod
+    def _is_http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            log.warning(
+                "HTTP/2 is enabled but the 'h2' package is not installed, using HTTP/1.1"
+            )
+            return False
+
+        return True
+
+    def _create_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        )
+
+        def create_transport(proxy: str | None = None) -> _InstrumentedTransport:
+            return _InstrumentedTransport(
+                httpx.AsyncHTTPTransport(limits=limits, http2=self.http2, proxy=proxy),
+                max_connections_per_host=HTTP_MAX_CONNECTIONS_PER_HOST,
+                metrics=self.metrics,
+            )
+
+        # httpx ignores the proxy environment variables (HTTP_PROXY, HTTPS_PROXY,
+        # ALL_PROXY and NO_PROXY) when given a transport, so they're mounted here
+        # the same way httpx does it
+        mounts: dict[str, httpx.AsyncBaseTransport | None] = {
+            pattern: create_transport(proxy) if proxy else None
+            for pattern, proxy in get_environment_proxies().items()
+        }
+        return httpx.AsyncClient(transport=create_transport(), mounts=mounts)
+
+    def _log_metrics(self) -> None:
+        log.info(f"HTTP client metrics: {asdict(self.metrics)}")
+
+    async def _log_metrics_periodically(self) -> None:
+        logged_requests = self.metrics.requests
+        while True:
+            await asyncio.sleep(HTTP_METRICS_LOG_INTERVAL)
+            if self.metrics.requests != logged_requests:
+                logged_requests = self.metrics.requests
+                self._log_metrics()
+
+    @asynccontextmanager
+    async def client(self) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """Get the shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        loop_client = self._clients.get(loop)
+        if loop_client is None:
+            loop_client = self._clients[loop] = _LoopClient(
+                self._create_client(),
+                # Long-lived clients, e.g. the web server's, are only closed on
+                # shutdown, so their metrics are logged along the way
+                metrics_logger=loop.create_task(self._log_metrics_periodically()),
+            )
+
+        loop_client.references += 1
+        try:
+            yield loop_client.client
+        finally:
+            loop_client.references -= 1
+            if loop_client.references == 0:
+                del self._clients[loop]
+                if loop_client.metrics_logger:
+                    loop_client.metrics_logger.cancel()
+                await loop_client.client.aclose()
+                if self.metrics.requests:
+                    self._log_metrics()
+
+
+http_client_manager = HTTPClientManager()
@@ -0,0 +1,108 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterable
+from typing import Any
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+async def iter_json_object_items(
+    chunks: AsyncIterable[str],
+) -> AsyncGenerator[tuple[str, Any], None]:
+    """Incrementally parse the items of a top-level JSON object.
+
+    Only the item being parsed is kept in memory, so large documents can be
+    processed while they are being downloaded.
+
+    Args:
+        chunks: Text chunks of the JSON document
+
+    Yields:
+        tuple[str, Any]: Key and decoded value of each item in the object
+    """
+    iterator = aiter(chunks)
+    buffer = ""
+    position = 0
+    exhausted = False
+    started = False
+
+    async def read_more() -> bool:
+        nonlocal buffer, position, exhausted
+        if exhausted:
+            return False
+        try:
+            chunk = await anext(iterator)
+        except StopAsyncIteration:
+            exhausted = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def decode(start: int) -> tuple[Any, int] | None:
+        # A value ending right at the end of the buffer might be truncated
+        # (e.g. a number), unless there is nothing left to read
+        try:
+            value, end = _decoder.raw_decode(buffer, start)
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            return None
+        if end == len(buffer) and not exhausted:
+            return None
+        return value, end
+
+    while True:
+        position = _skip_whitespace(buffer, position)
+        if position >= len(buffer):
+            if not await read_more():
+                if not started:
+                    raise ValueError("Expected a JSON object, got an empty document")
+                raise ValueError("Unexpected end of the JSON document")
+            continue
+
+        char = buffer[position]
+        if not started:
+            if char != "{":
+                raise ValueError("Expected a JSON object")
+            started = True
+            position += 1
+            continue
+
+        if char == "}":
+            return
+        if char == ",":
+            position += 1
+            continue
+
+        key_decoded = decode(position)
+        if key_decoded is None:
+            await read_more()
+            continue
+        key, key_end = key_decoded
+        if not isinstance(key, str):
+            raise ValueError(f"Expected a string key, got {key!r}")
+
+        colon = _skip_whitespace(buffer, key_end)
+        if colon >= len(buffer):
+            if not await read_more():
+                raise ValueError(f"Unexpected end of the JSON document at key {key!r}")
+            continue
+        if buffer[colon] != ":":
+            raise ValueError(f"Expected ':' after key {key!r}")
+
+        value_start = _skip_whitespace(buffer, colon + 1)
+        value_decoded = decode(value_start) if value_start < len(buffer) else None
+        if value_decoded is None:
+            if not await read_more():
+                raise ValueError(f"Unexpected end of the JSON document at key {key!r}")
+            continue
+        value, position = value_decoded
+
+        yield key, value
@@ -0,0 +1,130 @@
+import hashlib
+from typing import Final
+
+from handler.library_handler import library_handler
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from utils import get_version
+
+# List endpoints whose responses only change along the library version
+CACHED_PATHS: Final = frozenset(
+    {
+        "/api/collections",
+        "/api/platforms",
+        "/api/roms",
+        "/api/tinfoil/feed",
+        "/api/webrcade/feed",
+    }
+)
+# Headers not replayed from cached responses, as they depend on the request
+UNCACHED_HEADERS: Final = frozenset({b"set-cookie", b"etag"})
+
+
+class ResponseCacheMiddleware:
+    """Serve repeated requests to the library list endpoints without querying
+    the database.
+
+    Responses carry an ETag derived from the library and app versions, so
+    clients with an up to date copy get a 304. Otherwise the rendered response
+    is cached per user, scopes, origin and query, until the next library write
+    or app upgrade.
+
+    Must run after the authentication middleware, which sets the user.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    @staticmethod
+    def _get_cache_key(scope: Scope) -> str:
+        user = scope.get("user")
+        auth = scope.get("auth")
+        key = "\n".join(
+            (
+                # Responses rendered by another release may have another shape
+                get_version(),
+                str(getattr(user, "id", None)),
+                " ".join(sorted(getattr(auth, "scopes", []))),
+                # Feeds render absolute URLs, built from the requested origin
+                scope["scheme"],
+                Headers(scope=scope).get("host", ""),
+                scope["path"],
+                scope["query_string"].decode("latin-1"),
+            )
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] not in CACHED_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        version = await library_handler.get_version_async()
+        key = self._get_cache_key(scope)
+        etag = f'W/"{version}-{key[:16]}"'
+        cache_headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Authorization, Cookie",
+        }
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (name.lower().encode("latin-1"), value.encode("latin-1"))
+                        for name, value in cache_headers.items()
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cache_key = f"{version}:{key}"
+        cached = await library_handler.get_cached_response(cache_key)
+        if cached:
+            headers, body = cached
+            response_headers = MutableHeaders(raw=headers)
+            response_headers.update(cache_headers)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": response_headers.raw,
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers: list[tuple[bytes, bytes]] = []
+        body_chunks: list[bytes] = []
+        is_cacheable = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal headers, is_cacheable
+            if message["type"] == "http.response.start":
+                is_cacheable = message["status"] == 200
+                if is_cacheable:
+                    headers = [
+                        (name, value)
+                        for name, value in message["headers"]
+                        if name.lower() not in UNCACHED_HEADERS
+                    ]
+                    MutableHeaders(scope=message).update(cache_headers)
+            elif message["type"] == "http.response.body" and is_cacheable:
+                body_chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await library_handler.cache_response(
+                        cache_key, headers, b"".join(body_chunks)
+                    )
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,116 @@
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Final
+
+# Words shorter than this aren't indexed by InnoDB (innodb_ft_min_token_size)
+FULLTEXT_MIN_TOKEN_SIZE: Final = 3
+# Default InnoDB stopwords, which aren't indexed either
+FULLTEXT_STOPWORDS: Final = frozenset(
+    {
+        "a",
+        "about",
+        "an",
+        "are",
+        "as",
+        "at",
+        "be",
+        "by",
+        "com",
+        "de",
+        "en",
+        "for",
+        "from",
+        "how",
+        "i",
+        "in",
+        "is",
+        "it",
+        "la",
+        "of",
+        "on",
+        "or",
+        "that",
+        "the",
+        "this",
+        "to",
+        "was",
+        "what",
+        "when",
+        "where",
+        "who",
+        "will",
+        "with",
+        "und",
+        "www",
+    }
+)
+
+# Typos are looked for among the words sharing the first letters of a term
+TYPO_CANDIDATES_LIMIT: Final = 200
+TYPO_MIN_SIMILARITY: Final = 0.75
+
+# Underscores separate words, as they do in file names
+_WORD_PATTERN: Final = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _WORD_PATTERN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class SearchTerms:
+    # Terms that can be looked up in the FULLTEXT index
+    indexed: list[str]
+    # Terms the FULLTEXT index ignores, which have to be matched as substrings
+    unindexed: list[str]
+
+
+def parse_search_term(search_term: str) -> SearchTerms:
+    indexed: list[str] = []
+    unindexed: list[str] = []
+    for token in dict.fromkeys(tokenize(search_term)):
+        if len(token) < FULLTEXT_MIN_TOKEN_SIZE or token in FULLTEXT_STOPWORDS:
+            unindexed.append(token)
+        else:
+            indexed.append(token)
+
+    return SearchTerms(indexed=indexed, unindexed=unindexed)
+
+
+def to_boolean_query(terms: list[str], required: bool = True) -> str:
+    """Build a FULLTEXT boolean mode query matching words starting with the terms
+
+    Args:
+        terms: Search terms, as returned by `tokenize`
+        required: Whether every term must match, instead of any of them
+
+    Returns:
+        str: Boolean mode query
+    """
+    operator = "+" if required else ""
+    return " ".join(f"{operator}{term}*" for term in terms)
+
+
+def get_typo_prefixes(terms: list[str]) -> list[str]:
+    return list(dict.fromkeys(term[:FULLTEXT_MIN_TOKEN_SIZE] for term in terms))
+
+
+def get_similarity(terms: list[str], text: str) -> float:
+    """Score how closely the words of a text match the search terms
+
+    Args:
+        terms: Search terms, as returned by `tokenize`
+        text: Text to score, e.g. a rom name
+
+    Returns:
+        float: Average similarity of each term to its closest word, from 0 to 1
+    """
+    words = tokenize(text)
+    if not terms or not words:
+        return 0.0
+
+    return sum(
+        max(SequenceMatcher(None, term, word).ratio() for word in words)
+        for term in terms
+    ) / len(terms)
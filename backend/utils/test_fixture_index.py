@@ -0,0 +1,37 @@
+import json
+
+from utils.fixture_index import FixtureIndex, build_index
+
+
+def test_fixture_index(tmp_path):
+    fixture_path = tmp_path / "index.json"
+    fixture_data = {
+        "SLUS-01272": {"title": "007 - THE WORLD IS NOT ENOUGH"},
+        "SCES-00001": {"title": "Ridge Racer"},
+        "SLPS-00002": {"title": "プレイステーション"},
+    }
+    fixture_path.write_text(json.dumps(fixture_data))
+
+    # Falls back to the JSON fixture when the index hasn't been built
+    fallback_index = FixtureIndex(str(fixture_path))
+    assert fallback_index.get("SCES-00001") == {"title": "Ridge Racer"}
+    assert len(fallback_index) == 3
+
+    assert build_index(str(fixture_path)) == 3
+    assert (tmp_path / "index.idx").exists()
+
+    index = FixtureIndex(str(fixture_path))
+    for key, value in fixture_data.items():
+        assert index.get(key) == value
+    assert index.get("SLUS-99999") is None
+    assert "SLPS-00002" in index
+    assert len(index) == 3
+    assert index.get_many(["SCES-00001", "SLUS-99999"]) == {
+        "SCES-00001": {"title": "Ridge Racer"}
+    }
+
+
+def test_fixture_index_missing_fixture(tmp_path):
+    index = FixtureIndex(str(tmp_path / "missing.json"))
+    assert index.get("SLUS-01272") is None
+    assert len(index) == 0
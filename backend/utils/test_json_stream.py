@@ -0,0 +1,39 @@
+import asyncio
+import json
+
+import pytest
+from utils.json_stream import iter_json_object_items
+
+
+async def _chunks(text: str, size: int):
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+def _parse(text: str, size: int) -> list:
+    async def collect():
+        return [item async for item in iter_json_object_items(_chunks(text, size))]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+def test_iter_json_object_items(chunk_size):
+    data = {
+        "70010000000025": {"id": "0100000000010000", "name": "Súper Mario"},
+        "70010000000026": {"name": "Zelda", "screenshots": ["a", "b"], "size": 12},
+        "count": 1234567,
+        "empty": None,
+        "": {},
+    }
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+
+    assert _parse(text, chunk_size) == list(data.items())
+
+
+def test_iter_json_object_items_invalid():
+    with pytest.raises(ValueError):
+        _parse("[1, 2, 3]", 4)
+
+    with pytest.raises(ValueError):
+        _parse('{"a": {"b": 1}', 4)
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+from handler.library_handler import LIBRARY_VERSION_KEY
+from handler.redis_handler import async_cache
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from utils.response_cache import ResponseCacheMiddleware
+
+calls = 0
+
+
+def get_roms(request):
+    global calls
+    calls += 1
+    return JSONResponse([{"id": calls}], headers={"X-Next-Cursor": "next"})
+
+
+app = Starlette(routes=[Route("/api/roms", get_roms), Route("/api/other", get_roms)])
+app.add_middleware(ResponseCacheMiddleware)
+
+
+def test_response_cache():
+    with TestClient(app) as client:
+
+        response = client.get("/api/roms?limit=1")
+        assert response.json() == [{"id": 1}]
+        etag = response.headers["ETag"]
+
+        # Served from the cache
+        response = client.get("/api/roms?limit=1")
+        assert response.json() == [{"id": 1}]
+        assert response.headers["ETag"] == etag
+        assert response.headers["X-Next-Cursor"] == "next"
+
+        response = client.get("/api/roms?limit=1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert not response.content
+
+        # Other queries, origins and paths aren't served from the same cache
+        assert client.get("/api/roms?limit=2").json() == [{"id": 2}]
+        response = client.get(
+            "/api/roms?limit=1",
+            headers={"Host": "romm.example.com", "If-None-Match": etag},
+        )
+        assert response.json() == [{"id": 3}]
+        assert "ETag" not in client.get("/api/other").headers
+
+        # Library writes invalidate the cached responses
+        client.portal.call(async_cache.incr, LIBRARY_VERSION_KEY)
+        response = client.get("/api/roms?limit=1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == [{"id": 5}]
+        assert response.headers["ETag"] != etag
+        etag = response.headers["ETag"]
+
+        # Upgrading the app invalidates them too
+        with patch("utils.response_cache.get_version", return_value="9.9.9"):
+            response = client.get("/api/roms?limit=1", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json() == [{"id": 6}]
+        assert response.headers["ETag"] != etag
@@ -0,0 +1,35 @@
+from utils.search import (
+    TYPO_MIN_SIMILARITY,
+    get_similarity,
+    get_typo_prefixes,
+    parse_search_term,
+    to_boolean_query,
+)
+
+
+def test_parse_search_term():
+    terms = parse_search_term("The Legend of Zelda: Ocarina of Time 3D (USA)")
+
+    assert terms.indexed == ["legend", "zelda", "ocarina", "time", "usa"]
+    assert terms.unindexed == ["the", "of", "3d"]
+
+    assert parse_search_term("+mario* -kart").indexed == ["mario", "kart"]
+    assert parse_search_term("!!!").indexed == []
+    assert parse_search_term("super_mario").indexed == ["super", "mario"]
+
+
+def test_to_boolean_query():
+    assert to_boolean_query(["super", "mari"]) == "+super* +mari*"
+    assert to_boolean_query(["super", "mari"], required=False) == "super* mari*"
+    assert get_typo_prefixes(["supre", "super", "mraio"]) == ["sup", "mra"]
+
+
+def test_get_similarity():
+    assert get_similarity(["mario"], "Super Mario World") == 1
+    assert get_similarity(["mario"], "Super_Mario_World.sfc") == 1
+    assert (
+        get_similarity(["mraio", "wolrd"], "Super Mario World") >= TYPO_MIN_SIMILARITY
+    )
+    assert get_similarity(["marioo"], "Super Mario World") >= TYPO_MIN_SIMILARITY
+    assert get_similarity(["zelda"], "Super Mario World") < TYPO_MIN_SIMILARITY
+    assert get_similarity(["mario"], "") == 0
@@ -14,6 +14,8 @@ export type { Body_update_collection_api_collections__id__put } from './models/B
 export type { Body_update_rom_api_roms__id__put } from './models/Body_update_rom_api_roms__id__put';
 export type { Body_update_user_api_users__id__put } from './models/Body_update_user_api_users__id__put';
 export type { CollectionSchema } from './models/CollectionSchema';
+export type { CoverAtlasSchema } from './models/CoverAtlasSchema';
+export type { CoverAtlasTile } from './models/CoverAtlasTile';
 export type { ConfigResponse } from './models/ConfigResponse';
 export type { DetailedRomSchema } from './models/DetailedRomSchema';
 export type { EmulationDict } from './models/EmulationDict';
@@ -28,11 +30,13 @@ export type { MessageResponse } from './models/MessageResponse';
 export type { MetadataSourcesDict } from './models/MetadataSourcesDict';
 export type { MobyMetadataPlatform } from './models/MobyMetadataPlatform';
 export type { PlatformSchema } from './models/PlatformSchema';
+export type { PlatformStatsReturn } from './models/PlatformStatsReturn';
 export type { Role } from './models/Role';
 export type { RomFile } from './models/RomFile';
 export type { RomIGDBMetadata } from './models/RomIGDBMetadata';
 export type { RomMobyMetadata } from './models/RomMobyMetadata';
 export type { RomSchema } from './models/RomSchema';
+export type { RomSuggestionSchema } from './models/RomSuggestionSchema';
 export type { RomUserSchema } from './models/RomUserSchema';
 export type { RomUserStatus } from './models/RomUserStatus';
 export type { SaveSchema } from './models/SaveSchema';
@@ -53,6 +57,7 @@ export type { UploadedScreenshotsResponse } from './models/UploadedScreenshotsRe
 export type { UploadedStatesResponse } from './models/UploadedStatesResponse';
 export type { UserNotesSchema } from './models/UserNotesSchema';
 export type { UserSchema } from './models/UserSchema';
+export type { UserStatsReturn } from './models/UserStatsReturn';
 export type { ValidationError } from './models/ValidationError';
 export type { WatcherDict } from './models/WatcherDict';
 export type { WebrcadeFeedCategorySchema } from './models/WebrcadeFeedCategorySchema';
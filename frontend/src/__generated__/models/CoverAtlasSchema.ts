@@ -0,0 +1,16 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+import type { CoverAtlasTile } from './CoverAtlasTile';
+
+export type CoverAtlasSchema = {
+    url: string;
+    width: number;
+    height: number;
+    tile_width: number;
+    tile_height: number;
+    tiles: Record<string, CoverAtlasTile>;
+};
+
@@ -44,6 +44,8 @@ export type DetailedRomSchema = {
     moby_metadata: (RomMobyMetadata | null);
     path_cover_s: (string | null);
     path_cover_l: (string | null);
+    cover_placeholder: (string | null);
+    cover_color: (string | null);
     has_cover: boolean;
     url_cover: (string | null);
     revision: (string | null);
@@ -56,6 +58,7 @@ export type DetailedRomSchema = {
     md5_hash: (string | null);
     sha1_hash: (string | null);
     full_path: string;
+    sort_comparator: string;
     created_at: string;
     updated_at: string;
     merged_screenshots: Array<string>;
@@ -66,6 +69,5 @@ export type DetailedRomSchema = {
     user_screenshots: Array<ScreenshotSchema>;
     user_notes: Array<UserNotesSchema>;
     user_collections: Array<CollectionSchema>;
-    readonly sort_comparator: string;
 };
 
@@ -11,6 +11,8 @@ export type PlatformSchema = {
     fs_slug: string;
     name: string;
     rom_count: number;
+    identified_rom_count: number;
+    total_file_size_bytes: number;
     igdb_id?: (number | null);
     sgdb_id?: (number | null);
     moby_id?: (number | null);
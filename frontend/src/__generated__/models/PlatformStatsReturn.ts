@@ -0,0 +1,12 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+export type PlatformStatsReturn = {
+    PLATFORM_ID: number;
+    ROMS: number;
+    IDENTIFIED_ROMS: number;
+    FILESIZE: number;
+};
+
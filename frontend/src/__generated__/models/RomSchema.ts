@@ -37,6 +37,8 @@ export type RomSchema = {
     moby_metadata: (RomMobyMetadata | null);
     path_cover_s: (string | null);
     path_cover_l: (string | null);
+    cover_placeholder: (string | null);
+    cover_color: (string | null);
     has_cover: boolean;
     url_cover: (string | null);
     revision: (string | null);
@@ -49,8 +51,8 @@ export type RomSchema = {
     md5_hash: (string | null);
     sha1_hash: (string | null);
     full_path: string;
+    sort_comparator: string;
     created_at: string;
     updated_at: string;
-    readonly sort_comparator: string;
 };
 
@@ -0,0 +1,15 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+export type RomSuggestionSchema = {
+    id: number;
+    name: (string | null);
+    file_name_no_tags: string;
+    platform_id: number;
+    platform_name: string;
+    path_cover_s: (string | null);
+    cover_placeholder: (string | null);
+};
+
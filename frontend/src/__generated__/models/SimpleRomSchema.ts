@@ -39,6 +39,8 @@ export type SimpleRomSchema = {
     moby_metadata: (RomMobyMetadata | null);
     path_cover_s: (string | null);
     path_cover_l: (string | null);
+    cover_placeholder: (string | null);
+    cover_color: (string | null);
     has_cover: boolean;
     url_cover: (string | null);
     revision: (string | null);
@@ -51,10 +53,10 @@ export type SimpleRomSchema = {
     md5_hash: (string | null);
     sha1_hash: (string | null);
     full_path: string;
+    sort_comparator: string;
     created_at: string;
     updated_at: string;
     sibling_roms: Array<RomSchema>;
     rom_user: RomUserSchema;
-    readonly sort_comparator: string;
 };
 
@@ -6,6 +6,7 @@
 export type StatsReturn = {
     PLATFORMS: number;
     ROMS: number;
+    IDENTIFIED_ROMS: number;
     SAVES: number;
     STATES: number;
     SCREENSHOTS: number;
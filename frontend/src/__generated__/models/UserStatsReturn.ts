@@ -0,0 +1,12 @@
+/* generated using openapi-typescript-codegen -- do no edit */
+/* istanbul ignore file */
+/* tslint:disable */
+/* eslint-disable */
+
+export type UserStatsReturn = {
+    USER_ID: number;
+    SAVES: number;
+    STATES: number;
+    SCREENSHOTS: number;
+};
+
@@ -1,6 +1,7 @@
 import type { MessageResponse } from "@/__generated__";
 import api from "@/services/api/index";
 import type { Collection } from "@/stores/collections";
+import type { SimpleRom } from "@/stores/roms";
 
 export type UpdatedCollection = Collection & {
   artwork?: File;
@@ -51,6 +52,30 @@ async function updateCollection({
   });
 }
 
+async function addRomsToCollection({
+  collection,
+  roms,
+}: {
+  collection: Collection;
+  roms: SimpleRom[];
+}): Promise<{ data: Collection }> {
+  return api.post(`/collections/${collection.id}/roms`, {
+    roms: roms.map((r) => r.id),
+  });
+}
+
+async function removeRomsFromCollection({
+  collection,
+  roms,
+}: {
+  collection: Collection;
+  roms: SimpleRom[];
+}): Promise<{ data: Collection }> {
+  return api.post(`/collections/${collection.id}/roms/delete`, {
+    roms: roms.map((r) => r.id),
+  });
+}
+
 async function deleteCollection({
   collection,
 }: {
@@ -64,5 +89,7 @@ export default {
   getCollections,
   getCollection,
   updateCollection,
+  addRomsToCollection,
+  removeRomsFromCollection,
   deleteCollection,
 };
@@ -1,6 +1,7 @@
 import type {
   MessageResponse,
   SearchRomSchema,
+  RomSuggestionSchema,
   RomUserSchema,
 } from "@/__generated__";
 import api from "@/services/api/index";
@@ -79,6 +80,24 @@ async function getRoms({
   });
 }
 
+async function autocompleteRoms({
+  searchTerm,
+  platformId = null,
+  limit = 10,
+}: {
+  searchTerm: string;
+  platformId?: number | null;
+  limit?: number;
+}): Promise<{ data: RomSuggestionSchema[] }> {
+  return api.get(`/roms/autocomplete`, {
+    params: {
+      search_term: searchTerm,
+      platform_id: platformId,
+      limit: limit,
+    },
+  });
+}
+
 async function getRecentRoms(): Promise<{ data: SimpleRom[] }> {
   return api.get("/roms", {
     params: { order_by: "id", order_dir: "desc", limit: 15 },
@@ -186,6 +205,7 @@ async function updateUserRomProps({
 export default {
   uploadRoms,
   getRoms,
+  autocompleteRoms,
   getRecentRoms,
   getRom,
   downloadRom,